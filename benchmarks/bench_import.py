@@ -0,0 +1,64 @@
+"""Measures the import time of pactsdk and fails if it exceeds the budget.
+
+Every measurement runs in a fresh interpreter. The reported time is the median of the runs. Dependencies imported for the first time by pactsdk (algosdk, requests etc.) are included.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/bench_import.py [--runs 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS: dict[str, tuple[str, float]] = {
+    # name: (code, budget in milliseconds)
+    "import pactsdk": ("import pactsdk", 20),
+    "PactClient": ("import pactsdk; pactsdk.PactClient", 400),
+    "farming": ("import pactsdk; pactsdk.PactFarmingClient", 500),
+}
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """Runs the code in a fresh interpreter and returns the cumulative import times of top level imports in microseconds."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are included in their parents.
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(code: str) -> float:
+    """Returns the import time caused by the code in milliseconds, excluding the interpreter startup."""
+    startup = get_import_times("pass")
+    times = get_import_times(code)
+    return sum(time for name, time in times.items() if name not in startup) / 1000
+
+
+def main(runs: int) -> int:
+    failed = False
+    print(f"{'scenario':<16} {'median ms':>10} {'budget ms':>10}")
+    for name, (code, budget) in SCENARIOS.items():
+        median = statistics.median(measure(code) for _ in range(runs))
+        ok = median <= budget
+        failed = failed or not ok
+        print(
+            f"{name:<16} {median:>10.1f} {budget:>10.0f} {'' if ok else 'OVER BUDGET'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    sys.exit(main(parser.parse_args().runs))
@@ -0,0 +1,98 @@
+"""Measures memory and allocation cost of the slotted state classes.
+
+Every class is compared with a regular dataclass with the same fields, i.e. how the class looked before adding `__slots__`.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/bench_slots.py [instances]
+"""
+
+import dataclasses
+import sys
+import time
+import tracemalloc
+
+from pactsdk.add_liquidity import AddLiquidityEffect
+from pactsdk.asset import Asset
+from pactsdk.pool_state import AppInternalState, PoolState
+from pactsdk.swap import SwapEffect
+
+SAMPLE_KWARGS: dict[type, dict] = {
+    Asset: dict(algod=None, index=123, decimals=6, name="Coin", unit_name="COIN"),
+    PoolState: dict(
+        total_liquidity=10**9,
+        total_primary=10**9,
+        total_secondary=2 * 10**9,
+        primary_asset_price=2.0,
+        secondary_asset_price=0.5,
+    ),
+    AppInternalState: dict(
+        A=10**9,
+        B=2 * 10**9,
+        ASSET_A=0,
+        ASSET_B=123,
+        LTID=456,
+        L=10**9,
+        FEE_BPS=30,
+    ),
+    SwapEffect: dict(
+        amount_received=1000,
+        amount_deposited=2000,
+        minimum_amount_received=990,
+        fee=3,
+        primary_asset_price_after_swap=2.0,
+        secondary_asset_price_after_swap=0.5,
+        primary_asset_price_change_pct=0.1,
+        secondary_asset_price_change_pct=-0.1,
+        price=0.5,
+        tx_fee=2000,
+        amplifier=0.0,
+    ),
+    AddLiquidityEffect: dict(
+        minted_liquidity_tokens=1000,
+        minimum_minted_liquidity_tokens=990,
+        amplifier=0.0,
+        bonus_pct=0.0,
+        tx_fee=3000,
+    ),
+}
+
+
+def make_dict_class(cls: type) -> type:
+    fields = [
+        (field.name, field.type, field)
+        for field in dataclasses.fields(cls)
+        if field.init
+    ]
+    return dataclasses.make_dataclass(f"Dict{cls.__name__}", fields)
+
+
+def measure(cls: type, kwargs: dict, count: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    instances = [cls(**kwargs) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    del instances
+
+    # Timing is measured separately, tracemalloc slows down the allocations a lot.
+    tracemalloc.start()
+    instances = [cls(**kwargs) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+
+    return size / count, elapsed / count * 10**9
+
+
+def main(count: int):
+    print(f"{'class':<20} {'bytes/obj':>20} {'ns/obj':>20}")
+    for cls, kwargs in SAMPLE_KWARGS.items():
+        dict_size, dict_time = measure(make_dict_class(cls), kwargs, count)
+        slots_size, slots_time = measure(cls, kwargs, count)
+        print(
+            f"{cls.__name__:<20} {dict_size:>9.0f} -> {slots_size:<8.0f} "
+            f"{dict_time:>9.0f} -> {slots_time:<8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,19 +1,187 @@
 __version__ = "0.7.1"
 
-from .add_liquidity import LiquidityAddition  # noqa
-from .asset import Asset, fetch_asset_by_index  # noqa
-from .client import PactClient  # noqa
-from .exceptions import PactSdkError  # noqa
-from .factories import *  # noqa
-from .farming import *  # noqa
-from .folks_lending_pool import (  # noqa
-    FolksLendingPool,
-    FolksLendingPoolAdapter,
-    LendingLiquidityAddition,
-    LendingSwap,
+# The public names are loaded lazily on the first access, so `import pactsdk` doesn't pay for the modules it doesn't use.
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .account_snapshot import AccountSnapshot  # noqa
+    from .add_liquidity import LiquidityAddition  # noqa
+    from .asset import (  # noqa
+        Asset,
+        FrozenAsset,
+        fetch_asset_by_index,
+        fetch_assets_by_indexes,
+    )
+    from .client import PactClient  # noqa
+    from .confirmation_tracker import ConfirmationTracker  # noqa
+    from .exceptions import (  # noqa
+        PactSdkError,
+        TransactionExpiredError,
+        TransactionRejectedError,
+    )
+    from .factories import *  # noqa
+    from .farming import *  # noqa
+    from .farming.apr import FarmAprEngine  # noqa
+    from .folks_lending_pool import (  # noqa
+        FolksLendingPool,
+        FolksLendingPoolAdapter,
+        LendingLiquidityAddition,
+        LendingSwap,
+    )
+    from .gas_station import GasStation, get_gas_station, set_gas_station  # noqa
+    from .group_composer import GroupComposer, compose_groups  # noqa
+    from .opcode_budget import OpcodeBudget  # noqa
+    from .pool import Pool, PoolState  # noqa
+    from .pool_state import FrozenAppInternalState, FrozenPoolState  # noqa
+    from .pool_table import PoolTable  # noqa
+    from .quote_cache import QuoteCache  # noqa
+    from .submission_pipeline import SubmissionPipeline  # noqa
+    from .swap import Swap, SwapEffect  # noqa
+    from .swap_template import SwapTemplate  # noqa
+    from .transaction_group import TransactionGroup, sign_groups  # noqa
+    from .zap import Zap, ZapParams  # noqa
+
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".account_snapshot": ("AccountSnapshot",),
+    ".add_liquidity": ("LiquidityAddition",),
+    ".asset": (
+        "Asset",
+        "FrozenAsset",
+        "fetch_asset_by_index",
+        "fetch_assets_by_indexes",
+    ),
+    ".client": ("PactClient",),
+    ".confirmation_tracker": ("ConfirmationTracker",),
+    ".exceptions": (
+        "PactSdkError",
+        "TransactionExpiredError",
+        "TransactionRejectedError",
+    ),
+    ".factories": (
+        "ConstantProductFactory",
+        "PoolBuildParams",
+        "PoolFactory",
+        "PoolParams",
+        "base_factory",
+        "constant_product",
+        "get_pool_factory",
+    ),
+    ".farming": (
+        "ClaimPlanner",
+        "Escrow",
+        "EscrowDirectory",
+        "EscrowInternalState",
+        "Farm",
+        "FarmInternalState",
+        "FarmState",
+        "FarmUserState",
+        "FarmWatcher",
+        "FarmingRewards",
+        "Onboarding",
+        "OnboardingPipeline",
+        "PactFarmingClient",
+        "build_deploy_escrow_txs",
+        "claim_planner",
+        "escrow",
+        "escrow_directory",
+        "farm",
+        "farm_state",
+        "farm_watcher",
+        "farming_client",
+        "fetch_escrow_approval_program",
+        "fetch_escrow_by_id",
+        "fetch_escrow_global_state",
+        "fetch_farm_by_id",
+        "fetch_farm_raw_state_by_id",
+        "fetch_farms_by_ids",
+        "internal_state_to_state",
+        "make_farm_from_raw_state",
+        "onboarding",
+        "parse_global_escrow_state",
+        "parse_internal_state",
+    ),
+    ".farming.apr": ("FarmAprEngine",),
+    ".folks_lending_pool": (
+        "FolksLendingPool",
+        "FolksLendingPoolAdapter",
+        "LendingLiquidityAddition",
+        "LendingSwap",
+    ),
+    ".gas_station": ("GasStation", "get_gas_station", "set_gas_station"),
+    ".group_composer": ("GroupComposer", "compose_groups"),
+    ".opcode_budget": ("OpcodeBudget",),
+    ".pool": ("Pool", "PoolState"),
+    ".pool_state": ("FrozenAppInternalState", "FrozenPoolState"),
+    ".pool_table": ("PoolTable",),
+    ".quote_cache": ("QuoteCache",),
+    ".submission_pipeline": ("SubmissionPipeline",),
+    ".swap": ("Swap", "SwapEffect"),
+    ".swap_template": ("SwapTemplate",),
+    ".transaction_group": ("TransactionGroup", "sign_groups"),
+    ".zap": ("Zap", "ZapParams"),
+}
+
+_NAME_TO_MODULE = {name: module for module, names in _EXPORTS.items() for name in names}
+
+_SUBMODULES = (
+    "abi_codec",
+    "account_snapshot",
+    "add_liquidity",
+    "api",
+    "asset",
+    "client",
+    "config",
+    "confirmation_tracker",
+    "constant_product_batch",
+    "constant_product_calculator",
+    "encoding",
+    "exceptions",
+    "factories",
+    "farming",
+    "folks_lending_pool",
+    "gas_station",
+    "group_composer",
+    "opcode_budget",
+    "pool",
+    "pool_calculator",
+    "pool_state",
+    "pool_table",
+    "quote_cache",
+    "registry",
+    "round_follower",
+    "stableswap_calculator",
+    "submission_pipeline",
+    "swap",
+    "swap_template",
+    "transaction_group",
+    "utils",
+    "zap",
 )
-from .gas_station import GasStation, get_gas_station, set_gas_station  # noqa
-from .pool import Pool, PoolState  # noqa
-from .swap import Swap, SwapEffect  # noqa
-from .transaction_group import TransactionGroup  # noqa
-from .zap import Zap, ZapParams  # noqa
+
+__all__ = sorted({*_NAME_TO_MODULE, *_SUBMODULES})
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    else:
+        # Submodules, e.g. `pactsdk.pool`.
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -0,0 +1,125 @@
+"""Fast encoders for the ABI arguments used by the transaction builders.
+
+The functions produce the same bytes as the corresponding `algosdk.abi` types, but skip the type objects and their generic encoding, which adds up when many transactions are built.
+"""
+
+import struct
+from typing import Sequence
+
+_UINT16 = struct.Struct(">H")
+_UINT64 = struct.Struct(">Q")
+
+UINT8: tuple[bytes, ...] = tuple(bytes((value,)) for value in range(256))
+"""Precomputed `uint8` encodings, indexed by the value. Mostly used for the references to the transaction foreign arrays."""
+
+
+def encode_uint8(value: int) -> bytes:
+    """Encodes an ABI `uint8`.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        A single byte.
+    """
+    if not 0 <= value < 256:
+        raise ValueError(f"{value} is out of range for uint8.")
+    return UINT8[value]
+
+
+def encode_uint16(value: int) -> bytes:
+    """Encodes an ABI `uint16`.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        2 bytes, big-endian.
+    """
+    return _UINT16.pack(value)
+
+
+def encode_uint64(value: int) -> bytes:
+    """Encodes an ABI `uint64`.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        8 bytes, big-endian.
+    """
+    return _UINT64.pack(value)
+
+
+def encode_uint64_array(values: Sequence[int]) -> bytes:
+    """Encodes an ABI `uint64[]`.
+
+    Args:
+        values: The values to encode.
+
+    Returns:
+        The 2 byte length prefix followed by the values.
+    """
+    return struct.pack(f">H{len(values)}Q", len(values), *values)
+
+
+def encode_uint64_static_array(values: Sequence[int]) -> bytes:
+    """Encodes an ABI `uint64[N]`, where N is the number of the values.
+
+    Args:
+        values: The values to encode.
+
+    Returns:
+        The concatenated values.
+    """
+    return struct.pack(f">{len(values)}Q", *values)
+
+
+def decode_uint64_static_array(data: bytes) -> list[int]:
+    """Decodes an ABI `uint64[N]`, the inverse of :py:func:`encode_uint64_static_array`.
+
+    Args:
+        data: The encoded array.
+
+    Returns:
+        The decoded values.
+    """
+    if len(data) % 8:
+        raise ValueError("The data length must be a multiple of 8.")
+    return list(struct.unpack(f">{len(data) // 8}Q", data))
+
+
+class Uint8Codec:
+    """An object with the `encode` and `decode` methods of `algosdk.abi.UintType(8)`, backed by :py:func:`encode_uint8`."""
+
+    def encode(self, value: int) -> bytes:
+        return encode_uint8(value)
+
+    def decode(self, data: bytes) -> int:
+        if len(data) != 1:
+            raise ValueError("The data length must be 1.")
+        return data[0]
+
+
+class Uint64StaticArrayCodec:
+    """An object with the `encode` and `decode` methods of `algosdk.abi.ArrayStaticType(algosdk.abi.UintType(64), length)`, backed by :py:func:`encode_uint64_static_array` and :py:func:`decode_uint64_static_array`."""
+
+    length: int
+    """The number of the array elements."""
+
+    def __init__(self, length: int):
+        """
+        Args:
+            length: The number of the array elements.
+        """
+        self.length = length
+
+    def encode(self, values: Sequence[int]) -> bytes:
+        if len(values) != self.length:
+            raise ValueError(f"Expected {self.length} values, got {len(values)}.")
+        return encode_uint64_static_array(values)
+
+    def decode(self, data: bytes) -> list[int]:
+        if len(data) != 8 * self.length:
+            raise ValueError(f"The data length must be {8 * self.length}.")
+        return decode_uint64_static_array(data)
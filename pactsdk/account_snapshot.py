@@ -0,0 +1,145 @@
+"""A point in time view of an account, answering many queries from a single `account_info` call.
+
+Methods like :py:meth:`pactsdk.farming.farm.Farm.fetch_user_state` and :py:meth:`pactsdk.asset.Asset.get_holding` fetch the account info on every call. When many farms and assets are queried for the same account, an :py:class:`AccountSnapshot` fetches it once and answers the rest from memory.
+
+Typical usage example::
+
+    snapshot = pactsdk.AccountSnapshot.fetch(algod, address)
+
+    for farm in farms:
+        user_state = snapshot.get_farm_user_state(farm)
+        reward_holdings = [snapshot.get_holding(asset) for asset in farm.state.reward_assets]
+"""
+
+from typing import TYPE_CHECKING, Iterable, Optional, Union, cast
+
+from algosdk.v2client.algod import AlgodClient
+
+from .asset import Asset
+from .utils import parse_app_state
+
+if TYPE_CHECKING:
+    from .farming.farm import Farm
+    from .farming.farm_state import FarmUserState
+
+
+class AccountSnapshot:
+    """The account's holdings and application local states at the time of the fetch.
+
+    All the local states are parsed up front, so the queries don't do any I/O. The snapshot is not updated, fetch a new one to see the changes.
+    """
+
+    address: str
+    """The account address."""
+
+    account_info: dict
+    """The raw account info the snapshot was built from."""
+
+    round: int
+    """The round at which the account info was fetched."""
+
+    holdings: dict[int, int]
+    """The amounts held for each opted-in asset id. Algo is under 0."""
+
+    local_states: dict[int, dict]
+    """The local states for each opted-in application id, parsed with :py:func:`pactsdk.utils.parse_app_state`."""
+
+    def __init__(self, account_info: dict):
+        """
+        Args:
+            account_info: The account info as returned by `algod.account_info`.
+        """
+        self.account_info = account_info
+        self.address = account_info["address"]
+        self.round = account_info.get("round", 0)
+
+        self.holdings = {0: account_info["amount"]}
+        for holding in account_info.get("assets", []):
+            self.holdings[holding["asset-id"]] = holding["amount"]
+
+        self.local_states = {
+            local_state["id"]: parse_app_state(local_state.get("key-value", []))
+            for local_state in account_info.get("apps-local-state", [])
+        }
+
+    @classmethod
+    def fetch(cls, algod: AlgodClient, address: str) -> "AccountSnapshot":
+        """Fetches the account info and builds a snapshot from it.
+
+        Args:
+            algod: The Algorand client to use.
+            address: The account address.
+
+        Returns:
+            The snapshot of the account.
+        """
+        return cls(cast(dict, algod.account_info(address)))
+
+    def get_holding(self, asset: Union[Asset, int]) -> Optional[int]:
+        """The same as :py:meth:`pactsdk.asset.Asset.get_holding`, but without fetching the account info.
+
+        Args:
+            asset: The asset or the asset id.
+
+        Returns:
+            The amount of the asset the account is holding, or None if the account is not opted into the asset.
+        """
+        return self.holdings.get(_asset_id(asset))
+
+    def is_opted_in(self, asset: Union[Asset, int]) -> bool:
+        """The same as :py:meth:`pactsdk.asset.Asset.is_opted_in`, but without fetching the account info.
+
+        Args:
+            asset: The asset or the asset id.
+
+        Returns:
+            True if the account is opted into the asset, false otherwise.
+        """
+        return _asset_id(asset) in self.holdings
+
+    def is_opted_in_to_app(self, app_id: int) -> bool:
+        """Checks if the account has a local state in the application.
+
+        Args:
+            app_id: The application id.
+
+        Returns:
+            True if the account is opted into the application, false otherwise.
+        """
+        return app_id in self.local_states
+
+    def get_farm_user_state(self, farm: "Farm") -> Optional["FarmUserState"]:
+        """The same as :py:meth:`pactsdk.farming.farm.Farm.fetch_user_state`, but without fetching the account info.
+
+        Args:
+            farm: The farm to get the user state for.
+
+        Returns:
+            The user state or None if the account doesn't participate in the farm.
+        """
+        raw_state = self.local_states.get(farm.app_id)
+        if raw_state is None:
+            return None
+        return farm.get_user_state_from_local_state(raw_state)
+
+    def get_farm_user_states(
+        self, farms: Iterable["Farm"]
+    ) -> dict[int, "FarmUserState"]:
+        """Gets the user states for all the farms the account participates in.
+
+        Args:
+            farms: The farms to check.
+
+        Returns:
+            The user states keyed by the farm app id. Farms without the user state are skipped.
+        """
+        user_states = {}
+        for farm in farms:
+            user_state = self.get_farm_user_state(farm)
+            if user_state is not None:
+                user_states[farm.app_id] = user_state
+        return user_states
+
+
+def _asset_id(asset: Union[Asset, int]) -> int:
+    return asset.index if isinstance(asset, Asset) else asset
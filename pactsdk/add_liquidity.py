@@ -15,6 +15,7 @@ from pactsdk.stableswap_calculator import (
 
 from .constant_product_calculator import get_constant_product_minted_liquidity_tokens
 from .transaction_group import TransactionGroup
+from .utils import add_slots
 
 if TYPE_CHECKING:
     from .pool import Pool
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
 MIN_LT_AMOUNT = 1000
 
 
+@add_slots
 @dataclass
 class AddLiquidityEffect:
     """The effect of adding liquidity to the pool."""
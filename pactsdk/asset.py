@@ -1,12 +1,14 @@
 """Utility functions and class for dealing with Algorand Standard Assets."""
 
-import copy
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
 
 from algosdk import transaction
 from algosdk.v2client.algod import AlgodClient
 
+from .utils import add_slots, frozen_variant
+
 ASSETS_CACHE: dict[tuple[AlgodClient, int], "Asset"] = {}
 """Dictionary mapping the asset index number to the :py:class:`pactsdk.asset.Asset` class to speed up look up of the asset information."""
 
@@ -14,7 +16,7 @@ ASSETS_CACHE: dict[tuple[AlgodClient, int], "Asset"] = {}
 def get_cached_asset(algod: AlgodClient, index: int, decimals: int) -> "Asset":
     cache_key = (algod, index)
     if cache_key in ASSETS_CACHE:
-        return copy.copy(ASSETS_CACHE[cache_key])
+        return ASSETS_CACHE[cache_key]
 
     return Asset(algod=algod, index=index, decimals=decimals)
 
@@ -31,11 +33,11 @@ def fetch_asset_by_index(
         algod: An Algorand client to query about the asset.
         index: An Algorand Asset number to look up.
     Returns:
-        An asset instance for the index passed in.
+        An asset instance for the index passed in. It's a :py:class:`FrozenAsset` shared by all the users of the cache, so it can't be modified.
     """
     cache_key = (algod, index)
     if cache_key in ASSETS_CACHE:
-        return copy.copy(ASSETS_CACHE[cache_key])
+        return ASSETS_CACHE[cache_key]
 
     if index > 0:
         asset_info = algod.asset_info(index)
@@ -47,7 +49,7 @@ def fetch_asset_by_index(
             "decimals": 6,
         }
 
-    asset = Asset(
+    asset = FrozenAsset(
         algod=algod,
         index=index,
         decimals=params["decimals"],
@@ -60,11 +62,47 @@ def fetch_asset_by_index(
     return asset
 
 
+def fetch_assets_by_indexes(
+    algod: AlgodClient,
+    indexes: Iterable[int],
+    executor: Optional[Executor] = None,
+) -> dict[int, "Asset"]:
+    """Fetches many assets concurrently with :py:func:`fetch_asset_by_index`.
+
+    Duplicate indexes are fetched once and the assets already in the cache are not fetched at all.
+
+    Args:
+        algod: An Algorand client to query about the assets.
+        indexes: The Algorand Asset numbers to look up.
+        executor: The executor to run the requests on. By default a thread pool is created for the call.
+
+    Returns:
+        The assets keyed by the index.
+    """
+    unique_indexes = list(dict.fromkeys(indexes))
+    missing = [index for index in unique_indexes if (algod, index) not in ASSETS_CACHE]
+
+    def fetch(index: int) -> "Asset":
+        return fetch_asset_by_index(algod, index)
+
+    if len(missing) > 1:
+        if executor is None:
+            with ThreadPoolExecutor(min(len(missing), 8)) as own_executor:
+                list(own_executor.map(fetch, missing))
+        else:
+            list(executor.map(fetch, missing))
+
+    return {index: fetch(index) for index in unique_indexes}
+
+
+@add_slots
 @dataclass
 class Asset:
     """Describes the basic data and the utility functions for an Algorand Standard Asset.
 
     Typically you don't create instances of this class manually. Use :py:meth:`pactsdk.client.PactClient.fetch_asset` instead. Also, when instantiating the pool e.g. by using :py:meth:`pactsdk.client.PactClient.fetch_pool_by_id` the missing pool assets are fetched automatically.
+
+    A single cached instance is shared by all the pools using the asset. The cached assets are :py:class:`FrozenAsset` instances, so changing an asset of one pool can't affect the others.
     """
 
     algod: AlgodClient
@@ -82,13 +120,17 @@ class Asset:
     unit_name: Optional[str] = None
     """The name of a unit of the asset if there is one. This may be None."""
 
-    @property
-    def ratio(self) -> int:
-        """The ratio between a base unit and the unit of the asset.
+    ratio: int = field(init=False, repr=False, compare=False)
+    """The ratio between a base unit and the unit of the asset.
 
-        This is used to convert between an integer and floating point representation of the asset without loss of precision.
-        """
-        return 10**self.decimals
+    This is used to convert between an integer and floating point representation of the asset without loss of precision.
+    """
+
+    def __setattr__(self, name: str, value):
+        object.__setattr__(self, name, value)
+        if name == "decimals":
+            # Kept in sync with the decimals, as it's read in every amount conversion.
+            object.__setattr__(self, "ratio", 10**value)
 
     def prepare_opt_in_tx(self, address: str) -> transaction.AssetTransferTxn:
         """This creates a transaction that will allow the account to "opt in" to the asset.
@@ -238,3 +280,7 @@ class Asset:
 
     def __hash__(self) -> int:
         return self.index
+
+
+FrozenAsset = frozen_variant(Asset)
+"""An immutable :py:class:`Asset`. Assigning its attributes raises `dataclasses.FrozenInstanceError`."""
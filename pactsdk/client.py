@@ -15,21 +15,16 @@ Typical usage example::
 
     pools = pact.fetch_pools_by_assets(algo, other_coin)
 """
-from typing import Optional, Union, cast
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Optional, Union, cast
 
 from algosdk.v2client.algod import AlgodClient
 
 from pactsdk.api import ApiListPoolsResponse
-from pactsdk.farming.farming_client import PactFarmingClient
 
 from .asset import Asset, fetch_asset_by_index
 from .config import Config, Network, get_config
-from .factories import ConstantProductFactory, get_pool_factory
-from .folks_lending_pool import (
-    FolksLendingPool,
-    FolksLendingPoolAdapter,
-    fetch_folks_lending_pool,
-)
+from .exceptions import PactSdkError
 from .gas_station import get_gas_station, set_gas_station
 from .pool import (
     ListPoolsParams,
@@ -38,6 +33,13 @@ from .pool import (
     fetch_pools_by_assets,
     list_pools,
 )
+from .registry import Registry, export_registry, load_registry
+
+if TYPE_CHECKING:
+    # Farming, factories and lending pools are imported on first use to keep the SDK import fast.
+    from .factories import ConstantProductFactory
+    from .farming import PactFarmingClient
+    from .folks_lending_pool import FolksLendingPool, FolksLendingPoolAdapter
 
 
 class PactClient:
@@ -52,25 +54,44 @@ class PactClient:
     config: Config
     """Client configuration with global contracts ids etc."""
 
-    farming: PactFarmingClient
+    track_pools: bool
+    """Whether the pools loaded through this client are kept in :py:attr:`pools`. Off by default, as the client then holds every pool it has ever fetched."""
+
+    pools: dict[int, Pool]
+    """Pools loaded through this client, keyed by the application id. Filled only if :py:attr:`track_pools` is set."""
 
-    def __init__(self, algod: AlgodClient, network: Network = "mainnet", **kwargs):
+    def __init__(
+        self,
+        algod: AlgodClient,
+        network: Network = "mainnet",
+        track_pools=False,
+        **kwargs,
+    ):
         """Constructor for the PactClient class.
 
         Args:
             algod: Algorand client to work with.
             network: The Algorand network to use the client with. The configuration values depend on the chosen network.
+            track_pools: Keep the loaded pools in :py:attr:`pools`, e.g. to export them with :py:meth:`export_registry`.
             kwargs: Use it to overwrite configuration parameters.
         """
         self.algod = algod
         self.config = get_config(network, **kwargs)
-        self.farming = PactFarmingClient(algod, self.config)
+        self.track_pools = track_pools
+        self.pools = {}
 
         try:
             get_gas_station()
         except AssertionError:
             set_gas_station(self.config.gas_station_id)
 
+    @cached_property
+    def farming(self) -> "PactFarmingClient":
+        """A client for the farming contracts. Created on the first access."""
+        from .farming import PactFarmingClient
+
+        return PactFarmingClient(self.algod, self.config)
+
     def fetch_asset(self, asset_index: int) -> Asset:
         """A convenient method for fetching ASAs (Algorand Standard Asset).
 
@@ -117,12 +138,14 @@ class PactClient:
         Returns:
             List of pools for the two assets, the list may be empty.
         """
-        return fetch_pools_by_assets(
+        pools = fetch_pools_by_assets(
             algod=self.algod,
             asset_a=primary_asset,
             asset_b=secondary_asset,
             pact_api_url=self.config.api_url,
         )
+        self._track(pools)
+        return pools
 
     def fetch_pool_by_id(self, app_id: int) -> Pool:
         """Fetches the pool by the application id. It uses algod client to fetch the data directly from the blockchain.
@@ -136,9 +159,47 @@ class PactClient:
         Returns:
             The pool for the application id.
         """
-        return fetch_pool_by_id(algod=self.algod, app_id=app_id)
+        pool = fetch_pool_by_id(algod=self.algod, app_id=app_id)
+        self._track([pool])
+        return pool
+
+    def export_registry(
+        self, path: str, round: int, pools: Optional[Iterable[Pool]] = None
+    ):
+        """Saves the pools to a compact binary file. See :py:mod:`pactsdk.registry` for details.
+
+        Args:
+            path: The file to write.
+            round: The round the pools state comes from. Use a round read before fetching the pools, so a watcher catching up from it doesn't miss any change.
+            pools: The pools to save. Defaults to :py:attr:`pools`, if :py:attr:`track_pools` is set.
+
+        Raises:
+            PactSdkError: If the pools are not provided and the client doesn't track them.
+        """
+        if pools is None:
+            if not self.track_pools:
+                raise PactSdkError(
+                    "The client doesn't track the pools. Pass the pools explicitly or create the client with track_pools=True."
+                )
+            pools = self.pools.values()
+        export_registry(path, list(pools), round)
 
-    def fetch_folks_lending_pool(self, app_id: int) -> FolksLendingPool:
+    def load_registry(self, path: str) -> Registry:
+        """Restores the pools saved with :py:meth:`export_registry` without any network calls.
+
+        The restored pools are added to :py:attr:`pools` if :py:attr:`track_pools` is set.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            The registry with the restored pools and the round their state comes from.
+        """
+        registry = load_registry(self.algod, path)
+        self._track(registry.pools)
+        return registry
+
+    def fetch_folks_lending_pool(self, app_id: int) -> "FolksLendingPool":
         """Fetches Folks Finance lending pool that can be used in FolksLendingPoolAdapter which allows higher APR than a normal pool.
         See :py:mod:`pactsdk.folks_lending_pool` for details.
 
@@ -148,14 +209,16 @@ class PactClient:
         Returns:
             The Folks Finance lending pool for the given application id.
         """
+        from .folks_lending_pool import fetch_folks_lending_pool
+
         return fetch_folks_lending_pool(self.algod, app_id)
 
     def get_folks_lending_pool_adapter(
         self,
         pact_pool: Pool,
-        primary_lending_pool: FolksLendingPool,
-        secondary_lending_pool: FolksLendingPool,
-    ) -> FolksLendingPoolAdapter:
+        primary_lending_pool: "FolksLendingPool",
+        secondary_lending_pool: "FolksLendingPool",
+    ) -> "FolksLendingPoolAdapter":
         """Creates the adapter object that allows composing Folks Finance lending pools with Pact pool, resulting in a higher APR.
         See :py:mod:`pactsdk.folks_lending_pool` for details.
 
@@ -167,6 +230,8 @@ class PactClient:
         Returns:
             The adapter object.
         """
+        from .folks_lending_pool import FolksLendingPoolAdapter
+
         return FolksLendingPoolAdapter(
             algod=self.algod,
             app_id=self.config.folks_lending_pool_adapter_id,
@@ -175,16 +240,25 @@ class PactClient:
             secondary_lending_pool=secondary_lending_pool,
         )
 
-    def get_constant_product_pool_factory(self) -> ConstantProductFactory:
+    def get_constant_product_pool_factory(self) -> "ConstantProductFactory":
         """Gets the constant product pool factory according to the client's configuration."""
+        from .factories import ConstantProductFactory, get_pool_factory
+
         factory = get_pool_factory(
             algod=self.algod, pool_type="CONSTANT_PRODUCT", config=self.config
         )
         return cast(ConstantProductFactory, factory)
 
-    def get_nft_constant_product_pool_factory(self) -> ConstantProductFactory:
+    def get_nft_constant_product_pool_factory(self) -> "ConstantProductFactory":
         """Gets the NFT constant product pool factory according to the client's configuration."""
+        from .factories import ConstantProductFactory, get_pool_factory
+
         factory = get_pool_factory(
             algod=self.algod, pool_type="NFT_CONSTANT_PRODUCT", config=self.config
         )
         return cast(ConstantProductFactory, factory)
+
+    def _track(self, pools: list[Pool]):
+        if self.track_pools:
+            for pool in pools:
+                self.pools[pool.app_id] = pool
@@ -0,0 +1,197 @@
+"""Utilities for waiting for many transactions at once.
+
+:py:func:`pactsdk.utils.wait_for_confirmation` runs a polling loop for a single transaction. :py:class:`ConfirmationTracker` runs one loop following the rounds and reads the ids of the transactions committed in each new block, so the cost of a round doesn't grow with the number of outstanding transactions.
+
+Typical usage example::
+
+    with pactsdk.ConfirmationTracker(algod) as tracker:
+        futures = []
+        for group in groups:
+            algod.send_transactions(group.sign(private_key))
+            futures.append(tracker.track_group(group))
+
+        for future in futures:
+            tx_info = future.result()
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from .exceptions import TransactionExpiredError, TransactionRejectedError
+from .round_follower import RoundFollower
+from .transaction_group import TransactionGroup
+
+logger = logging.getLogger(__name__)
+
+ConfirmationCallback = Callable[["Future[dict]"], None]
+"""A callback called with the resolved future when the transaction is confirmed, rejected or expired."""
+
+
+class ConfirmationTracker(RoundFollower):
+    """Waits for the confirmation of many transactions with a single round following loop.
+
+    Each tracked transaction gets a future. The future result is the pending transaction info returned by algod once the transaction is confirmed. The future fails with :py:class:`pactsdk.exceptions.TransactionRejectedError` if the transaction is dropped from the transaction pool or with :py:class:`pactsdk.exceptions.TransactionExpiredError` if it's not confirmed before its last valid round.
+
+    The confirmations are found in the transaction ids of the new blocks, and only the confirmed transactions are fetched. A transaction is polled individually once after it starts being tracked, in case it's already confirmed, and in the last :py:attr:`poll_rounds` before its last valid round, to detect the rejection or the expiry. If the blocks can't be read, e.g. on the first round or when too many rounds were skipped, all the transactions are polled.
+    """
+
+    max_scanned_rounds: int
+    """The maximum number of blocks read in a single step. Above that, all the transactions are polled instead."""
+
+    poll_rounds: int
+    """The number of rounds before the last valid round in which a transaction is polled each round."""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        retry_interval=1.0,
+        max_scanned_rounds=10,
+        poll_rounds=10,
+    ):
+        """
+        Args:
+            algod: The Algorand client to use.
+            retry_interval: Seconds to wait before retrying after a network error in the background loop.
+            max_scanned_rounds: The maximum number of blocks read in a single step.
+            poll_rounds: The number of rounds before the last valid round in which a transaction is polled each round.
+        """
+        super().__init__(algod, retry_interval)
+        self.max_scanned_rounds = max_scanned_rounds
+        self.poll_rounds = poll_rounds
+        self._pending: dict[str, tuple[int, "Future[dict]"]] = {}
+        self._unpolled: set[str] = set()
+        self._lock = threading.Lock()
+        self._updated_round: Optional[int] = None
+
+    def __len__(self) -> int:
+        """The number of transactions waiting for the confirmation."""
+        return len(self._pending)
+
+    def track(
+        self,
+        txid: str,
+        last_valid_round: int,
+        callback: Optional[ConfirmationCallback] = None,
+    ) -> "Future[dict]":
+        """Starts tracking a sent transaction.
+
+        Args:
+            txid: The id of the transaction.
+            last_valid_round: The last round in which the transaction can be confirmed.
+            callback: An optional callback called when the transaction is resolved.
+
+        Returns:
+            A future resolved with the pending transaction info.
+        """
+        with self._lock:
+            if txid in self._pending:
+                future = self._pending[txid][1]
+            else:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._pending[txid] = (last_valid_round, future)
+                self._unpolled.add(txid)
+
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def track_group(
+        self,
+        group: TransactionGroup,
+        callback: Optional[ConfirmationCallback] = None,
+        index=0,
+    ) -> "Future[dict]":
+        """Starts tracking a sent transaction group. A group is confirmed atomically, so only one of its transactions is tracked.
+
+        Args:
+            group: The sent group.
+            callback: An optional callback called when the group is resolved.
+            index: The index of the tracked transaction in the group. Useful when the result of a particular transaction is needed, e.g. the id of a created application.
+
+        Returns:
+            A future resolved with the pending transaction info of the tracked transaction.
+        """
+        txid = group.transactions[index].get_txid()
+        last_valid_round = min(tx.last_valid_round for tx in group.transactions)
+        return self.track(txid, last_valid_round, callback)
+
+    def on_round(self, round: int):
+        """Resolves the transactions confirmed since the previous round and the rejected and expired ones.
+
+        Args:
+            round: The last committed round.
+        """
+        with self._lock:
+            pending = list(self._pending.items())
+            unpolled = set(self._unpolled)
+
+        committed_txids = self._fetch_committed_txids(round)
+
+        for txid, (last_valid_round, future) in pending:
+            if (
+                committed_txids is None
+                or txid in committed_txids
+                or txid in unpolled
+                or round >= last_valid_round - self.poll_rounds
+            ):
+                self._poll(txid, last_valid_round, round)
+
+        self._updated_round = round
+
+    def _poll(self, txid: str, last_valid_round: int, round: int):
+        try:
+            tx_info = self.algod.pending_transaction_info(txid)
+        except AlgodHTTPError as e:
+            if e.code != 404:
+                raise
+            # Not seen by the node (yet).
+            tx_info = {}
+
+        with self._lock:
+            self._unpolled.discard(txid)
+
+        assert isinstance(tx_info, dict)
+        if tx_info.get("confirmed-round"):
+            self._pop(txid).set_result(tx_info)
+        elif tx_info.get("pool-error"):
+            self._pop(txid).set_exception(
+                TransactionRejectedError(
+                    f"Transaction {txid} rejected: {tx_info['pool-error']}"
+                )
+            )
+        elif round >= last_valid_round:
+            self._pop(txid).set_exception(
+                TransactionExpiredError(
+                    f"Transaction {txid} not confirmed before round {last_valid_round}."
+                )
+            )
+
+    def _fetch_committed_txids(self, round: int) -> Optional[set[str]]:
+        """The ids of the transactions committed since the last handled round, or None if unknown."""
+        if self._updated_round is None:
+            return None
+
+        rounds = range(self._updated_round + 1, round + 1)
+        if len(rounds) > self.max_scanned_rounds:
+            return None
+
+        txids: set[str] = set()
+        try:
+            for block_round in rounds:
+                response = self.algod.get_block_txids(block_round)
+                assert isinstance(response, dict)
+                txids.update(response.get("blockTxids") or [])
+        except AlgodHTTPError as e:
+            logger.warning(f"Reading the blocks failed: {e}. Polling all transactions.")
+            return None
+        return txids
+
+    def _pop(self, txid: str) -> "Future[dict]":
+        with self._lock:
+            return self._pending.pop(txid)[1]
@@ -0,0 +1,210 @@
+"""Batched constant product swap math on NumPy arrays.
+
+The functions give bit-identical results to applying :py:func:`pactsdk.constant_product_calculator.get_swap_gross_amount_received` and :py:func:`pactsdk.constant_product_calculator.get_swap_amount_deposited` to each element, but run on int64 arrays instead of Python integers.
+
+The products of the reserves and the amounts often don't fit in 64 bits. The quotients are therefore estimated in float64 and corrected with the exact remainder, computed in wrapping 64-bit arithmetic. The correction is exact while the products stay below 2^110 and the factors below 2^62, which covers any realistic reserves. Elements for which that can't be proven fall back to Python integers.
+
+This module requires NumPy. Install it with `pip install pactsdk[numpy]`.
+
+Typical usage example::
+
+    gross = get_swap_gross_amounts_received(total_a, total_b, amounts)
+    received = get_net_amounts_received(gross, fee_bps)
+"""
+
+from typing import Any, Callable
+
+from .constant_product_calculator import (
+    get_swap_amount_deposited,
+    get_swap_gross_amount_received,
+)
+from .utils import require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+_MAX_FACTOR = 2**62
+"""Exclusive upper bound of the values handled in int64."""
+
+_MAX_DIVISOR = 2**61
+"""Exclusive upper bound of the divisors, keeps the remainder within int64."""
+
+_MAX_PRODUCT = 2.0**109
+"""Upper bound of the float estimate of the products, with a margin below 2^110 for the rounding errors."""
+
+_MAX_DEPOSITED = 2.0**51
+"""Upper bound of the float estimate of the deposited amount. Above 2^52 the floats can't represent the fraction that is rounded up."""
+
+
+def get_swap_gross_amounts_received(
+    liq_a: Any, liq_b: Any, amounts_deposited: Any
+) -> "np.ndarray":
+    """Vectorized :py:func:`pactsdk.constant_product_calculator.get_swap_gross_amount_received`.
+
+    Args:
+        liq_a: The liquidities of the deposited asset. An array or a single value, broadcasted with the other arguments.
+        liq_b: The liquidities of the received asset.
+        amounts_deposited: The amounts to deposit.
+
+    Raises:
+        ZeroDivisionError: If both the liquidity and the amount deposited are zero for any element.
+
+    Returns:
+        An int64 array of the gross amounts received, or an object array of Python integers if any of the results doesn't fit in int64.
+    """
+    require_numpy()
+    arrays = np.broadcast_arrays(
+        np.asarray(liq_a), np.asarray(liq_b), np.asarray(amounts_deposited)
+    )
+    shape = arrays[0].shape
+    exact = [array.ravel() for array in arrays]
+    (a, b, y), valid = _to_int64(exact)
+
+    d = a + y
+    fast = (
+        valid
+        & (d > 0)
+        & (d < _MAX_DIVISOR)
+        & (b.astype(np.float64) * y.astype(np.float64) < _MAX_PRODUCT)
+    )
+    quotient, _ = _floor_div_product(b, y, d, fast)
+
+    result = _merge(
+        quotient,
+        fast,
+        lambda row: get_swap_gross_amount_received(
+            int(exact[0][row]), int(exact[1][row]), int(exact[2][row])
+        ),
+    )
+    return result.reshape(shape)
+
+
+def get_swap_amounts_deposited(
+    liq_a: Any, liq_b: Any, gross_amounts_received: Any
+) -> "np.ndarray":
+    """Vectorized :py:func:`pactsdk.constant_product_calculator.get_swap_amount_deposited`.
+
+    Args:
+        liq_a: The liquidities of the deposited asset. An array or a single value, broadcasted with the other arguments.
+        liq_b: The liquidities of the received asset.
+        gross_amounts_received: The amounts to receive, not yet lessened by the fee.
+
+    Raises:
+        ZeroDivisionError: If the amount to receive equals the liquidity for any element.
+
+    Returns:
+        An int64 array of the amounts to deposit, or an object array of Python integers if any of the results doesn't fit in int64.
+    """
+    require_numpy()
+    arrays = np.broadcast_arrays(
+        np.asarray(liq_a), np.asarray(liq_b), np.asarray(gross_amounts_received)
+    )
+    shape = arrays[0].shape
+    exact = [array.ravel() for array in arrays]
+    (a, b, g), valid = _to_int64(exact)
+
+    d = b - g
+    float_a = a.astype(np.float64)
+    float_g = g.astype(np.float64)
+    float_d = np.maximum(d, 1).astype(np.float64)
+    fast = (
+        valid
+        & (d > 0)
+        & (d < _MAX_DIVISOR)
+        & (float_a * float_g < _MAX_PRODUCT)
+        & (float_a * float_g / float_d < _MAX_DEPOSITED)
+    )
+    quotient, remainder = _floor_div_product(a, g, d, fast)
+
+    # The Python version rounds the exact quotient to a float before taking the ceiling. That rounds down to the integer part only if the fraction is below half of the float spacing, which is at most quotient * 2^-53. Such elements are left to the fallback.
+    fast &= (remainder == 0) | (
+        remainder.astype(np.float64) / float_d
+        > quotient.astype(np.float64) * 2.0**-50
+    )
+
+    result = _merge(
+        quotient + (remainder > 0),
+        fast,
+        lambda row: get_swap_amount_deposited(
+            int(exact[0][row]), int(exact[1][row]), int(exact[2][row])
+        ),
+    )
+    return result.reshape(shape)
+
+
+def get_net_amounts_received(gross_amounts: Any, fee_bps: Any) -> "np.ndarray":
+    """Vectorized gross to net amount conversion, the same as subtracting :py:meth:`pactsdk.pool_calculator.PoolCalculator.get_fee_from_gross_amount`.
+
+    Args:
+        gross_amounts: The amounts received, not yet lessened by the fee. An int64 or an object array.
+        fee_bps: The pool fees in basis points.
+
+    Returns:
+        The net amounts received, with the same dtype as the gross amounts.
+    """
+    require_numpy()
+    gross_amounts = np.asarray(gross_amounts)
+    if gross_amounts.dtype == object:
+        fee_bps = np.asarray(fee_bps).astype(object)
+        return gross_amounts * (10_000 - fee_bps) // 10_000
+
+    # gross * (10_000 - fee) could overflow, so it's split into the high and low parts.
+    remaining_bps = 10_000 - np.asarray(fee_bps).astype(np.int64)
+    high, low = np.divmod(gross_amounts, 10_000)
+    return high * remaining_bps + low * remaining_bps // 10_000
+
+
+def _to_int64(arrays: list["np.ndarray"]) -> tuple[list["np.ndarray"], "np.ndarray"]:
+    valid = np.ones(arrays[0].shape, dtype=bool)
+    for array in arrays:
+        if array.dtype.kind not in "iu":
+            array = array.astype(object)
+        valid &= np.asarray((array >= 0) & (array < _MAX_FACTOR), dtype=bool)
+
+    converted = [
+        np.where(valid, array, 0).astype(np.int64)
+        if array.dtype.kind in "iu"
+        else np.where(valid, array, 0).astype(object).astype(np.int64)
+        for array in arrays
+    ]
+    return converted, valid
+
+
+def _floor_div_product(
+    x: "np.ndarray", y: "np.ndarray", d: "np.ndarray", mask: "np.ndarray"
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Calculates `x * y // d` and `x * y % d` for the masked elements. The others are garbage."""
+    x = np.where(mask, x, 0)
+    y = np.where(mask, y, 0)
+    d = np.where(mask, d, 1)
+
+    estimate = np.floor(
+        x.astype(np.float64) * y.astype(np.float64) / d.astype(np.float64)
+    ).astype(np.int64)
+
+    # The exact product minus the estimated one, modulo 2^64. The true difference is below 2^63 in magnitude, so it's recovered by reinterpreting as int64.
+    with np.errstate(over="ignore"):
+        residual = (
+            x.view(np.uint64) * y.view(np.uint64)
+            - estimate.view(np.uint64) * d.view(np.uint64)
+        ).view(np.int64)
+
+    return estimate + residual // d, residual % d
+
+
+def _merge(
+    values: "np.ndarray", fast: "np.ndarray", compute: Callable[[int], int]
+) -> "np.ndarray":
+    slow_rows = np.flatnonzero(~fast)
+    if len(slow_rows) == 0:
+        return values
+
+    slow_values = [compute(int(row)) for row in slow_rows]
+    if all(-(2**63) <= value < 2**63 for value in slow_values):
+        result = values.copy()
+    else:
+        result = values.astype(object)
+    result[slow_rows] = slow_values
+    return result
@@ -5,3 +5,15 @@ class PactSdkError(Exception):
     """The general exception used throughout pactsdk."""
 
     pass
+
+
+class TransactionRejectedError(PactSdkError):
+    """Raised when algod reports that a transaction was removed from the transaction pool without being confirmed."""
+
+    pass
+
+
+class TransactionExpiredError(PactSdkError):
+    """Raised when a transaction was not confirmed before its last valid round."""
+
+    pass
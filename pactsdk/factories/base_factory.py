@@ -6,6 +6,11 @@ import algosdk
 
 from pactsdk.encoding import deserialize_uint64
 
+from ..abi_codec import (
+    Uint64StaticArrayCodec,
+    decode_uint64_static_array,
+    encode_uint64_static_array,
+)
 from ..pool import Pool, fetch_pool_by_id
 from ..transaction_group import TransactionGroup
 from ..utils import get_box_min_balance, parse_app_state, wait_for_confirmation
@@ -34,7 +39,8 @@ class PoolParams:
     fee_bps: int
     version: int
 
-    abi = algosdk.abi.ArrayStaticType(algosdk.abi.UintType(64), 4)
+    abi = Uint64StaticArrayCodec(4)
+    """Deprecated, kept for backward compatibility. Use :py:meth:`to_box_name` and :py:meth:`from_box_name` or :py:mod:`pactsdk.abi_codec` instead."""
 
     def __hash__(self):
         return hash(self.as_tuple())
@@ -48,11 +54,11 @@ class PoolParams:
         )
 
     def to_box_name(self) -> bytes:
-        return self.abi.encode(self.as_tuple())
+        return encode_uint64_static_array(self.as_tuple())
 
     @classmethod
     def from_box_name(cls, name: str):
-        values = cls.abi.decode(base64.b64decode(name))
+        values = decode_uint64_static_array(base64.b64decode(name))
         return cls(*values)
 
 
@@ -2,8 +2,9 @@ import dataclasses
 
 import algosdk
 
+from ..abi_codec import UINT8, encode_uint64
 from ..transaction_group import TransactionGroup
-from ..utils import get_selector, sp_fee
+from ..utils import sp_fee
 from .base_factory import (
     PoolBuildParams,
     PoolFactory,
@@ -11,6 +12,9 @@ from .base_factory import (
     get_contract_deploy_cost,
 )
 
+# build(asset,asset,uint64)uint64
+BUILD_SIG = bytes.fromhex("ee5a0d15")
+
 
 def build_constant_product_tx_group(
     factory_id: int,
@@ -34,10 +38,10 @@ def build_constant_product_tx_group(
     )
 
     app_args: list = [
-        get_selector("build(asset,asset,uint64)uint64"),
-        algosdk.abi.UintType(8).encode(0),
-        algosdk.abi.UintType(8).encode(1),
-        algosdk.abi.UintType(64).encode(pool_params.fee_bps),
+        BUILD_SIG,
+        UINT8[0],
+        UINT8[1],
+        encode_uint64(pool_params.fee_bps),
     ]
 
     box_name = pool_params.to_box_name()
@@ -1,3 +1,4 @@
+from .claim_planner import ClaimPlanner  # noqa
 from .escrow import (  # noqa
     Escrow,
     EscrowInternalState,
@@ -7,10 +8,12 @@ from .escrow import (  # noqa
     fetch_escrow_global_state,
     parse_global_escrow_state,
 )
+from .escrow_directory import EscrowDirectory  # noqa
 from .farm import (  # noqa
     Farm,
     fetch_farm_by_id,
     fetch_farm_raw_state_by_id,
+    fetch_farms_by_ids,
     make_farm_from_raw_state,
 )
 from .farm_state import (  # noqa
@@ -21,4 +24,6 @@ from .farm_state import (  # noqa
     internal_state_to_state,
     parse_internal_state,
 )
+from .farm_watcher import FarmWatcher  # noqa
 from .farming_client import PactFarmingClient  # noqa
+from .onboarding import Onboarding, OnboardingPipeline  # noqa
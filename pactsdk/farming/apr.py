@@ -0,0 +1,135 @@
+"""APR of many farms, valued with the prices from the pools.
+
+:py:attr:`pactsdk.farming.farm_state.FarmState.rewards_per_second` gives the reward rates in tokens. Turning them into an APR needs the prices of the reward assets and of the staked asset, which is usually a liquidity token. :py:class:`FarmAprEngine` derives all the prices from a :py:class:`pactsdk.pool_table.PoolTable` and computes the APR of all the farms in a single vectorized pass.
+
+This module requires NumPy. Install it with `pip install pactsdk[numpy]`.
+
+Typical usage example::
+
+    pact = pactsdk.PactClient(algod, track_pools=True)
+    ...
+    table = pactsdk.PoolTable.from_pools(pact.pools.values())
+    engine = FarmAprEngine(table, {0: algo_usd_price})
+
+    farms = pact.farming.fetch_farms(farm_ids)
+    aprs = engine.get_aprs(farms, round=last_round)
+"""
+
+from typing import Mapping, Optional, Sequence
+
+from ..pool_table import PoolTable
+from ..utils import require_numpy
+from .farm import MAX_REWARD_ASSETS, Farm
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+
+class FarmAprEngine:
+    """Computes the APR of farms from the prices of the assets in the pool table.
+
+    Deriving the prices walks the whole pool graph, so they are cached for the round they were computed at. The table must be updated and the cache invalidated by the caller when the pool reserves change, e.g. by passing the new round.
+    """
+
+    pool_table: PoolTable
+    """The pools to take the prices from."""
+
+    anchor_prices: dict[int, float]
+    """The prices of whole units of the anchor assets, see :py:meth:`pactsdk.pool_table.PoolTable.asset_prices`."""
+
+    def __init__(self, pool_table: PoolTable, anchor_prices: Mapping[int, float]):
+        """
+        Args:
+            pool_table: The pools to take the prices from.
+            anchor_prices: The prices of whole units of the assets the other prices are derived from, in the currency of the APR value, keyed by the asset index.
+        """
+        require_numpy()
+        self.pool_table = pool_table
+        self.anchor_prices = dict(anchor_prices)
+        self._prices: Optional[dict[int, float]] = None
+        self._prices_round: Optional[int] = None
+
+    def get_prices(self, round: Optional[int] = None) -> dict[int, float]:
+        """The prices of all the assets reachable from the anchors, including the pools' liquidity tokens.
+
+        Args:
+            round: The round the pool table is current at. The prices are recomputed only if it differs from the round of the cached ones. If None, the prices are always recomputed.
+
+        Returns:
+            Prices of whole asset units, keyed by the asset index.
+        """
+        if round is None or self._prices is None or round != self._prices_round:
+            self._prices = self._compute_prices()
+            self._prices_round = round
+        return self._prices
+
+    def invalidate(self):
+        """Drops the cached prices, e.g. after the anchor prices have changed."""
+        self._prices = None
+        self._prices_round = None
+
+    def get_aprs(
+        self, farms: Sequence[Farm], round: Optional[int] = None
+    ) -> "np.ndarray":
+        """Calculates the current APR of the farms.
+
+        The APR is the yearly value of the rewards distributed at the current rate divided by the value of all the staked tokens.
+
+        Args:
+            farms: The farms to value. The decimals of their assets should be known, e.g. by fetching them with :py:meth:`pactsdk.farming.farming_client.PactFarmingClient.fetch_farms`. The decimals of the assets in the pool table take precedence.
+            round: See :py:meth:`get_prices`.
+
+        Returns:
+            The APR of each farm as a fraction, e.g. 0.25 for 25%. NaN for farms without stake or with an asset missing in the prices.
+        """
+        prices = self.get_prices(round)
+        count = len(farms)
+
+        # The rewards and the reward asset prices, one column for each reward asset slot.
+        rewards = np.zeros((count, MAX_REWARD_ASSETS))
+        reward_prices = np.zeros((count, MAX_REWARD_ASSETS))
+        duration = np.zeros(count)
+        staked = np.zeros(count)
+        staked_prices = np.zeros(count)
+
+        for row, farm in enumerate(farms):
+            state = farm.state
+            duration[row] = state.duration
+            staked[row] = state.total_staked / 10 ** self._get_decimals(
+                state.staked_asset.index, state.staked_asset.decimals
+            )
+            staked_prices[row] = prices.get(state.staked_asset.index, np.nan)
+            for column, asset in enumerate(state.reward_assets):
+                amount = state.pending_rewards.get(asset, 0)
+                if amount == 0:
+                    continue
+                decimals = self._get_decimals(asset.index, asset.decimals)
+                rewards[row, column] = amount / 10**decimals
+                reward_prices[row, column] = prices.get(asset.index, np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rewards_per_second = np.where(
+                duration[:, None] > 0, rewards / duration[:, None], 0.0
+            )
+            yearly_value = (rewards_per_second * reward_prices).sum(
+                axis=1
+            ) * SECONDS_PER_YEAR
+            staked_value = staked * staked_prices
+            return np.where(staked_value > 0, yearly_value / staked_value, np.nan)
+
+    def _compute_prices(self) -> dict[int, float]:
+        table = self.pool_table
+        prices = table.asset_prices(self.anchor_prices)
+        liquidity_prices = table.liquidity_token_prices(prices)
+        for asset_id, price in zip(table.liquidity_asset_id, liquidity_prices):
+            if not np.isnan(price):
+                prices.setdefault(int(asset_id), float(price))
+        return prices
+
+    def _get_decimals(self, asset_id: int, default: int) -> int:
+        asset = self.pool_table.assets.get(asset_id)
+        return default if asset is None else asset.decimals
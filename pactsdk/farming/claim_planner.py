@@ -0,0 +1,191 @@
+"""Packs the reward claims from many farms into as few transaction groups as possible.
+
+Claiming through :py:meth:`pactsdk.farming.escrow.Escrow.build_claim_rewards_tx` takes a group per farm, each with its own gas station call. :py:class:`ClaimPlanner` puts the update and claim transactions of many farms into shared groups with a single gas station call per group, covering the pooled opcode cost of all the updates in the group.
+
+Claimed rewards can be staked right away into other farms of the same user. Each re-stake is put in the same group as the claim of the staked asset, so it's executed atomically with it.
+
+Typical usage example::
+
+    planner = ClaimPlanner(algod.suggested_params())
+    for escrow in escrows:
+        planner.add_claim(escrow)
+    planner.add_restake(pact_escrow, 1_000_000)
+
+    groups = planner.build()
+    print(planner.total_fee)
+    signed_groups = planner.sign(private_key)
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from algosdk import transaction
+
+from ..asset import Asset
+from ..exceptions import PactSdkError
+from ..gas_station import get_gas_station
+from ..group_composer import MAX_GROUP_SIZE, pack_units
+from ..opcode_budget import APP_CALL_BUDGET, OpcodeBudget
+from ..transaction_group import TransactionGroup
+from .escrow import Escrow
+
+
+@dataclass
+class _Unit:
+    """Transactions which must be put in the same group."""
+
+    txs: list[transaction.Transaction] = field(default_factory=list)
+
+    budget: OpcodeBudget = field(default_factory=OpcodeBudget)
+
+
+class ClaimPlanner:
+    """Plans the claims, and optionally the re-stakes, of a single user across many farms."""
+
+    suggested_params: transaction.SuggestedParams
+    """Algorand suggested parameters for transactions."""
+
+    groups: list[TransactionGroup]
+    """Groups created by the last call to :py:meth:`build`."""
+
+    def __init__(self, suggested_params: transaction.SuggestedParams):
+        """
+        Args:
+            suggested_params: Algorand suggested parameters for transactions.
+        """
+        self.suggested_params = suggested_params
+        self.groups = []
+        self._claims: list[tuple[Escrow, Optional[list[Asset]]]] = []
+        self._restakes: list[tuple[Escrow, int]] = []
+        self._changed = True
+
+    def add_claim(
+        self, escrow: Escrow, assets: Optional[list[Asset]] = None
+    ) -> "ClaimPlanner":
+        """Adds a claim of the rewards accrued in the escrow's farm. The farm is updated before the claim.
+
+        Args:
+            escrow: The escrow to claim the rewards for.
+            assets: The reward assets to claim. Defaults to all the farm's reward assets.
+
+        Returns:
+            The planner itself to allow chaining the calls.
+        """
+        self._claims.append((escrow, assets))
+        self._changed = True
+        return self
+
+    def add_restake(self, escrow: Escrow, amount: int) -> "ClaimPlanner":
+        """Adds a stake to the escrow's farm, following the claim of the staked asset if there is one.
+
+        The claimed amount is only known when the group is executed, so the amount should be lower than the estimated rewards, e.g. from :py:meth:`pactsdk.farming.farm.Farm.estimate_accrued_rewards`.
+
+        Args:
+            escrow: The escrow to stake to.
+            amount: The amount of the farm's staked asset to stake.
+
+        Returns:
+            The planner itself to allow chaining the calls.
+        """
+        self._restakes.append((escrow, amount))
+        self._changed = True
+        return self
+
+    def build(self) -> list[TransactionGroup]:
+        """Builds the transactions and packs them into groups.
+
+        Raises:
+            PactSdkError: If there is nothing to build or the escrows belong to different users.
+
+        Returns:
+            List of transaction groups with assigned group ids.
+        """
+        if not self._claims and not self._restakes:
+            raise PactSdkError("Cannot plan an empty list of claims.")
+
+        escrows = [escrow for escrow, _ in self._claims + self._restakes]
+        if len({escrow.user_address for escrow in escrows}) > 1:
+            raise PactSdkError("All the escrows must belong to the same user.")
+        sender = escrows[0].user_address
+
+        units = [
+            self._build_claim_unit(escrow, assets) for escrow, assets in self._claims
+        ]
+        for escrow, amount in self._restakes:
+            source = self._find_claim_of(escrow.farm.staked_asset)
+            if source is None:
+                units.append(_Unit())
+                source = len(units) - 1
+            self._add_stake(units[source], escrow, amount)
+
+        # A place is reserved in each group for the gas station call.
+        bins = pack_units([len(unit.txs) for unit in units], MAX_GROUP_SIZE - 1)
+
+        gas_station = get_gas_station()
+        self.groups = []
+        for unit_indexes in bins:
+            group_units = [units[index] for index in unit_indexes]
+            budget = OpcodeBudget(
+                opcodes=sum(unit.budget.opcodes for unit in group_units),
+                available=sum(unit.budget.available for unit in group_units),
+            )
+            txs = [tx for unit in group_units for tx in unit.txs]
+
+            increase_tx = gas_station.build_increase_opcode_budget_tx(
+                sender, budget, self.suggested_params
+            )
+            if increase_tx is not None:
+                txs.insert(0, increase_tx)
+            self.groups.append(TransactionGroup(txs))
+
+        self._changed = False
+        return self.groups
+
+    @property
+    def total_fee(self) -> int:
+        """The sum of fees of all the transactions in the built groups."""
+        return sum(tx.fee for group in self.groups for tx in group.transactions)
+
+    def sign(self, private_key: str) -> list[list[transaction.SignedTransaction]]:
+        """Signs all the groups. The groups are built first if claims or re-stakes were added after the last :py:meth:`build`.
+
+        Args:
+            private_key: Sign the transactions with this private key.
+
+        Returns:
+            Signed transactions for each of the groups, ready to be sent with `algod.send_transactions`.
+        """
+        if self._changed:
+            self.build()
+        return [group.sign(private_key) for group in self.groups]
+
+    def _build_claim_unit(self, escrow: Escrow, assets: Optional[list[Asset]]) -> _Unit:
+        farm = escrow.farm
+        unit = _Unit()
+        unit.txs.append(farm.build_update_tx(escrow, self.suggested_params))
+        unit.budget.add(farm.get_update_opcode_cost())
+        unit.txs.append(
+            farm.build_claim_rewards_tx(escrow, assets, self.suggested_params)
+        )
+        # The claim uses its own budget, it's not shared with the updates.
+        unit.budget.add(APP_CALL_BUDGET)
+        return unit
+
+    def _add_stake(self, unit: _Unit, escrow: Escrow, amount: int):
+        farm = escrow.farm
+        unit.txs.append(
+            farm.staked_asset.build_transfer_tx(
+                sender=escrow.user_address,
+                receiver=escrow.address,
+                amount=amount,
+                suggested_params=self.suggested_params,
+            )
+        )
+        unit.txs.append(farm.build_update_tx(escrow, self.suggested_params))
+        unit.budget.add(farm.get_update_opcode_cost())
+
+    def _find_claim_of(self, asset: Asset) -> Optional[int]:
+        for index, (escrow, assets) in enumerate(self._claims):
+            if asset in (assets or escrow.farm.state.reward_assets):
+                return index
+        return None
@@ -9,11 +9,12 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 import algosdk
-from algosdk import abi, transaction
+from algosdk import transaction
 from algosdk.v2client.algod import AlgodClient
 
+from ..abi_codec import UINT8, encode_uint16, encode_uint64
 from ..gas_station import get_gas_station
-from ..utils import get_selector, parse_app_state, sp_fee
+from ..utils import parse_app_state, sp_fee
 
 if TYPE_CHECKING:
     from .farm import Farm
@@ -24,10 +25,14 @@ COMPILED_CLEAR_PROGRAM_B64 = "CIEBQw=="
 REKEY_TO_USER_FEE = 2000
 REKEY_TO_CONTRACT_FEE = 1000
 
-CREATE_SIG = get_selector("create(application,application,asset)void")
-UNSTAKE_SIG = get_selector("unstake(asset,uint64,application)void")
-SEND_MESSAGE_SIG = get_selector("send_message(account,string)void")
-WITHDRAW_ALGOS_SIG = get_selector("withdraw_algos()void")
+# create(application,application,asset)void
+CREATE_SIG = bytes.fromhex("38881a71")
+# unstake(asset,uint64,application)void
+UNSTAKE_SIG = bytes.fromhex("78822cf0")
+# send_message(account,string)void
+SEND_MESSAGE_SIG = bytes.fromhex("9be4281b")
+# withdraw_algos()void
+WITHDRAW_ALGOS_SIG = bytes.fromhex("b758d8d1")
 
 
 @dataclass
@@ -175,9 +180,9 @@ class Escrow:
             foreign_assets=[self.farm.staked_asset.index],
             app_args=[
                 UNSTAKE_SIG,
-                abi.UintType(8).encode(0),
-                abi.UintType(64).encode(amount),
-                abi.UintType(8).encode(1),
+                UINT8[0],
+                encode_uint64(amount),
+                UINT8[1],
             ],
             sp=sp_fee(self.suggested_params, 3000),
         )
@@ -198,7 +203,7 @@ class Escrow:
         self, address: str, message: str
     ) -> transaction.Transaction:
         encoded_message = message.encode()
-        note = algosdk.abi.UintType(16).encode(len(encoded_message)) + encoded_message
+        note = encode_uint16(len(encoded_message)) + encoded_message
         return transaction.ApplicationNoOpTxn(
             sender=self.user_address,
             index=self.app_id,
@@ -0,0 +1,105 @@
+"""
+This module contains a cache of the escrow application ids of the farm users.
+
+The escrow of a user in a farm is stored in the user's local state of the farm and doesn't change until the escrow is deleted. Once the id is known, the escrow can be built without any request to the algod.
+"""
+
+import json
+import os
+import threading
+from typing import Iterable, Optional
+
+
+class EscrowDirectory:
+    """Maps the pair of a farm application id and a user address to the id of the user's escrow.
+
+    The directory is thread safe. If a path is given, the entries are loaded from the JSON file on creation and written back on each change.
+
+    The directory is not aware of the escrows being deleted. Call :py:meth:`forget` after the user exits the farm.
+    """
+
+    path: Optional[str]
+    """The JSON file the directory is persisted to, or None for an in-memory directory."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: The JSON file to persist the directory to. Created on the first change if it doesn't exist.
+        """
+        self.path = path
+        self._escrows: dict[tuple[int, str], int] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            for farm_app_id, escrows in data.items():
+                for address, escrow_id in escrows.items():
+                    self._escrows[(int(farm_app_id), address)] = escrow_id
+
+    def __len__(self) -> int:
+        return len(self._escrows)
+
+    def get(self, farm_app_id: int, address: str) -> Optional[int]:
+        """Looks up the escrow of a user.
+
+        Args:
+            farm_app_id: The farm application id.
+            address: The user address.
+
+        Returns:
+            The escrow application id, or None if it's not in the directory.
+        """
+        return self._escrows.get((farm_app_id, address))
+
+    def set(self, farm_app_id: int, address: str, escrow_id: int):
+        """Stores the escrow of a user.
+
+        Args:
+            farm_app_id: The farm application id.
+            address: The user address.
+            escrow_id: The escrow application id.
+        """
+        self.update(farm_app_id, [(address, escrow_id)])
+
+    def update(self, farm_app_id: int, escrows: Iterable[tuple[str, int]]):
+        """Stores the escrows of many users of a farm, writing the file only once.
+
+        Args:
+            farm_app_id: The farm application id.
+            escrows: The pairs of the user address and the escrow application id.
+        """
+        with self._lock:
+            changed = False
+            for address, escrow_id in escrows:
+                key = (farm_app_id, address)
+                if self._escrows.get(key) != escrow_id:
+                    self._escrows[key] = escrow_id
+                    changed = True
+            if changed:
+                self._save()
+
+    def forget(self, farm_app_id: int, address: str):
+        """Removes the escrow of a user, e.g. after it was deleted.
+
+        Args:
+            farm_app_id: The farm application id.
+            address: The user address.
+        """
+        with self._lock:
+            if self._escrows.pop((farm_app_id, address), None) is not None:
+                self._save()
+
+    def _save(self):
+        if self.path is None:
+            return
+
+        data: dict[str, dict[str, int]] = {}
+        for (farm_app_id, address), escrow_id in sorted(self._escrows.items()):
+            data.setdefault(str(farm_app_id), {})[address] = escrow_id
+
+        # Written to a temporary file first, so that a crash doesn't leave a truncated file.
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
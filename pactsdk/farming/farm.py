@@ -3,38 +3,56 @@ This module container utilities for interacting with the farm contract.
 """
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 import algosdk
-from algosdk import abi, transaction
+from algosdk import transaction
 from algosdk.v2client.algod import AlgodClient
 
-from pactsdk.asset import Asset, fetch_asset_by_index
+from pactsdk.asset import Asset, fetch_asset_by_index, fetch_assets_by_indexes
 
+from ..abi_codec import UINT8, encode_uint64, encode_uint64_array
 from ..encoding import deserialize_uint64
 from ..gas_station import get_gas_station
-from ..utils import get_selector, parse_app_state, sp_fee
-from .escrow import Escrow, build_deploy_escrow_txs, fetch_escrow_by_id
+from ..opcode_budget import OpcodeBudget, get_farm_update_cost
+from ..utils import parse_app_state, sp_fee
+from .escrow import (
+    Escrow,
+    EscrowInternalState,
+    build_deploy_escrow_txs,
+    fetch_escrow_by_id,
+)
+from .escrow_directory import EscrowDirectory
 from .farm_state import (
     FarmingRewards,
     FarmInternalState,
     FarmState,
     FarmUserState,
+    calculate_accrued_amount,
     format_rewards,
-    format_rpt,
+    format_rpt_fixed,
     internal_state_to_state,
     parse_internal_state,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 UPDATE_TX_FEE = 3000
 MAX_REWARD_ASSETS = 7
 
-UPDATE_GLOBAL_STATE_SIG = get_selector("update_global_state()void")
-UPDATE_STATE_SIG = get_selector("update_state(application,account,account,asset)void")
-CLAIM_REWARDS_SIG = get_selector("claim_rewards(account,uint64[])void")
-ADD_REWARD_ASSET_SIG = get_selector("add_reward_asset(asset)void")
-DEPOSIT_REWARDS_SIG = get_selector("deposit_rewards(uint64[],uint64)void")
+# update_global_state()void
+UPDATE_GLOBAL_STATE_SIG = bytes.fromhex("359e8255")
+# update_state(application,account,account,asset)void
+UPDATE_STATE_SIG = bytes.fromhex("c3140ae7")
+# claim_rewards(account,uint64[])void
+CLAIM_REWARDS_SIG = bytes.fromhex("4aaea3f2")
+# add_reward_asset(asset)void
+ADD_REWARD_ASSET_SIG = bytes.fromhex("948cf580")
+# deposit_rewards(uint64[],uint64)void
+DEPOSIT_REWARDS_SIG = bytes.fromhex("6fe81b9b")
 
 
 def fetch_farm_raw_state_by_id(algod: AlgodClient, app_id: int) -> dict:
@@ -62,6 +80,57 @@ def fetch_farm_by_id(algod: AlgodClient, app_id: int):
     return make_farm_from_raw_state(algod, app_id, raw_state)
 
 
+def fetch_farms_by_ids(
+    algod: AlgodClient, app_ids: Iterable[int], max_workers=8
+) -> list["Farm"]:
+    """Fetches many farms concurrently, with the real metadata of all their assets.
+
+    The global states are fetched in parallel. Then the staked and reward assets of all the farms are deduplicated and fetched in parallel too, each asset once. Unlike :py:func:`fetch_farm_by_id`, the assets of the returned farms have the correct decimals, names and unit names.
+
+    Args:
+        algod: The Algorand client to use.
+        app_ids: The farm application ids.
+        max_workers: The maximum number of concurrent requests.
+
+    Returns:
+        The farms in the order of the app ids.
+    """
+    app_ids = list(app_ids)
+    if not app_ids:
+        return []
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        raw_states = list(
+            executor.map(
+                lambda app_id: fetch_farm_raw_state_by_id(algod, app_id), app_ids
+            )
+        )
+        internal_states = [parse_internal_state(raw_state) for raw_state in raw_states]
+        asset_ids = [
+            asset_id
+            for internal_state in internal_states
+            for asset_id in [
+                internal_state.staked_asset_id,
+                *internal_state.reward_asset_ids,
+            ]
+        ]
+        fetch_assets_by_indexes(algod, asset_ids, executor)
+
+    # The assets are in the cache now, so the states are built with the real ones.
+    return [
+        Farm(
+            algod=algod,
+            app_id=app_id,
+            raw_state=raw_state,
+            internal_state=internal_state,
+            state=internal_state_to_state(algod, internal_state),
+        )
+        for app_id, raw_state, internal_state in zip(
+            app_ids, raw_states, internal_states
+        )
+    ]
+
+
 @dataclass
 class Farm:
     algod: AlgodClient
@@ -78,6 +147,9 @@ class Farm:
 
     _suggested_params: Optional[algosdk.transaction.SuggestedParams] = None
 
+    round: Optional[int] = None
+    """The round at which the state was known to be current. None if it's unknown."""
+
     app_address: str = field(init=False)
 
     def __post_init__(self):
@@ -145,23 +217,138 @@ class Farm:
     def fetch_escrow_by_id(self, app_id: int) -> Escrow:
         return fetch_escrow_by_id(self.algod, app_id, farm=self)
 
-    def fetch_escrow_by_address(self, address: str) -> Optional[Escrow]:
+    def fetch_escrow_by_address(
+        self, address: str, directory: Optional[EscrowDirectory] = None
+    ) -> Optional[Escrow]:
+        """Fetches the escrow of a user.
+
+        Args:
+            address: The user address.
+            directory: The directory to look the escrow up in first. If the escrow is found there, no request is made. Otherwise the escrow id is read from the user's local state and stored in the directory.
+
+        Returns:
+            The escrow or None if the user doesn't participate in the farm.
+        """
+        if directory is not None:
+            return self.fetch_escrows([address], directory)[address]
+
         user_state = self.fetch_user_state(address)
         if user_state is None:
             return None
         return fetch_escrow_by_id(self.algod, user_state.escrow_id, farm=self)
 
+    def fetch_escrows(
+        self,
+        addresses: Iterable[str],
+        directory: Optional[EscrowDirectory] = None,
+        max_workers=8,
+    ) -> dict[str, Optional[Escrow]]:
+        """Resolves the escrows of many users concurrently.
+
+        The escrow ids missing in the directory are read from the users' local states in parallel. The escrows are built from the ids directly, the local state of the farm already proves which user and farm they belong to.
+
+        Args:
+            addresses: The user addresses.
+            directory: The directory to look the escrows up in first and to store the resolved ones to.
+            max_workers: The maximum number of concurrent requests.
+
+        Returns:
+            The escrows keyed by the user address. None for the users that don't participate in the farm.
+        """
+        addresses = list(dict.fromkeys(addresses))
+
+        escrow_ids: dict[str, int] = {}
+        missing = []
+        for address in addresses:
+            escrow_id = directory.get(self.app_id, address) if directory else None
+            if escrow_id is None:
+                missing.append(address)
+            else:
+                escrow_ids[address] = escrow_id
+
+        if missing:
+            with ThreadPoolExecutor(min(len(missing), max_workers)) as executor:
+                user_states = list(executor.map(self.fetch_user_state, missing))
+            found = [
+                (address, user_state.escrow_id)
+                for address, user_state in zip(missing, user_states)
+                if user_state is not None
+            ]
+            if directory is not None:
+                directory.update(self.app_id, found)
+            escrow_ids.update(found)
+
+        return {
+            address: self.make_escrow(escrow_ids[address], address)
+            if address in escrow_ids
+            else None
+            for address in addresses
+        }
+
+    def make_escrow(self, app_id: int, user_address: str) -> Escrow:
+        """Builds the escrow object without fetching it.
+
+        Args:
+            app_id: The escrow application id. Must be the escrow of the user in this farm, e.g. as stored in the user's local state.
+            user_address: The owner of the escrow.
+
+        Returns:
+            The escrow.
+        """
+        return Escrow(
+            algod=self.algod,
+            app_id=app_id,
+            farm=self,
+            user_address=user_address,
+            state=EscrowInternalState(master_app=self.app_id),
+        )
+
     def fetch_escrow_from_account_info(self, account_info: dict) -> Optional[Escrow]:
         user_state = self.get_user_state_from_account_info(account_info)
         if user_state is None:
             return None
         return fetch_escrow_by_id(self.algod, user_state.escrow_id, farm=self)
 
-    def update_state(self):
-        app_info = self.algod.application_info(self.app_id)
-        self.raw_state = parse_app_state(app_info["params"]["global-state"])
-        self.internal_state = parse_internal_state(self.raw_state)
-        self.state = internal_state_to_state(self.algod, self.internal_state)
+    def update_state(self, round: Optional[int] = None):
+        """Refetches and reparses the global state.
+
+        Args:
+            round: The round the state is current at, stored in :py:attr:`round`. Usually the last round known to the caller. If not provided, the previous round is kept, as the new state includes all the changes up to it too.
+        """
+        if round is None:
+            round = self.round
+        self.set_raw_state(fetch_farm_raw_state_by_id(self.algod, self.app_id), round)
+
+    def update_state_if_changed(self, round: Optional[int] = None) -> bool:
+        """Refetches the global state, but reparses it only if it has changed since the last update.
+
+        Args:
+            round: The same as in :py:meth:`update_state`.
+
+        Returns:
+            True if the state has changed.
+        """
+        if round is None:
+            round = self.round
+        raw_state = fetch_farm_raw_state_by_id(self.algod, self.app_id)
+        if raw_state == self.raw_state:
+            self.round = round
+            return False
+        self.set_raw_state(raw_state, round)
+        return True
+
+    def set_raw_state(self, raw_state: dict, round: Optional[int] = None):
+        """Replaces the state with the one parsed from the raw global state.
+
+        Args:
+            raw_state: The global state parsed with :py:func:`pactsdk.utils.parse_app_state`.
+            round: The same as in :py:meth:`update_state`.
+        """
+        internal_state = parse_internal_state(raw_state)
+        self.raw_state = raw_state
+        self.internal_state = internal_state
+        self.state = internal_state_to_state(self.algod, internal_state)
+        self.round = round
 
     def fetch_user_state(self, address: str) -> Optional[FarmUserState]:
         account_info = self.algod.account_info(address)
@@ -181,10 +368,19 @@ class Farm:
         except StopIteration:
             return None
 
-        rpt = format_rpt(
-            deserialize_uint64(raw_state["RPT"]),
-            deserialize_uint64(raw_state["RPT_frac"]),
-        )
+        return self.get_user_state_from_local_state(raw_state)
+
+    def get_user_state_from_local_state(self, raw_state: dict) -> FarmUserState:
+        """Parses the user state from the account's local state of the farm.
+
+        Args:
+            raw_state: The local state, parsed with :py:func:`pactsdk.utils.parse_app_state`.
+
+        Returns:
+            The user state.
+        """
+        rpt_whole = deserialize_uint64(raw_state["RPT"])
+        rpt_frac = deserialize_uint64(raw_state["RPT_frac"])
 
         return FarmUserState(
             escrow_id=raw_state["EscrowID"],
@@ -197,7 +393,9 @@ class Farm:
                 self.state.reward_assets,
                 deserialize_uint64(raw_state["ClaimedRewards"]),
             ),
-            rpt=format_rewards(self.state.reward_assets, rpt),
+            rpt_fixed=format_rewards(
+                self.state.reward_assets, format_rpt_fixed(rpt_whole, rpt_frac)
+            ),
         )
 
     def estimate_accrued_rewards(
@@ -206,7 +404,7 @@ class Farm:
         user_state: FarmUserState,
     ) -> FarmingRewards[int]:
         past_accrued_rewards = self._calculate_past_accrued_rewards(
-            staked_amount=user_state.staked, user_rpt=user_state.rpt
+            staked_amount=user_state.staked, user_rpt_fixed=user_state.rpt_fixed
         )
 
         estimated_rewards = self.simulate_accrued_rewards(
@@ -235,45 +433,86 @@ class Farm:
         total_staked: int,
         extrapolate_future_rewards=False,
     ) -> FarmingRewards[int]:
-        duration = int((at_time - self.state.updated_at).total_seconds())
-
         if total_staked == 0:
             return {asset: 0 for asset in self.state.reward_assets}
 
         stake_ratio = staked_amount / total_staked
 
-        # Simulate pending rewards.
-        rewards = self._simulate_cycle_rewards(
-            stake_ratio=stake_ratio,
-            rewards=self.state.pending_rewards,
-            stake_duration=duration,
-            cycle_duration=self.state.duration,
+        rewards: FarmingRewards[int] = {asset: 0 for asset in self.state.reward_assets}
+        for cycle_rewards, stake_duration, cycle_duration in self.get_reward_cycles(
+            at_time, extrapolate_future_rewards
+        ):
+            rewards_cycle = self._simulate_cycle_rewards(
+                stake_ratio=stake_ratio,
+                rewards=cycle_rewards,
+                stake_duration=stake_duration,
+                cycle_duration=cycle_duration,
+            )
+            rewards = self._sum_rewards(rewards, rewards_cycle)
+
+        return rewards
+
+    def project_rewards(
+        self,
+        staked_amount: int,
+        times: Any,
+        total_staked: Optional[int] = None,
+        extrapolate_future_rewards=True,
+    ) -> "np.ndarray":
+        """The rewards accrued by a staker at many points in time, computed at once. Requires NumPy.
+
+        See :py:func:`pactsdk.farming.rewards_batch.project_rewards` for the details.
+
+        Args:
+            staked_amount: The amount staked by the user.
+            times: The times to simulate the rewards at, as unix timestamps or datetimes.
+            total_staked: The total amount staked in the farm. Defaults to the farm's total staked plus the staked amount, i.e. the user is a new staker.
+            extrapolate_future_rewards: See :py:meth:`get_reward_cycles`.
+
+        Returns:
+            The rewards with a row for each time and a column for each reward asset.
+        """
+        from .rewards_batch import project_rewards
+
+        return project_rewards(
+            self, staked_amount, times, total_staked, extrapolate_future_rewards
         )
 
+    def get_reward_cycles(
+        self, at_time: datetime.datetime, extrapolate_future_rewards=False
+    ) -> list[tuple[FarmingRewards[int], int, int]]:
+        """Splits the time since the last update into the reward cycles it spans: the pending one, the next one and optionally the extrapolated future.
+
+        Args:
+            at_time: The end of the simulated period.
+            extrapolate_future_rewards: If True, the time after the known cycles is assumed to distribute rewards at the rate of the last known cycle.
+
+        Returns:
+            The rewards, the staking time and the duration of each cycle.
+        """
+        duration = int((at_time - self.state.updated_at).total_seconds())
+
+        # Pending rewards.
+        cycles = [(self.state.pending_rewards, duration, self.state.duration)]
+
         duration -= self.state.duration
         if duration <= 0:
-            return rewards
+            return cycles
 
         if self.state.next_duration:
-            # Simulate next rewards if needed.
-            rewards_b = self._simulate_cycle_rewards(
-                stake_ratio=stake_ratio,
-                rewards=self.state.next_rewards,
-                stake_duration=duration,
-                cycle_duration=self.state.next_duration,
-            )
-            rewards = self._sum_rewards(rewards, rewards_b)
+            # Next rewards.
+            cycles.append((self.state.next_rewards, duration, self.state.next_duration))
 
             duration -= self.state.next_duration
             if duration <= 0:
-                return rewards
+                return cycles
 
         if not extrapolate_future_rewards:
-            return rewards
+            return cycles
 
         next_duration = self.state.next_duration or self.state.duration
         if next_duration == 0:
-            return rewards
+            return cycles
 
         next_rewards = (
             self.state.next_rewards
@@ -285,15 +524,9 @@ class Farm:
             for asset, amount in next_rewards.items()
         }
 
-        # Extrapolate rewards for the future.
-        rewards_c = self._simulate_cycle_rewards(
-            stake_ratio=stake_ratio,
-            rewards=next_next_rewards,
-            stake_duration=duration,
-            cycle_duration=duration,
-        )
-
-        return self._sum_rewards(rewards, rewards_c)
+        # Future rewards.
+        cycles.append((next_next_rewards, duration, duration))
+        return cycles
 
     def _simulate_cycle_rewards(
         self,
@@ -317,14 +550,12 @@ class Farm:
     def _calculate_past_accrued_rewards(
         self,
         staked_amount: int,
-        user_rpt: FarmingRewards[float],
+        user_rpt_fixed: FarmingRewards[int],
     ) -> FarmingRewards[int]:
         return {
-            asset: int(
-                (
-                    max(0, self.state.rpt.get(asset, 0) - user_rpt.get(asset, 0))
-                    * staked_amount
-                )
+            asset: calculate_accrued_amount(
+                self.state.rpt_fixed.get(asset, 0) - user_rpt_fixed.get(asset, 0),
+                staked_amount,
             )
             for asset in self.state.reward_assets
         }
@@ -345,18 +576,26 @@ class Farm:
             suggested_params=self.suggested_params,
         )
 
+    def get_update_opcode_cost(
+        self, at_time: Optional[datetime.datetime] = None
+    ) -> int:
+        """Predicts the opcode cost of the farm update. Useful for sharing a single budget increase between several operations, see :py:class:`pactsdk.opcode_budget.OpcodeBudget`.
+
+        Args:
+            at_time: The time of the update. Defaults to now.
+
+        Returns:
+            The opcode cost.
+        """
+        return get_farm_update_cost(self.state, at_time)
+
     def build_update_increase_opcode_quota_tx(
         self, sender: str
     ) -> Optional[transaction.Transaction]:
-        seconds_passed = (datetime.datetime.now() - self.state.updated_at).seconds
-        opcodes_cost = 671 if seconds_passed > self.state.duration > 0 else 513
-        count = (opcodes_cost * len(self.state.reward_assets)) // 700
-        if count == 0:
-            return None
-
-        return get_gas_station().build_increase_opcode_quota_tx(
+        budget = OpcodeBudget().add(self.get_update_opcode_cost())
+        return get_gas_station().build_increase_opcode_budget_tx(
             sender=sender,
-            count=count,
+            budget=budget,
             suggested_params=self.suggested_params,
         )
 
@@ -372,7 +611,12 @@ class Farm:
 
         return txs
 
-    def build_update_tx(self, escrow: Escrow) -> transaction.Transaction:
+    def build_update_tx(
+        self,
+        escrow: Escrow,
+        suggested_params: Optional[transaction.SuggestedParams] = None,
+    ) -> transaction.Transaction:
+        suggested_params = suggested_params or self.suggested_params
         return transaction.ApplicationNoOpTxn(
             sender=escrow.user_address,
             index=self.app_id,
@@ -381,17 +625,21 @@ class Farm:
             accounts=[escrow.address],
             app_args=[
                 UPDATE_STATE_SIG,
-                abi.UintType(8).encode(1),
-                abi.UintType(8).encode(1),
-                abi.UintType(8).encode(0),
-                abi.UintType(8).encode(0),
+                UINT8[1],
+                UINT8[1],
+                UINT8[0],
+                UINT8[0],
             ],
-            sp=sp_fee(self.suggested_params, UPDATE_TX_FEE),
+            sp=sp_fee(suggested_params, UPDATE_TX_FEE),
         )
 
     def build_claim_rewards_tx(
-        self, escrow: Escrow, assets: Optional[list[Asset]] = None
+        self,
+        escrow: Escrow,
+        assets: Optional[list[Asset]] = None,
+        suggested_params: Optional[transaction.SuggestedParams] = None,
     ) -> transaction.Transaction:
+        suggested_params = suggested_params or self.suggested_params
         if assets is None:
             assets = self.state.reward_assets
 
@@ -404,12 +652,12 @@ class Farm:
             accounts=[escrow.user_address],
             app_args=[
                 CLAIM_REWARDS_SIG,
-                abi.UintType(8).encode(0),
-                abi.ArrayDynamicType(abi.UintType(64)).encode(
+                UINT8[0],
+                encode_uint64_array(
                     [self.state.reward_assets.index(asset) for asset in assets]
                 ),
             ],
-            sp=sp_fee(self.suggested_params, 1000 * (number_of_assets + 1)),
+            sp=sp_fee(suggested_params, 1000 * (number_of_assets + 1)),
         )
 
     def build_update_global_state_tx(self, sender: str):
@@ -485,10 +733,10 @@ class Farm:
 
         app_args = [
             DEPOSIT_REWARDS_SIG,
-            abi.ArrayDynamicType(abi.UintType(64)).encode(
+            encode_uint64_array(
                 [self.state.reward_assets.index(asset) for asset in foreign_assets]
             ),
-            abi.UintType(64).encode(duration),
+            encode_uint64(duration),
         ]
 
         deposit_rewards_tx = transaction.ApplicationNoOpTxn(
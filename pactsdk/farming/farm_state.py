@@ -13,6 +13,9 @@ T = TypeVar("T", bound=Union[int, float])
 
 FarmingRewards = dict[Asset, T]
 
+RPT_SCALE = 2**64
+"""The denominator of the fixed-point rate per token. The contract stores the rate as a whole and a fractional 64-bit word, i.e. a 128-bit numerator over 2^64."""
+
 
 @dataclass()
 class FarmInternalState:
@@ -51,8 +54,8 @@ class FarmState:
     pending_rewards: FarmingRewards[int]
     """Amounts of not yet distributed rewards in the farm."""
 
-    rpt: FarmingRewards[float]
-    """Current rate per token for each asset."""
+    rpt_fixed: FarmingRewards[int]
+    """Current rate per token for each asset as an exact fixed-point numerator over :py:data:`RPT_SCALE`."""
 
     duration: int
     """Time in seconds until current cycle ends. This is the time at which the rewards are depleted. Next cycle is automatically picked up if next_rewards are deposited."""
@@ -81,6 +84,11 @@ class FarmState:
     version: int
     """Contract version."""
 
+    @property
+    def rpt(self) -> FarmingRewards[float]:
+        """Current rate per token for each asset. A float approximation of :py:attr:`rpt_fixed`."""
+        return _fixed_to_rpts(self.rpt_fixed)
+
     @property
     def rewards_per_second(self) -> FarmingRewards[float]:
         return {
@@ -103,8 +111,13 @@ class FarmUserState:
     claimed_rewards: FarmingRewards[int]
     """Amounts of rewards the user has already claimed."""
 
-    rpt: FarmingRewards[float]
-    """Current rate per token for each asset."""
+    rpt_fixed: FarmingRewards[int]
+    """Current rate per token for each asset as an exact fixed-point numerator over :py:data:`RPT_SCALE`."""
+
+    @property
+    def rpt(self) -> FarmingRewards[float]:
+        """Current rate per token for each asset. A float approximation of :py:attr:`rpt_fixed`."""
+        return _fixed_to_rpts(self.rpt_fixed)
 
 
 def parse_internal_state(raw_state: dict) -> FarmInternalState:
@@ -140,7 +153,7 @@ def internal_state_to_state(
         for asset_id in internal_state.reward_asset_ids
     ]
 
-    rpt = format_rpt(internal_state.rpt, internal_state.rpt_frac)
+    rpt_fixed = format_rpt_fixed(internal_state.rpt, internal_state.rpt_frac)
 
     return FarmState(
         staked_asset=staked_asset,
@@ -151,7 +164,7 @@ def internal_state_to_state(
         claimed_rewards=format_rewards(reward_assets, internal_state.claimed_rewards),
         pending_rewards=format_rewards(reward_assets, internal_state.pending_rewards),
         next_rewards=format_rewards(reward_assets, internal_state.next_rewards),
-        rpt=format_rewards(reward_assets, rpt),
+        rpt_fixed=format_rewards(reward_assets, rpt_fixed),
         duration=internal_state.duration,
         next_duration=internal_state.next_duration,
         num_stakers=internal_state.num_stakers,
@@ -170,3 +183,28 @@ def format_rewards(assets: list[Asset], amounts: list[T]) -> FarmingRewards[T]:
 def format_rpt(rpt_whole: list[int], rpt_frac: list[int]) -> list[float]:
     assert len(rpt_whole) == len(rpt_frac)
     return [whole + frac / 2**64 for whole, frac in zip(rpt_whole, rpt_frac)]
+
+
+def format_rpt_fixed(rpt_whole: list[int], rpt_frac: list[int]) -> list[int]:
+    assert len(rpt_whole) == len(rpt_frac)
+    return [whole * RPT_SCALE + frac for whole, frac in zip(rpt_whole, rpt_frac)]
+
+
+def rpt_from_fixed(rpt_fixed: int) -> float:
+    """Converts the fixed-point numerator to a float rate per token, the same as :py:func:`format_rpt`."""
+    whole, frac = divmod(rpt_fixed, RPT_SCALE)
+    return whole + frac / RPT_SCALE
+
+
+def rpt_to_fixed(rpt: float) -> int:
+    """Converts a float rate per token to the fixed-point numerator. Exact for the float value, as the scale is a power of two."""
+    return int(rpt * RPT_SCALE)
+
+
+def calculate_accrued_amount(rpt_delta_fixed: int, staked: int) -> int:
+    """The rewards accrued by a stake while the rate per token grew by the given fixed-point delta, rounded down like in the contract."""
+    return max(0, rpt_delta_fixed) * staked // RPT_SCALE
+
+
+def _fixed_to_rpts(rpt_fixed: FarmingRewards[int]) -> FarmingRewards[float]:
+    return {asset: rpt_from_fixed(value) for asset, value in rpt_fixed.items()}
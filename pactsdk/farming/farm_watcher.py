@@ -0,0 +1,156 @@
+"""Keeps many farms up to date with a single round following loop.
+
+Polling :py:meth:`pactsdk.farming.farm.Farm.update_state` for every farm each round costs a request per farm per round. A farm's global state changes only when the farm application is called, so :py:class:`FarmWatcher` reads each new block once and refetches only the farms called in it.
+
+Typical usage example::
+
+    watcher = FarmWatcher(algod, farms, on_change=lambda farm: print(farm.state))
+    with watcher:
+        ...  # The farms are updated in the background.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+import msgpack
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from ..round_follower import RoundFollower
+from .farm import Farm
+
+logger = logging.getLogger(__name__)
+
+FarmChangeCallback = Callable[[Farm], None]
+"""A callback called with the farm after its state has changed."""
+
+
+class FarmWatcher(RoundFollower):
+    """Updates the watched farms when their global state changes.
+
+    On the first round all the farms are refetched. After that the blocks are scanned for the application calls, including the inner ones, and only the called farms are refetched. If the blocks can't be read, e.g. because too many rounds were skipped, all the farms are refetched with :py:meth:`pactsdk.farming.farm.Farm.update_state_if_changed`.
+
+    The :py:attr:`pactsdk.farming.farm.Farm.round` of all the watched farms is set to the handled round. The farms are updated in place from the watcher's thread, when running in the background.
+    """
+
+    max_scanned_rounds: int
+    """The maximum number of blocks read in a single step. Above that, all the farms are refetched instead."""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        farms: Iterable[Farm] = (),
+        on_change: Optional[FarmChangeCallback] = None,
+        retry_interval=1.0,
+        max_scanned_rounds=10,
+        max_workers=8,
+    ):
+        """
+        Args:
+            algod: The Algorand client to use.
+            farms: The farms to watch.
+            on_change: Called with each farm whose state has changed.
+            retry_interval: Seconds to wait before retrying after a network error in the background loop.
+            max_scanned_rounds: The maximum number of blocks read in a single step.
+            max_workers: The maximum number of concurrent farm requests.
+        """
+        super().__init__(algod, retry_interval)
+        self.max_scanned_rounds = max_scanned_rounds
+        self._on_change = on_change
+        self._max_workers = max_workers
+        self._farms: dict[int, Farm] = {farm.app_id: farm for farm in farms}
+        self._lock = threading.Lock()
+        self._updated_round: Optional[int] = None
+
+    def __len__(self) -> int:
+        """The number of the watched farms."""
+        return len(self._farms)
+
+    def add(self, farm: Farm):
+        """Starts watching a farm. The farm is refetched in the next round.
+
+        Args:
+            farm: The farm to watch.
+        """
+        with self._lock:
+            self._farms[farm.app_id] = farm
+            farm.round = None
+
+    def remove(self, farm: Farm):
+        """Stops watching a farm.
+
+        Args:
+            farm: The watched farm.
+        """
+        with self._lock:
+            self._farms.pop(farm.app_id, None)
+
+    def on_round(self, round: int):
+        """Refetches the farms changed since the previous round.
+
+        Args:
+            round: The last committed round.
+        """
+        with self._lock:
+            farms = list(self._farms.values())
+
+        called_app_ids = self._fetch_called_app_ids(round)
+        to_update = [
+            farm
+            for farm in farms
+            if farm.round is None
+            or called_app_ids is None
+            or farm.app_id in called_app_ids
+        ]
+
+        if to_update:
+            workers = min(len(to_update), self._max_workers)
+            with ThreadPoolExecutor(workers) as executor:
+                changed = list(
+                    executor.map(
+                        lambda farm: farm.update_state_if_changed(round), to_update
+                    )
+                )
+        else:
+            changed = []
+
+        for farm in farms:
+            farm.round = round
+        self._updated_round = round
+
+        if self._on_change is not None:
+            for farm, farm_changed in zip(to_update, changed):
+                if farm_changed:
+                    self._on_change(farm)
+
+    def _fetch_called_app_ids(self, round: int) -> Optional[set[int]]:
+        """The ids of the applications called since the last handled round, or None if unknown."""
+        if self._updated_round is None:
+            return None
+
+        rounds = range(self._updated_round + 1, round + 1)
+        if len(rounds) > self.max_scanned_rounds:
+            return None
+
+        app_ids: set[int] = set()
+        try:
+            for block_round in rounds:
+                raw_block = self.algod.block_info(
+                    block_round, response_format="msgpack"
+                )
+                block = msgpack.unpackb(raw_block, raw=False, strict_map_key=False)
+                _collect_app_ids(block["block"].get("txns", []), app_ids)
+        except AlgodHTTPError as e:
+            logger.warning(f"Reading the blocks failed: {e}. Refetching all farms.")
+            return None
+        return app_ids
+
+
+def _collect_app_ids(signed_txs: list, app_ids: set[int]):
+    for signed_tx in signed_txs:
+        app_id = signed_tx.get("txn", {}).get("apid")
+        if app_id:
+            app_ids.add(app_id)
+        _collect_app_ids(signed_tx.get("dt", {}).get("itxn", []), app_ids)
@@ -1,8 +1,11 @@
+from typing import Iterable, Optional
+
 from algosdk.v2client.algod import AlgodClient
 
 from ..config import Config
 from .escrow import Escrow, fetch_escrow_by_id
-from .farm import Farm, fetch_farm_by_id
+from .escrow_directory import EscrowDirectory
+from .farm import Farm, fetch_farm_by_id, fetch_farms_by_ids
 
 
 class PactFarmingClient:
@@ -13,16 +16,46 @@ class PactFarmingClient:
 
     config: Config
 
-    def __init__(self, algod: AlgodClient, config: Config):
+    escrow_directory: EscrowDirectory
+    """The cache of the users' escrow ids used by :py:meth:`fetch_escrows`."""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        config: Config,
+        escrow_directory: Optional[EscrowDirectory] = None,
+    ):
         """
         Args:
             algod: Algorand client to work with.
+            escrow_directory: The cache of the users' escrow ids. Pass a directory with a path to persist it between the runs. By default an in-memory one is used.
         """
         self.algod = algod
         self.config = config
+        self.escrow_directory = (
+            EscrowDirectory() if escrow_directory is None else escrow_directory
+        )
 
     def fetch_farm_by_id(self, app_id: int) -> Farm:
         return fetch_farm_by_id(algod=self.algod, app_id=app_id)
 
-    def fetch_escrow_by_id(self, app_id: int) -> Escrow:
-        return fetch_escrow_by_id(algod=self.algod, app_id=app_id)
+    def fetch_farms(self, app_ids: Iterable[int], max_workers=8) -> list[Farm]:
+        """Fetches many farms concurrently. See :py:func:`pactsdk.farming.farm.fetch_farms_by_ids`."""
+        return fetch_farms_by_ids(
+            algod=self.algod, app_ids=app_ids, max_workers=max_workers
+        )
+
+    def fetch_escrow_by_id(self, app_id: int, farm: Optional[Farm] = None) -> Escrow:
+        return fetch_escrow_by_id(algod=self.algod, app_id=app_id, farm=farm)
+
+    def fetch_escrow_by_address(self, farm: Farm, address: str) -> Optional[Escrow]:
+        """Fetches the escrow of a user, using the client's escrow directory. See :py:meth:`pactsdk.farming.farm.Farm.fetch_escrow_by_address`."""
+        return farm.fetch_escrow_by_address(address, self.escrow_directory)
+
+    def fetch_escrows(
+        self, farm: Farm, addresses: Iterable[str], max_workers=8
+    ) -> dict[str, Optional[Escrow]]:
+        """Resolves the escrows of many users concurrently, using the client's escrow directory. See :py:meth:`pactsdk.farming.farm.Farm.fetch_escrows`."""
+        return farm.fetch_escrows(
+            addresses, self.escrow_directory, max_workers=max_workers
+        )
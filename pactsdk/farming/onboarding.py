@@ -0,0 +1,213 @@
+"""Deploys the escrows of many users to a farm and stakes their tokens.
+
+Joining a farm takes two steps: deploying the user's escrow and, once the escrow id is known, staking through it. :py:class:`OnboardingPipeline` runs both steps for a batch of users over a :py:class:`pactsdk.submission_pipeline.SubmissionPipeline`. The escrow ids are read from the confirmations tracked by the pipeline's single round following loop, and each stake is sent as soon as its escrow is deployed.
+
+Typical usage example::
+
+    users = [(address, private_key, 1_000_000), ...]
+    with OnboardingPipeline(algod, farm, algod.suggested_params()) as onboarding:
+        results = onboarding.onboard(users)
+
+    for result in results:
+        if result.status == "failed":
+            print(result.address, result.error)
+"""
+
+from concurrent.futures import Future, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Literal, Optional
+
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+from ..submission_pipeline import SubmissionPipeline
+from ..transaction_group import SigningKey, TransactionGroup
+from .escrow import Escrow, build_deploy_escrow_txs
+from .escrow_directory import EscrowDirectory
+from .farm import Farm
+
+OnboardingStatus = Literal[
+    "pending", "deploying", "deployed", "staking", "staked", "failed"
+]
+
+CREATE_ESCROW_TX_INDEX = 1
+"""The index of the escrow creation in the group built by :py:func:`pactsdk.farming.escrow.build_deploy_escrow_txs`."""
+
+
+@dataclass
+class Onboarding:
+    """The progress of a single user."""
+
+    address: str
+    """The user address."""
+
+    stake_amount: int
+    """The amount of the farm's staked asset to stake once the escrow is deployed. Zero to only deploy the escrow."""
+
+    status: OnboardingStatus = "pending"
+    """The current step. The final ones are "deployed" when there is nothing to stake, "staked" and "failed"."""
+
+    escrow: Optional[Escrow] = None
+    """The user's escrow, once it's deployed."""
+
+    error: Optional[BaseException] = None
+    """The reason of the failure."""
+
+
+class OnboardingPipeline:
+    """Deploys the escrows and stakes for many users with a bounded number of groups in flight."""
+
+    farm: Farm
+    """The farm the users join."""
+
+    suggested_params: transaction.SuggestedParams
+    """Algorand suggested parameters for transactions. They are also set to the farm and the escrows."""
+
+    pipeline: SubmissionPipeline
+    """The pipeline sending the groups."""
+
+    escrow_directory: Optional[EscrowDirectory]
+    """If set, the users with a known escrow only stake and the new escrows are stored in it."""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        farm: Farm,
+        suggested_params: transaction.SuggestedParams,
+        max_in_flight=16,
+        workers=4,
+        escrow_directory: Optional[EscrowDirectory] = None,
+        pipeline: Optional[SubmissionPipeline] = None,
+    ):
+        """
+        Args:
+            algod: The Algorand client to use.
+            farm: The farm the users join.
+            suggested_params: Algorand suggested parameters for transactions.
+            max_in_flight: The maximum number of groups sent but not yet confirmed.
+            workers: The number of threads signing and sending the groups.
+            escrow_directory: The directory to look the existing escrows up in and to store the new ones to.
+            pipeline: A pipeline to send the groups with. If not provided, the onboarding creates and closes its own.
+        """
+        self.farm = farm
+        self.suggested_params = suggested_params
+        self.escrow_directory = escrow_directory
+        self._owns_pipeline = pipeline is None
+        self.pipeline = pipeline or SubmissionPipeline(
+            algod, max_in_flight=max_in_flight, workers=workers
+        )
+        farm.set_suggested_params(suggested_params)
+
+    def onboard(self, users: Iterable[tuple[str, SigningKey, int]]) -> list[Onboarding]:
+        """Deploys the escrows of the users and stakes their tokens. Blocks until all the users are done.
+
+        The failures are reported in the results, so one user can't stop the others.
+
+        Args:
+            users: The address, the signing key and the stake amount of each user.
+
+        Returns:
+            The outcome for each user, in the order of `users`.
+        """
+        results: list[Onboarding] = []
+        signers: dict[str, SigningKey] = {}
+        deploys: dict["Future[dict]", Onboarding] = {}
+        stakes: dict["Future[dict]", Onboarding] = {}
+
+        for address, signer, stake_amount in users:
+            onboarding = Onboarding(address, stake_amount)
+            results.append(onboarding)
+            signers[address] = signer
+
+            known_escrow_id = (
+                self.escrow_directory.get(self.farm.app_id, address)
+                if self.escrow_directory is not None
+                else None
+            )
+            if known_escrow_id is not None:
+                self._set_escrow(onboarding, known_escrow_id)
+                self._stake(onboarding, signer, stakes)
+                continue
+
+            onboarding.status = "deploying"
+            try:
+                group = TransactionGroup(
+                    build_deploy_escrow_txs(
+                        sender=address,
+                        farm_app_id=self.farm.app_id,
+                        staked_asset_id=self.farm.staked_asset.index,
+                        suggested_params=self.suggested_params,
+                    )
+                )
+                future = self.pipeline.submit(
+                    group, signer=signer, track_index=CREATE_ESCROW_TX_INDEX
+                )
+            except Exception as e:
+                onboarding.status = "failed"
+                onboarding.error = e
+                continue
+            deploys[future] = onboarding
+
+        for future in as_completed(deploys):
+            onboarding = deploys[future]
+            try:
+                escrow_id = future.result()["application-index"]
+                self._set_escrow(onboarding, escrow_id)
+                if self.escrow_directory is not None:
+                    self.escrow_directory.set(
+                        self.farm.app_id, onboarding.address, escrow_id
+                    )
+            except Exception as e:
+                onboarding.status = "failed"
+                onboarding.error = e
+                continue
+
+            self._stake(onboarding, signers[onboarding.address], stakes)
+
+        for future in as_completed(stakes):
+            onboarding = stakes[future]
+            try:
+                future.result()
+                onboarding.status = "staked"
+            except Exception as e:
+                onboarding.status = "failed"
+                onboarding.error = e
+
+        return results
+
+    def close(self):
+        """Waits for the sent groups and releases the pipeline if it's owned by the onboarding."""
+        if self._owns_pipeline:
+            self.pipeline.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _set_escrow(self, onboarding: Onboarding, escrow_id: int):
+        escrow = self.farm.make_escrow(escrow_id, onboarding.address)
+        escrow.set_suggested_params(self.suggested_params)
+        onboarding.escrow = escrow
+        onboarding.status = "deployed"
+
+    def _stake(
+        self,
+        onboarding: Onboarding,
+        signer: SigningKey,
+        stakes: dict["Future[dict]", Onboarding],
+    ):
+        if onboarding.stake_amount == 0:
+            return
+
+        assert onboarding.escrow is not None
+        onboarding.status = "staking"
+        try:
+            group = TransactionGroup(
+                onboarding.escrow.build_stake_txs(onboarding.stake_amount)
+            )
+            stakes[self.pipeline.submit(group, signer=signer)] = onboarding
+        except Exception as e:
+            onboarding.status = "failed"
+            onboarding.error = e
@@ -0,0 +1,377 @@
+"""Vectorized reward estimation for many stakers of a single farm.
+
+The functions reproduce :py:meth:`pactsdk.farming.farm.Farm.simulate_accrued_rewards` and :py:meth:`pactsdk.farming.farm.Farm.estimate_accrued_rewards` exactly, including the float rounding, but compute all the stakers at once with NumPy.
+
+The stake ratio is computed in float64, which matches the Python division only while the staked amounts are below 2^53. Larger amounts are computed one by one with the single-user methods. The rewards accrued from the rate per token growth are computed exactly with the fixed-point rates, see :py:attr:`pactsdk.farming.farm_state.FarmUserState.rpt_fixed`.
+
+This module requires NumPy. Install it with `pip install pactsdk[numpy]`.
+
+Typical usage example::
+
+    staked, user_rpt, accrued_rewards = stack_user_states(farm, user_states)
+    rewards = estimate_accrued_rewards_batch(
+        farm, datetime.datetime.now(), staked, user_rpt, accrued_rewards
+    )
+    for asset, amounts in rewards.items():
+        ...
+
+    # Cumulative rewards of a new staker over the next 30 days, hour by hour.
+    now = time.time()
+    timeline = project_rewards(farm, amount, now + np.arange(0, 30 * 86400, 3600))
+"""
+
+import datetime
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence
+
+from ..asset import Asset
+from ..utils import require_numpy
+from .farm_state import RPT_SCALE, FarmUserState
+
+if TYPE_CHECKING:
+    from .farm import Farm
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+_MAX_EXACT_FLOAT = 2**53
+"""Integers below this bound convert to float64 exactly."""
+
+RPT_DTYPE = (
+    np.dtype([("whole", np.uint64), ("frac", np.uint64)]) if np is not None else None
+)
+"""The fixed-point rate per token as the whole and the fractional 64-bit words, like in the contract state."""
+
+
+def simulate_accrued_rewards_batch(
+    farm: "Farm",
+    at_time: datetime.datetime,
+    staked_amounts: Any,
+    total_staked: Any,
+    extrapolate_future_rewards=False,
+) -> dict[Asset, "np.ndarray"]:
+    """Vectorized :py:meth:`pactsdk.farming.farm.Farm.simulate_accrued_rewards`.
+
+    Args:
+        farm: The farm to simulate.
+        at_time: The time to simulate the rewards at.
+        staked_amounts: The amount staked by each user.
+        total_staked: The total amount staked in the farm, a single value or one for each user.
+        extrapolate_future_rewards: See :py:meth:`pactsdk.farming.farm.Farm.get_reward_cycles`.
+
+    Returns:
+        An array of rewards for each of the reward assets, with an element for each user. The arrays are int64, or object arrays of Python integers if any value doesn't fit.
+    """
+    require_numpy()
+    staked = np.asarray(staked_amounts)
+    total = np.broadcast_to(np.asarray(total_staked), staked.shape)
+
+    float_staked = staked.astype(np.float64)
+    float_total = total.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stake_ratio = np.where(total == 0, 0.0, float_staked / float_total)
+
+    cycles = farm.get_reward_cycles(at_time, extrapolate_future_rewards)
+
+    rewards: dict[Asset, np.ndarray] = {}
+    for asset in farm.state.reward_assets:
+        asset_rewards = np.zeros(staked.shape, dtype=np.int64)
+        for cycle_rewards, stake_duration, cycle_duration in cycles:
+            if cycle_duration == 0:
+                continue
+            # The same operations in the same order as in `Farm._simulate_cycle_rewards`.
+            stake_duration = min(stake_duration, cycle_duration)
+            cycle_amounts = (stake_ratio * float(cycle_rewards.get(asset, 0))) * (
+                stake_duration / cycle_duration
+            )
+            asset_rewards = _add(asset_rewards, _truncate(cycle_amounts))
+        rewards[asset] = asset_rewards
+
+    inexact = (staked >= _MAX_EXACT_FLOAT) | (total >= _MAX_EXACT_FLOAT)
+    for index in zip(*np.nonzero(inexact & (total != 0))):
+        user_rewards = farm.simulate_accrued_rewards(
+            at_time,
+            int(staked[index]),
+            int(total[index]),
+            extrapolate_future_rewards=extrapolate_future_rewards,
+        )
+        for asset, amount in user_rewards.items():
+            rewards[asset] = _assign(rewards[asset], index, amount)
+
+    return rewards
+
+
+def estimate_accrued_rewards_batch(
+    farm: "Farm",
+    at_time: datetime.datetime,
+    staked_amounts: Any,
+    user_rpt: Mapping[Asset, Any],
+    accrued_rewards: Mapping[Asset, Any],
+) -> dict[Asset, "np.ndarray"]:
+    """Vectorized :py:meth:`pactsdk.farming.farm.Farm.estimate_accrued_rewards`.
+
+    Args:
+        farm: The farm to estimate the rewards in.
+        at_time: The time to estimate the rewards at.
+        staked_amounts: The amount staked by each user.
+        user_rpt: The rate per token of each user, for each of the reward assets, as :py:data:`RPT_DTYPE` arrays returned by :py:func:`stack_user_states`. Float rates and integer fixed-point numerators are converted. Missing assets are treated as zeros.
+        accrued_rewards: The rewards already accrued by each user, for each of the reward assets. Missing assets are treated as zeros.
+
+    Returns:
+        The same as :py:func:`simulate_accrued_rewards_batch`.
+    """
+    require_numpy()
+    staked = np.asarray(staked_amounts)
+
+    rewards = simulate_accrued_rewards_batch(
+        farm, at_time, staked, farm.state.total_staked
+    )
+    for asset in farm.state.reward_assets:
+        # The same as `Farm._calculate_past_accrued_rewards`.
+        past_accrued = _calculate_past_accrued(
+            farm.state.rpt_fixed.get(asset, 0), user_rpt.get(asset, 0), staked
+        )
+
+        asset_accrued = np.broadcast_to(
+            np.asarray(accrued_rewards.get(asset, 0)), staked.shape
+        )
+        rewards[asset] = _add(_add(rewards[asset], asset_accrued), past_accrued)
+
+    return rewards
+
+
+def project_rewards(
+    farm: "Farm",
+    staked_amount: int,
+    times: Any,
+    total_staked: Optional[int] = None,
+    extrapolate_future_rewards=True,
+) -> "np.ndarray":
+    """Vectorized :py:meth:`pactsdk.farming.farm.Farm.simulate_accrued_rewards` over many points in time, for plotting the rewards timeline.
+
+    Args:
+        farm: The farm to simulate.
+        staked_amount: The amount staked by the user.
+        times: The times to simulate the rewards at, as unix timestamps or datetimes.
+        total_staked: The total amount staked in the farm. Defaults to the farm's total staked plus the staked amount, i.e. the user is a new staker.
+        extrapolate_future_rewards: See :py:meth:`pactsdk.farming.farm.Farm.get_reward_cycles`.
+
+    Returns:
+        A 2-D array of the rewards accrued since the last farm update, with a row for each time and a column for each of the farm's reward assets. The array is int64, or an object array of Python integers if any value doesn't fit.
+    """
+    require_numpy()
+    state = farm.state
+    if total_staked is None:
+        total_staked = state.total_staked + staked_amount
+
+    elapsed = _get_elapsed_seconds(farm, times)
+    rewards = np.zeros((len(elapsed), len(state.reward_assets)), dtype=np.int64)
+    if total_staked == 0 or not state.reward_assets:
+        return rewards
+
+    pending = [state.pending_rewards.get(asset, 0) for asset in state.reward_assets]
+    next_ = [state.next_rewards.get(asset, 0) for asset in state.reward_assets]
+    if max(pending + next_) >= _MAX_EXACT_FLOAT:
+        return _project_rewards_slow(
+            farm, staked_amount, total_staked, elapsed, extrapolate_future_rewards
+        )
+
+    # The same cycles as in `Farm.get_reward_cycles`, with the same float operations as in `Farm._simulate_cycle_rewards`.
+    stake_ratio = staked_amount / total_staked
+    pending_amounts = np.array(pending, dtype=np.float64)
+    next_amounts = np.array(next_, dtype=np.float64)
+
+    def simulate_cycle(amounts, stake_duration, cycle_duration, mask):
+        if cycle_duration == 0:
+            return np.zeros(rewards.shape, dtype=np.int64)
+        ratio = np.minimum(stake_duration, cycle_duration) / cycle_duration
+        cycle_rewards = _truncate((stake_ratio * amounts)[None, :] * ratio[:, None])
+        return np.where(mask[:, None], cycle_rewards, 0)
+
+    everywhere = np.ones(len(elapsed), dtype=bool)
+    rewards = _add(
+        rewards,
+        simulate_cycle(pending_amounts, elapsed, state.duration, everywhere),
+    )
+
+    remaining = elapsed - state.duration
+    if state.next_duration:
+        rewards = _add(
+            rewards,
+            simulate_cycle(next_amounts, remaining, state.next_duration, remaining > 0),
+        )
+        remaining = remaining - state.next_duration
+
+    base_duration = state.next_duration or state.duration
+    in_future = remaining > 0
+    if extrapolate_future_rewards and base_duration and np.any(in_future):
+        base_amounts = next_amounts if state.next_duration else pending_amounts
+        future_amounts = _truncate(
+            base_amounts[None, :] * (remaining / base_duration)[:, None]
+        ).astype(np.float64)
+        # The future cycle spans exactly the remaining time, so the duration ratio is 1.
+        future_rewards = _truncate((stake_ratio * future_amounts) * 1.0)
+        rewards = _add(rewards, np.where(in_future[:, None], future_rewards, 0))
+
+    return rewards
+
+
+def stack_user_states(
+    farm: "Farm", user_states: Sequence[FarmUserState]
+) -> tuple["np.ndarray", dict[Asset, "np.ndarray"], dict[Asset, "np.ndarray"]]:
+    """Converts the user states to the arrays taken by :py:func:`estimate_accrued_rewards_batch`.
+
+    Args:
+        farm: The farm of the user states.
+        user_states: The user states.
+
+    Returns:
+        The staked amounts, the fixed-point rates per token as :py:data:`RPT_DTYPE` arrays and the accrued rewards.
+    """
+    require_numpy()
+    staked = np.array([user_state.staked for user_state in user_states])
+    user_rpt = {
+        asset: np.array(
+            [
+                divmod(user_state.rpt_fixed.get(asset, 0), RPT_SCALE)
+                for user_state in user_states
+            ],
+            dtype=RPT_DTYPE,
+        )
+        for asset in farm.state.reward_assets
+    }
+    accrued_rewards = {
+        asset: np.array(
+            [user_state.accrued_rewards.get(asset, 0) for user_state in user_states]
+        )
+        for asset in farm.state.reward_assets
+    }
+    return staked, user_rpt, accrued_rewards
+
+
+def _get_elapsed_seconds(farm: "Farm", times: Any) -> "np.ndarray":
+    """The whole seconds from the last farm update to each of the times, truncated like in `Farm.get_reward_cycles`."""
+    updated_at = farm.state.updated_at
+    times = list(times) if not isinstance(times, np.ndarray) else times
+    if len(times) and isinstance(times[0], datetime.datetime):
+        return np.array(
+            [int((time - updated_at).total_seconds()) for time in times],
+            dtype=np.int64,
+        )
+    timestamps = np.asarray(times, dtype=np.float64)
+    return np.trunc(timestamps - updated_at.timestamp()).astype(np.int64)
+
+
+def _project_rewards_slow(
+    farm: "Farm",
+    staked_amount: int,
+    total_staked: int,
+    elapsed: "np.ndarray",
+    extrapolate_future_rewards: bool,
+) -> "np.ndarray":
+    rows = []
+    for seconds in elapsed:
+        at_time = farm.state.updated_at + datetime.timedelta(seconds=int(seconds))
+        rewards = farm.simulate_accrued_rewards(
+            at_time, staked_amount, total_staked, extrapolate_future_rewards
+        )
+        rows.append([rewards[asset] for asset in farm.state.reward_assets])
+
+    if all(-(2**63) <= value < 2**63 for row in rows for value in row):
+        return np.array(rows, dtype=np.int64).reshape(len(rows), -1)
+    result = np.empty((len(rows), len(farm.state.reward_assets)), dtype=object)
+    result[:] = rows
+    return result
+
+
+def _calculate_past_accrued(
+    farm_rpt: int, user_rpt: Any, staked: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized `max(0, farm_rpt - user_rpt) * staked // RPT_SCALE`, with the rates as fixed-point numerators."""
+    user_words = np.broadcast_to(_to_rpt_words(user_rpt), staked.shape)
+    user_whole, user_frac = user_words["whole"], user_words["frac"]
+    farm_whole, farm_frac = (np.uint64(word) for word in divmod(farm_rpt, RPT_SCALE))
+
+    positive = (user_whole < farm_whole) | (
+        (user_whole == farm_whole) & (user_frac < farm_frac)
+    )
+    # The subtraction of the words wraps around, like a 128-bit subtraction with a borrow.
+    borrow = (user_frac > farm_frac).astype(np.uint64)
+    whole = np.where(positive, farm_whole - user_whole - borrow, np.uint64(0))
+    frac = np.where(positive, farm_frac - user_frac, np.uint64(0))
+
+    staked_words = staked.astype(np.uint64)
+    limit = 2.0**62
+    if np.all(staked < limit) and np.all(
+        whole.astype(np.float64) * staked.astype(np.float64) < limit
+    ):
+        # Both terms are below 2^62, so the sum fits int64.
+        return (whole * staked_words + _multiply_high(frac, staked_words)).astype(
+            np.int64
+        )
+
+    amounts = (
+        (whole.astype(object) * RPT_SCALE + frac.astype(object))
+        * staked.astype(object)
+        // RPT_SCALE
+    )
+    if amounts.size == 0 or amounts.max() < 2**63:
+        return amounts.astype(np.int64)
+    return amounts
+
+
+def _multiply_high(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """The upper 64 bits of the 128-bit products of uint64 arrays, computed with 32-bit halves."""
+    mask = np.uint64(2**32 - 1)
+    shift = np.uint64(32)
+    a_low, a_high = a & mask, a >> shift
+    b_low, b_high = b & mask, b >> shift
+
+    low = a_low * b_low
+    middle_a = a_high * b_low
+    middle_b = a_low * b_high
+    carry = (low >> shift) + (middle_a & mask) + (middle_b & mask)
+    return (
+        a_high * b_high + (middle_a >> shift) + (middle_b >> shift) + (carry >> shift)
+    )
+
+
+def _to_rpt_words(rpt: Any) -> "np.ndarray":
+    rpt = np.asarray(rpt)
+    if rpt.dtype == RPT_DTYPE:
+        return rpt
+
+    words = np.empty(rpt.shape, dtype=RPT_DTYPE)
+    if rpt.dtype.kind == "f":
+        # Scaling by a power of two is exact, the same as `rpt_to_fixed`.
+        whole = np.floor(rpt)
+        words["whole"] = whole
+        words["frac"] = (rpt - whole) * RPT_SCALE
+    else:
+        words[...] = np.array(
+            [divmod(int(value), RPT_SCALE) for value in rpt.flat], dtype=RPT_DTYPE
+        ).reshape(rpt.shape)
+    return words
+
+
+def _truncate(values: "np.ndarray") -> "np.ndarray":
+    """The same as applying `int` to each element."""
+    if np.all(np.abs(values) < 2.0**63):
+        return values.astype(np.int64)
+    return np.frompyfunc(int, 1, 1)(values)
+
+
+def _add(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    if a.dtype == b.dtype == np.int64:
+        limit = 2**62
+        if np.all((np.abs(a) < limit) & (np.abs(b) < limit)):
+            return a + b
+    return a.astype(object) + b.astype(object)
+
+
+def _assign(values: "np.ndarray", index: tuple, value: int) -> "np.ndarray":
+    if values.dtype != object and not -(2**63) <= value < 2**63:
+        values = values.astype(object)
+    values[index] = value
+    return values
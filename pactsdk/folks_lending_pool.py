@@ -39,32 +39,30 @@ from typing import Optional
 import algosdk
 from algosdk.v2client.algod import AlgodClient
 
+from .abi_codec import UINT8, Uint8Codec, encode_uint64_array
 from .add_liquidity import LiquidityAddition
 from .asset import Asset, fetch_asset_by_index
 from .encoding import extract_uint64
 from .pool import Pool
 from .swap import Swap
 from .transaction_group import TransactionGroup
-from .utils import get_selector, parse_app_state, sp_fee
-
-PRE_ADD_LIQUIDITY_SIG = get_selector(
-    "pre_add_liquidity(txn,txn,asset,asset,asset,asset,application,application,application,application)void"
-)
-ADD_LIQUIDITY_SIG = get_selector(
-    "add_liquidity(asset,asset,asset,application,uint64)void"
-)
-REMOVE_LIQUIDITY_SIG = get_selector(
-    "remove_liquidity(axfer,asset,asset,asset,application)void"
-)
-POST_REMOVE_LIQUIDITY_SIG = get_selector(
-    "post_remove_liquidity(asset,asset,asset,asset,application,application,application,uint64,uint64)void"
-)
-SWAP_SIG = get_selector(
-    "swap(txn,asset,asset,asset,asset,application,application,application,application,uint64)void"
-)
-OPT_IN_SIG = get_selector("opt_in(uint64[])void")
-
-ABI_BYTE = algosdk.abi.UintType(8)
+from .utils import parse_app_state, sp_fee
+
+ABI_BYTE = Uint8Codec()
+"""Deprecated, kept for backward compatibility. Use :py:data:`pactsdk.abi_codec.UINT8` or :py:func:`pactsdk.abi_codec.encode_uint8` instead."""
+
+# pre_add_liquidity(txn,txn,asset,asset,asset,asset,application,application,application,application)void
+PRE_ADD_LIQUIDITY_SIG = bytes.fromhex("c8658a5c")
+# add_liquidity(asset,asset,asset,application,uint64)void
+ADD_LIQUIDITY_SIG = bytes.fromhex("ead1f8c9")
+# remove_liquidity(axfer,asset,asset,asset,application)void
+REMOVE_LIQUIDITY_SIG = bytes.fromhex("5fdbd55d")
+# post_remove_liquidity(asset,asset,asset,asset,application,application,application,uint64,uint64)void
+POST_REMOVE_LIQUIDITY_SIG = bytes.fromhex("f43bee61")
+# swap(txn,asset,asset,asset,asset,application,application,application,application,uint64)void
+SWAP_SIG = bytes.fromhex("f7b47456")
+# opt_in(uint64[])void
+OPT_IN_SIG = bytes.fromhex("850efd1a")
 
 # call(1000) + 2 * wrap(4000) + refund(1000)
 PRE_ADD_LIQ_FEE = 10_000
@@ -217,6 +215,11 @@ class LendingSwap:
 
     tx_fee: int
 
+    lending_pool_adapter: Optional["FolksLendingPoolAdapter"] = dataclasses.field(
+        default=None, repr=False
+    )
+    """The adapter the swap is going to be performed with."""
+
 
 @dataclasses.dataclass
 class FolksLendingPoolAdapter:
@@ -313,8 +316,8 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 PRE_ADD_LIQUIDITY_SIG,
-                *[ABI_BYTE.encode(v) for v in [0, 1, 2, 3]],  # assets
-                *[ABI_BYTE.encode(v) for v in [1, 2, 3, 4]],  # apps
+                *UINT8[0:4],  # assets
+                *UINT8[1:5],  # apps
             ],
             foreign_assets=[
                 self.primary_lending_pool.original_asset.index,
@@ -336,8 +339,8 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 ADD_LIQUIDITY_SIG,
-                *[ABI_BYTE.encode(v) for v in [0, 1, 2]],  # assets
-                ABI_BYTE.encode(1),  # pact pool id
+                *UINT8[0:3],  # assets
+                UINT8[1],  # pact pool id
                 0,  # min expected
             ],
             foreign_assets=[
@@ -378,8 +381,8 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 REMOVE_LIQUIDITY_SIG,
-                *[ABI_BYTE.encode(v) for v in [0, 1, 2]],  # assets
-                ABI_BYTE.encode(1),  # pact pool
+                *UINT8[0:3],  # assets
+                UINT8[1],  # pact pool
             ],
             foreign_assets=[
                 self.primary_lending_pool.f_asset.index,
@@ -397,8 +400,8 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 POST_REMOVE_LIQUIDITY_SIG,
-                *[ABI_BYTE.encode(v) for v in [0, 1, 2, 3]],  # assets
-                *[ABI_BYTE.encode(v) for v in [1, 2, 3]],  # apps
+                *UINT8[0:4],  # assets
+                *UINT8[1:4],  # apps
                 0,  # min expected primary
                 0,  # min expected secondary
             ],
@@ -466,6 +469,7 @@ class FolksLendingPoolAdapter:
             amount_received=amount_received,
             minimum_amount_received=minimum_amount_received,
             tx_fee=tx_fee,
+            lending_pool_adapter=self,
         )
 
     def prepare_swap_tx_group(
@@ -494,8 +498,8 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 SWAP_SIG,
-                *[ABI_BYTE.encode(v) for v in [0, 1, 2, 3]],  # assets
-                *[ABI_BYTE.encode(v) for v in [1, 2, 3, 4]],  # apps
+                *UINT8[0:4],  # assets
+                *UINT8[1:5],  # apps
                 swap.minimum_amount_received,
             ],
             foreign_assets=[
@@ -544,9 +548,7 @@ class FolksLendingPoolAdapter:
             index=self.app_id,
             app_args=[
                 OPT_IN_SIG,
-                algosdk.abi.ArrayDynamicType(algosdk.abi.UintType(64)).encode(
-                    asset_ids
-                ),
+                encode_uint64_array(asset_ids),
             ],
             foreign_assets=asset_ids,
         )
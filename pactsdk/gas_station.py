@@ -4,9 +4,11 @@ from typing import Optional
 import algosdk
 from algosdk import transaction
 
-from .utils import get_selector, sp_fee
+from .opcode_budget import OpcodeBudget
+from .utils import sp_fee
 
-INCREASE_OPCODE_QUOTA_SIG = get_selector("increase_opcode_quota(uint64,uint64)void")
+# increase_opcode_quota(uint64,uint64)void
+INCREASE_OPCODE_QUOTA_SIG = bytes.fromhex("ffde6378")
 
 
 @dataclass
@@ -41,6 +43,30 @@ class GasStation:
             sp=sp_fee(suggested_params, (count + 1) * 1000 + extra_fee),
         )
 
+    def build_increase_opcode_budget_tx(
+        self,
+        sender: str,
+        budget: OpcodeBudget,
+        suggested_params: transaction.SuggestedParams,
+        extra_fee=0,
+    ) -> Optional[transaction.Transaction]:
+        """Builds a call requesting the minimal opcode budget increase covering the predicted cost. See :py:mod:`pactsdk.opcode_budget`.
+
+        Args:
+            sender: The sender of the transaction.
+            budget: The predicted cost of all the operations in the group.
+            suggested_params: Algorand suggested parameters for transactions.
+            extra_fee: Additional fee to pay with this transaction.
+
+        Returns:
+            The transaction or None if the application calls in the group provide enough budget.
+        """
+        if not budget.needs_increase:
+            return None
+        return self.build_increase_opcode_quota_tx(
+            sender, budget.increase_count, suggested_params, extra_fee=extra_fee
+        )
+
 
 _gas_station: Optional[GasStation] = None
 
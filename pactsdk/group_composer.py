@@ -0,0 +1,304 @@
+"""Utilities for packing many operations across different pools into atomic transaction groups.
+
+Typical usage example::
+
+    composer = pactsdk.GroupComposer(address, algod.suggested_params())
+
+    # Swap ALGO to USDC and then swap all the received USDC to goBTC.
+    composer.add(algo_usdc_pool.prepare_swap(algo, 1_000_000, slippage_pct=1))
+    composer.chain_swap(usdc_btc_pool, slippage_pct=1)
+
+    # An independent zap in yet another pool.
+    composer.add(other_pool.prepare_zap(algo, 5_000_000, slippage_pct=1))
+
+    groups = composer.build()
+    signed_groups = composer.sign(private_key)
+"""
+
+from typing import Union
+
+from algosdk import transaction
+
+from .add_liquidity import LiquidityAddition
+from .asset import Asset
+from .exceptions import PactSdkError
+from .folks_lending_pool import (
+    FolksLendingPoolAdapter,
+    LendingLiquidityAddition,
+    LendingSwap,
+)
+from .pool import Pool
+from .swap import Swap
+from .transaction_group import TransactionGroup
+from .zap import Zap
+
+MAX_GROUP_SIZE = 16
+"""The maximum number of transactions in an Algorand atomic group."""
+
+Operation = Union[Swap, LiquidityAddition, Zap, LendingSwap, LendingLiquidityAddition]
+"""An operation which can be put in a group by the :py:class:`GroupComposer`."""
+
+
+def get_operation_output(operation: Operation) -> tuple[Asset, int]:
+    """Returns the asset and the guaranteed amount received from the operation.
+
+    The guaranteed amount is the amount after the slippage, so it's safe to deposit it in the next operation in the same group.
+
+    Args:
+        operation: The operation to check.
+
+    Raises:
+        PactSdkError: If the operation output can't be determined.
+
+    Returns:
+        A tuple of the received asset and the minimum amount received.
+    """
+    if isinstance(operation, Swap):
+        return operation.asset_received, operation.effect.minimum_amount_received
+
+    if isinstance(operation, LendingSwap):
+        return operation.asset_received, operation.minimum_amount_received
+
+    if isinstance(operation, Zap):
+        operation = operation.liquidity_addition
+
+    if isinstance(operation, LiquidityAddition):
+        return (
+            operation.pool.liquidity_asset,
+            operation.effect.minimum_minted_liquidity_tokens,
+        )
+
+    raise PactSdkError(f"Cannot chain the output of {type(operation).__name__}.")
+
+
+def build_operation_txs(
+    operation: Operation,
+    address: str,
+    suggested_params: transaction.SuggestedParams,
+) -> list[transaction.Transaction]:
+    """Builds the transactions of a single operation.
+
+    Args:
+        operation: The operation to build transactions for.
+        address: The address that is performing the operation.
+        suggested_params: Algorand suggested parameters for transactions.
+
+    Raises:
+        PactSdkError: If the operation is not supported.
+
+    Returns:
+        List of transactions performing the operation.
+    """
+    if isinstance(operation, Swap):
+        return operation.pool.build_swap_txs(operation, address, suggested_params)
+
+    if isinstance(operation, Zap):
+        return operation.pool.build_zap_txs(operation, address, suggested_params)
+
+    if isinstance(operation, LiquidityAddition):
+        return operation.pool.build_add_liquidity_txs(
+            address, operation, suggested_params
+        )
+
+    if isinstance(operation, LendingSwap):
+        if operation.lending_pool_adapter is None:
+            raise PactSdkError("LendingSwap is not bound to a lending pool adapter.")
+        return operation.lending_pool_adapter.build_swap_txs(
+            operation, address, suggested_params
+        )
+
+    if isinstance(operation, LendingLiquidityAddition):
+        return operation.lending_pool_adapter.build_add_liquidity_txs(
+            address, operation, suggested_params
+        )
+
+    raise PactSdkError(f"Unsupported operation {type(operation).__name__}.")
+
+
+def pack_units(sizes: list[int], max_size=MAX_GROUP_SIZE) -> list[list[int]]:
+    """Packs units of given sizes into as few bins as possible using the first fit decreasing algorithm.
+
+    Args:
+        sizes: Sizes of the units.
+        max_size: The capacity of a single bin.
+
+    Raises:
+        PactSdkError: If any of the units doesn't fit in a bin.
+
+    Returns:
+        Lists of indexes of the units in each bin. Bins are ordered by their first unit and the units in a bin keep the original order.
+    """
+    bins: list[list[int]] = []
+    free: list[int] = []
+
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        size = sizes[index]
+        if size > max_size:
+            raise PactSdkError(
+                f"Operations need {size} transactions which is more than {max_size} allowed in a group."
+            )
+        for bin_index, space in enumerate(free):
+            if size <= space:
+                bins[bin_index].append(index)
+                free[bin_index] -= size
+                break
+        else:
+            bins.append([index])
+            free.append(max_size - size)
+
+    return sorted((sorted(units) for units in bins), key=lambda units: units[0])
+
+
+class GroupComposer:
+    """Composes many operations into the smallest number of atomic transaction groups.
+
+    Operations added with :py:meth:`add` are independent of each other and may be placed in different groups. Operations added with :py:meth:`chain_swap` or :py:meth:`chain_zap` consume the output of the previous operation, so they are always put in the same group as it.
+    """
+
+    address: str
+    """The address that is performing the operations."""
+
+    suggested_params: transaction.SuggestedParams
+    """Algorand suggested parameters for transactions."""
+
+    groups: list[TransactionGroup]
+    """Groups created by the last call to :py:meth:`build`."""
+
+    def __init__(self, address: str, suggested_params: transaction.SuggestedParams):
+        """
+        Args:
+            address: The address that is performing the operations.
+            suggested_params: Algorand suggested parameters for transactions.
+        """
+        self.address = address
+        self.suggested_params = suggested_params
+        self.groups = []
+        self._units: list[list[Operation]] = []
+        self._changed = True
+
+    @property
+    def operations(self) -> list[Operation]:
+        """All added operations in the order of adding."""
+        return [operation for unit in self._units for operation in unit]
+
+    def add(self, operation: Operation) -> "GroupComposer":
+        """Adds an independent operation.
+
+        Args:
+            operation: The operation to add.
+
+        Returns:
+            The composer itself to allow chaining the calls.
+        """
+        self._units.append([operation])
+        self._changed = True
+        return self
+
+    def chain_swap(
+        self, pool: Union[Pool, FolksLendingPoolAdapter], slippage_pct: float
+    ) -> Union[Swap, LendingSwap]:
+        """Adds a swap that deposits the guaranteed output of the previously added operation.
+
+        Args:
+            pool: The pool or the lending pool adapter to swap on.
+            slippage_pct: The maximum allowed slippage in percents.
+
+        Returns:
+            The added swap.
+        """
+        asset, amount = self._get_last_output()
+        swap = pool.prepare_swap(asset, amount, slippage_pct)
+        self._units[-1].append(swap)
+        self._changed = True
+        return swap
+
+    def chain_zap(self, pool: Pool, slippage_pct: float) -> Zap:
+        """Adds a zap that deposits the guaranteed output of the previously added operation.
+
+        Args:
+            pool: The pool to zap into.
+            slippage_pct: The maximum allowed slippage in percents.
+
+        Returns:
+            The added zap.
+        """
+        asset, amount = self._get_last_output()
+        zap = pool.prepare_zap(asset, amount, slippage_pct)
+        self._units[-1].append(zap)
+        self._changed = True
+        return zap
+
+    def build(self) -> list[TransactionGroup]:
+        """Builds the transactions for all the operations and packs them into groups.
+
+        Raises:
+            PactSdkError: If there are no operations or chained operations don't fit in a single group.
+
+        Returns:
+            List of transaction groups with assigned group ids.
+        """
+        if not self._units:
+            raise PactSdkError("Cannot compose an empty list of operations.")
+
+        units_txs = [
+            [
+                tx
+                for operation in unit
+                for tx in build_operation_txs(
+                    operation, self.address, self.suggested_params
+                )
+            ]
+            for unit in self._units
+        ]
+
+        bins = pack_units([len(txs) for txs in units_txs])
+        self.groups = [
+            TransactionGroup([tx for index in units for tx in units_txs[index]])
+            for units in bins
+        ]
+        self._changed = False
+        return self.groups
+
+    @property
+    def total_fee(self) -> int:
+        """The sum of fees of all the transactions in the built groups."""
+        return sum(tx.fee for group in self.groups for tx in group.transactions)
+
+    def sign(self, private_key: str) -> list[list[transaction.SignedTransaction]]:
+        """Signs all the groups. The groups are built first if operations were added after the last :py:meth:`build`.
+
+        Args:
+            private_key: Sign the transactions with this private key.
+
+        Returns:
+            Signed transactions for each of the groups, ready to be sent with `algod.send_transactions`.
+        """
+        if self._changed:
+            self.build()
+        return [group.sign(private_key) for group in self.groups]
+
+    def _get_last_output(self) -> tuple[Asset, int]:
+        if not self._units:
+            raise PactSdkError("There is no operation to chain with.")
+        return get_operation_output(self._units[-1][-1])
+
+
+def compose_groups(
+    operations: list[Operation],
+    address: str,
+    suggested_params: transaction.SuggestedParams,
+) -> list[TransactionGroup]:
+    """A shortcut for composing independent operations with :py:class:`GroupComposer`.
+
+    Args:
+        operations: The operations to compose.
+        address: The address that is performing the operations.
+        suggested_params: Algorand suggested parameters for transactions.
+
+    Returns:
+        List of transaction groups with assigned group ids.
+    """
+    composer = GroupComposer(address, suggested_params)
+    for operation in operations:
+        composer.add(operation)
+    return composer.build()
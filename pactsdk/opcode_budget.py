@@ -0,0 +1,122 @@
+"""A cost model of the Pact contracts used for requesting the minimal opcode budget.
+
+Each application call in a group adds :py:data:`APP_CALL_BUDGET` to the budget shared by the whole group. If the operations need more, the missing budget is bought by the gas station. The gas station call is a top level application call too, so it adds :py:data:`APP_CALL_BUDGET` itself, and the rest is covered by empty inner application calls, each adding :py:data:`INNER_APP_CALL_BUDGET`. Every inner transaction costs a minimal fee, so it's worth requesting exactly as many as needed.
+
+Since the budget is pooled, a single gas station call can cover several operations in the same group::
+
+    budget = OpcodeBudget()
+    budget.add(farm_a.get_update_opcode_cost())
+    budget.add(farm_b.get_update_opcode_cost())
+    increase_tx = get_gas_station().build_increase_opcode_budget_tx(
+        sender, budget, suggested_params
+    )
+"""
+
+import datetime
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .farming.farm_state import FarmState
+
+APP_CALL_BUDGET = 700
+"""The opcode budget added by each top level application call in a group."""
+
+INNER_APP_CALL_BUDGET = 700
+"""The opcode budget added by each inner application call."""
+
+NEWTON_ITERATION_COST = 369
+"""The cost of a single Newton-Raphson iteration of the stableswap invariant calculation."""
+
+FARM_UPDATE_COST_PER_REWARD_ASSET = 513
+"""The cost of updating the farm state per each reward asset."""
+
+FARM_CYCLE_END_UPDATE_COST_PER_REWARD_ASSET = 671
+"""The same as :py:data:`FARM_UPDATE_COST_PER_REWARD_ASSET` but when the update also has to roll over to the next rewards cycle."""
+
+
+def get_budget_increase_count(opcodes: int, available=0) -> int:
+    """Calculates the minimal number of inner application calls that cover the cost.
+
+    Args:
+        opcodes: The predicted opcode cost.
+        available: The budget already available, e.g. from the application calls in the group.
+
+    Returns:
+        The number of inner application calls to request.
+    """
+    missing = opcodes - available
+    if missing <= 0:
+        return 0
+    return math.ceil(missing / INNER_APP_CALL_BUDGET)
+
+
+def get_stableswap_invariant_cost(iterations: int) -> int:
+    """Predicts the opcode cost of the stableswap invariant calculations.
+
+    Args:
+        iterations: The total number of Newton-Raphson iterations, as simulated by :py:class:`pactsdk.stableswap_calculator.StableswapCalculator`.
+
+    Returns:
+        The opcode cost.
+    """
+    return iterations * NEWTON_ITERATION_COST
+
+
+def get_farm_update_cost(
+    state: "FarmState", at_time: Optional[datetime.datetime] = None
+) -> int:
+    """Predicts the opcode cost of updating the farm state.
+
+    Args:
+        state: The current farm state.
+        at_time: The time of the update. Defaults to now.
+
+    Returns:
+        The opcode cost.
+    """
+    at_time = at_time or datetime.datetime.now()
+    seconds_passed = (at_time - state.updated_at).total_seconds()
+    if seconds_passed > state.duration > 0:
+        cost_per_asset = FARM_CYCLE_END_UPDATE_COST_PER_REWARD_ASSET
+    else:
+        cost_per_asset = FARM_UPDATE_COST_PER_REWARD_ASSET
+    return cost_per_asset * len(state.reward_assets)
+
+
+@dataclass
+class OpcodeBudget:
+    """Accumulates the opcode costs of operations sharing a single group."""
+
+    opcodes: int = 0
+    """The predicted total opcode cost."""
+
+    available: int = 0
+    """The budget provided by the application calls of the operations."""
+
+    def add(self, opcodes: int, app_calls=1) -> "OpcodeBudget":
+        """Adds an operation.
+
+        Args:
+            opcodes: The predicted opcode cost of the operation.
+            app_calls: The number of top level application calls the operation puts in the group.
+
+        Returns:
+            The budget itself to allow chaining the calls.
+        """
+        self.opcodes += opcodes
+        self.available += app_calls * APP_CALL_BUDGET
+        return self
+
+    @property
+    def needs_increase(self) -> bool:
+        """Whether the application calls of the operations don't cover the cost, so a gas station call is needed."""
+        return self.opcodes > self.available
+
+    @property
+    def increase_count(self) -> int:
+        """The minimal number of inner application calls the gas station has to issue to cover the cost. The budget of the gas station call itself is included, so it may be zero even if :py:attr:`needs_increase` is set."""
+        if not self.needs_increase:
+            return 0
+        return get_budget_increase_count(self.opcodes, self.available + APP_CALL_BUDGET)
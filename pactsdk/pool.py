@@ -1,7 +1,8 @@
 import copy
+import itertools
 import math
 from dataclasses import dataclass, field
-from typing import Literal, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Sequence, Union
 
 import algosdk
 from algosdk import transaction
@@ -22,14 +23,21 @@ from .asset import Asset, fetch_asset_by_index
 from .exceptions import PactSdkError
 from .pool_calculator import PoolCalculator
 from .swap import Swap
+from .swap_template import SwapTemplate, patch_tx
 from .transaction_group import TransactionGroup
 from .zap import Zap
 
+if TYPE_CHECKING:
+    from .quote_cache import QuoteCache
+
 PoolType = Literal["CONSTANT_PRODUCT", "NFT_CONSTANT_PRODUCT", "STABLESWAP"]
 
 OperationType = Literal["SWAP", "ADDLIQ", "REMLIQ"]
 """The basic three operation types in a PACT liquidity pool, namely Add Liquidity (ADDLIQ), Remove Liquidity (REMLIQ) and making a swap (SWAP)."""
 
+_state_versions = itertools.count(1)
+"""A process wide counter used to stamp each new pool state with a unique version."""
+
 
 def fetch_app_global_state(
     algod: AlgodClient,
@@ -169,14 +177,24 @@ class Pool:
     fee_bps: int = 30
     """The fee in basis points for swaps trading on the pool."""
 
+    quote_cache: Optional["QuoteCache"] = field(default=None, repr=False)
+    """An optional cache of swap quotes. If set, :py:meth:`pactsdk.pool.Pool.prepare_swap` reuses swaps computed for the current pool state."""
+
+    round: Optional[int] = None
+    """A round at which the state was known to be current, i.e. the state includes all the changes up to this round. None if it's unknown."""
+
     pool_type: PoolType = field(init=False)
     """Different pool types use different formulas for making swaps."""
 
     version: int = field(init=False)
     """The version of the contract. May be 0 for some old pools which don't expose the version in the global state."""
 
+    state_version: int = field(init=False, repr=False)
+    """A unique stamp of the current pool state. It changes every time the state is replaced e.g. by :py:meth:`pactsdk.pool.Pool.update_state`."""
+
     def __post_init__(self):
         self.params: Union[StableswapParams, ConstantProductParams]
+        self._escrow_address: Optional[str] = None
 
         self.pool_type = get_pool_type_from_internal_state(self.internal_state)
 
@@ -204,6 +222,16 @@ class Pool:
         self.calculator = PoolCalculator(self)
         self.state = self.parse_internal_state(self.internal_state)
 
+    @property
+    def state(self) -> PoolState:
+        """The user friendly representation of the pool's global state."""
+        return self._state
+
+    @state.setter
+    def state(self, state: PoolState):
+        self._state = state
+        self.state_version = next(_state_versions)
+
     def __eq__(self, other_pool: object) -> bool:
         """Return equal by comparing the pools app_id value."""
         if not isinstance(other_pool, Pool):
@@ -216,7 +244,9 @@ class Pool:
         Returns:
             The address corresponding to that pools's escrow account.
         """
-        return algosdk.logic.get_application_address(self.app_id)
+        if self._escrow_address is None:
+            self._escrow_address = algosdk.logic.get_application_address(self.app_id)
+        return self._escrow_address
 
     def get_other_asset(self, asset: Asset) -> Asset:
         """Returns the "other" asset, i.e. primary if secondary is passed in and vice versa.
@@ -238,16 +268,21 @@ class Pool:
 
         raise PactSdkError(f"Asset with index {asset.index} is not a pool asset.")
 
-    def update_state(self) -> PoolState:
+    def update_state(self, round: Optional[int] = None) -> PoolState:
         """Updates the internal and pool state properties by re-reading the global state in the blockchain.
 
         Updating the pool state is recommended if there is a pause between the construction of the pool and the creation of the transactions on the pool. Calling this method ensures that the the pool state is not stale.
 
+        Args:
+            round: A round read before the update, stored in :py:attr:`round`. If not provided, the previous round is kept, as the new state includes all the changes up to it too.
+
         Returns:
             The new pool state.
         """
         self.internal_state = fetch_app_global_state(self.algod, self.app_id)
         self.state = self.parse_internal_state(self.internal_state)
+        if round is not None:
+            self.round = round
         return self.state
 
     def prepare_add_liquidity(
@@ -322,23 +357,77 @@ class Pool:
         Returns:
             List of transactions to add the liquidity.
         """
-        primary_asset_amount = liquidity_addition.primary_asset_amount
-        secondary_asset_amount = liquidity_addition.secondary_asset_amount
-
-        if self.calculator.is_empty:
-            assert (
-                math.isqrt(primary_asset_amount * secondary_asset_amount) - 1000 > 0
-            ), "Initial liquidity must satisfy the expression `sqrt(a * b) - 1000 > 0`"
-
+        self._check_initial_liquidity(liquidity_addition)
         return self.build_raw_add_liquidity_txs(
             address=address,
-            primary_asset_amount=primary_asset_amount,
-            secondary_asset_amount=secondary_asset_amount,
+            primary_asset_amount=liquidity_addition.primary_asset_amount,
+            secondary_asset_amount=liquidity_addition.secondary_asset_amount,
             minimum_minted_liquidity_tokens=liquidity_addition.effect.minimum_minted_liquidity_tokens,
             suggested_params=suggested_params,
             fee=liquidity_addition.effect.tx_fee,
         )
 
+    def build_add_liquidity_txs_bulk(
+        self,
+        liquidity_additions: Sequence[tuple[str, LiquidityAddition]],
+        suggested_params: transaction.SuggestedParams,
+    ) -> list[TransactionGroup]:
+        """Builds the transaction groups adding liquidity for many accounts at once.
+
+        The result is the same as calling :py:meth:`build_add_liquidity_txs` for each of the additions, but the parts shared by all the groups are built only once.
+
+        Args:
+            liquidity_additions: Pairs of the account address and the liquidity addition it performs.
+            suggested_params: Algorand suggested parameters for transactions.
+
+        Raises:
+            AssertionError: If initial liquidity is too low.
+            PactSdkError: If a liquidity addition is not for this pool.
+
+        Returns:
+            A transaction group for each of the additions, with the group id assigned.
+        """
+        if not liquidity_additions:
+            return []
+
+        template = self.build_raw_add_liquidity_txs(
+            address=liquidity_additions[0][0],
+            primary_asset_amount=0,
+            secondary_asset_amount=0,
+            minimum_minted_liquidity_tokens=0,
+            suggested_params=suggested_params,
+            fee=0,
+        )
+        groups = []
+        for address, liquidity_addition in liquidity_additions:
+            if liquidity_addition.pool.app_id != self.app_id:
+                raise PactSdkError("The liquidity addition is for a different pool.")
+            self._check_initial_liquidity(liquidity_addition)
+            minimum_minted = liquidity_addition.effect.minimum_minted_liquidity_tokens
+            txs = [
+                patch_tx(
+                    template[0],
+                    suggested_params,
+                    sender=address,
+                    amount=liquidity_addition.primary_asset_amount,
+                ),
+                patch_tx(
+                    template[1],
+                    suggested_params,
+                    sender=address,
+                    amount=liquidity_addition.secondary_asset_amount,
+                ),
+                patch_tx(
+                    template[2],
+                    suggested_params,
+                    sender=address,
+                    app_args=[b"ADDLIQ", minimum_minted.to_bytes(8, "big")],
+                    flat_fee=liquidity_addition.effect.tx_fee,
+                ),
+            ]
+            groups.append(TransactionGroup(txs))
+        return groups
+
     def build_raw_add_liquidity_txs(
         self,
         address: str,
@@ -422,6 +511,42 @@ class Pool:
 
         return [tx1, tx2]
 
+    def build_remove_liquidity_txs_bulk(
+        self,
+        removals: Sequence[tuple[str, int]],
+        suggested_params: transaction.SuggestedParams,
+    ) -> list[TransactionGroup]:
+        """Builds the transaction groups removing liquidity for many accounts at once.
+
+        The result is the same as calling :py:meth:`build_remove_liquidity_txs` for each of the removals, but the parts shared by all the groups are built only once.
+
+        Args:
+            removals: Pairs of the account address and the amount of the LP token it returns to the pool.
+            suggested_params: Algorand suggested parameters for transactions.
+
+        Returns:
+            A transaction group for each of the removals, with the group id assigned.
+        """
+        if not removals:
+            return []
+
+        deposit_tx, app_call_tx = self.build_remove_liquidity_txs(
+            removals[0][0], 0, suggested_params
+        )
+        groups = []
+        for address, amount in removals:
+            txs = [
+                patch_tx(deposit_tx, suggested_params, sender=address, amount=amount),
+                patch_tx(
+                    app_call_tx,
+                    suggested_params,
+                    sender=address,
+                    flat_fee=app_call_tx.fee,
+                ),
+            ]
+            groups.append(TransactionGroup(txs))
+        return groups
+
     def prepare_swap(
         self, asset: Asset, amount: int, slippage_pct: float, swap_for_exact=False
     ) -> Swap:
@@ -437,6 +562,14 @@ class Pool:
             A new swap object.
         """
         assert self.is_asset_in_the_pool(asset), f"Asset {asset.index} not in the pool"
+        if self.quote_cache is not None:
+            return self.quote_cache.get_swap(
+                self,
+                asset=asset,
+                amount=amount,
+                slippage_pct=slippage_pct,
+                swap_for_exact=swap_for_exact,
+            )
         return Swap(
             self,
             asset_deposited=asset,
@@ -445,6 +578,18 @@ class Pool:
             swap_for_exact=swap_for_exact,
         )
 
+    def prepare_swap_template(self, asset: Asset, address: str) -> SwapTemplate:
+        """Creates a reusable template for building many swap transaction groups for the same asset and address. See :py:class:`pactsdk.swap_template.SwapTemplate`.
+
+        Args:
+            asset: The asset to swap.
+            address: The address that is performing the swaps.
+
+        Returns:
+            A new swap template.
+        """
+        return SwapTemplate(self, asset_deposited=asset, address=address)
+
     def prepare_swap_tx_group(self, swap: Swap, address: str) -> TransactionGroup:
         """Prepares a transaction group that when executed will perform a swap on the pool.
 
@@ -491,6 +636,37 @@ class Pool:
 
         return [tx1, tx2]
 
+    def build_swap_txs_bulk(
+        self,
+        swaps: Sequence[tuple[str, Swap]],
+        suggested_params: transaction.SuggestedParams,
+    ) -> list[TransactionGroup]:
+        """Builds the swap transaction groups for many accounts at once.
+
+        The result is the same as calling :py:meth:`build_swap_txs` for each of the swaps, but the parts shared by all the groups are built only once, see :py:class:`pactsdk.swap_template.SwapTemplate`.
+
+        Args:
+            swaps: Pairs of the address performing the swap and the swap to perform. The swaps may deposit either of the pool assets.
+            suggested_params: Algorand suggested parameters for transactions.
+
+        Raises:
+            PactSdkError: If a swap is not on this pool.
+
+        Returns:
+            A transaction group for each of the swaps, with the group id assigned.
+        """
+        templates: dict[int, SwapTemplate] = {}
+        groups = []
+        for address, swap in swaps:
+            asset_index = swap.asset_deposited.index
+            template = templates.get(asset_index)
+            if template is None:
+                template = self.prepare_swap_template(swap.asset_deposited, address)
+                templates[asset_index] = template
+            txs = template.build_txs_from_swap(swap, suggested_params, address=address)
+            groups.append(TransactionGroup(txs))
+        return groups
+
     def is_asset_in_the_pool(self, asset: Asset) -> bool:
         """Check if the asset is the primary or secondary asset of this pool.
 
@@ -575,6 +751,17 @@ class Pool:
         )
         return [*swap_txs, *add_liq_txs]
 
+    def _check_initial_liquidity(self, liquidity_addition: LiquidityAddition):
+        if self.calculator.is_empty:
+            assert (
+                math.isqrt(
+                    liquidity_addition.primary_asset_amount
+                    * liquidity_addition.secondary_asset_amount
+                )
+                - 1000
+                > 0
+            ), "Initial liquidity must satisfy the expression `sqrt(a * b) - 1000 > 0`"
+
     def _make_deposit_tx(
         self,
         asset: Asset,
@@ -7,12 +7,13 @@ from pactsdk.encoding import (
     deserialize_uint64,
 )
 
-from .utils import parse_app_state
+from .utils import add_slots, frozen_variant, parse_app_state
 
 if TYPE_CHECKING:
     from pactsdk.pool import PoolType
 
 
+@add_slots
 @dataclass
 class AppInternalState:
     """The one to one representation of pool's global state."""
@@ -44,6 +45,7 @@ class AppInternalState:
     PRECISION: Optional[int] = None
 
 
+@add_slots
 @dataclass
 class PoolState:
     """A user friendly representation of pool's global state."""
@@ -55,6 +57,13 @@ class PoolState:
     secondary_asset_price: float
 
 
+FrozenAppInternalState = frozen_variant(AppInternalState)
+"""An immutable :py:class:`AppInternalState`. Assigning its attributes raises `dataclasses.FrozenInstanceError`."""
+
+FrozenPoolState = frozen_variant(PoolState)
+"""An immutable :py:class:`PoolState`. Assigning its attributes raises `dataclasses.FrozenInstanceError`."""
+
+
 def parse_global_pool_state(raw_state: list) -> AppInternalState:
     """
     Args:
@@ -0,0 +1,432 @@
+"""A columnar representation of many pools for bulk pricing.
+
+Holding thousands of :py:class:`pactsdk.pool.Pool` objects is memory hungry and iterating over them in Python is slow. :py:class:`PoolTable` keeps the numbers needed for pricing in NumPy columns and computes spot prices, TVL and constant product swap quotes for all the pools at once. Full :py:class:`pactsdk.pool.Pool` objects are created on demand.
+
+This module requires NumPy. Install it with `pip install pactsdk[numpy]`.
+
+Typical usage example::
+
+    pact = pactsdk.PactClient(algod, track_pools=True)
+    ...
+    table = pactsdk.PoolTable.from_pools(pact.pools.values())
+
+    primary_prices, secondary_prices = table.spot_prices()
+    tvl = table.tvl({0: algo_usd_price, usdc.index: 1.0})
+
+    pool = table.get_pool(app_id)
+"""
+
+from typing import Iterable, Mapping, Optional, Union
+
+from algosdk.v2client.algod import AlgodClient
+
+from .asset import Asset
+from .constant_product_batch import (
+    get_net_amounts_received,
+    get_swap_gross_amounts_received,
+)
+from .exceptions import PactSdkError
+from .pool import Pool, PoolType
+from .pool_state import AppInternalState
+from .utils import require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+
+POOL_TYPE_CODES: dict[PoolType, int] = {
+    "CONSTANT_PRODUCT": 0,
+    "NFT_CONSTANT_PRODUCT": 1,
+    "STABLESWAP": 2,
+}
+
+CONTRACT_NAMES: dict[int, Optional[str]] = {
+    0: "PACT AMM",
+    1: "PACT AMM [NFT]",
+    2: "[SI] PACT AMM",
+}
+
+_UINT64_COLUMNS = [
+    "app_id",
+    "primary_asset_id",
+    "secondary_asset_id",
+    "liquidity_asset_id",
+    "total_primary",
+    "total_secondary",
+    "total_liquidity",
+    "initial_a",
+    "initial_a_time",
+    "future_a",
+    "future_a_time",
+    "precision",
+]
+
+
+class PoolTable:
+    """Stores the pricing data of many pools in NumPy columns. Each row describes a single pool.
+
+    Stableswap pools can be stored in the table, but their prices and quotes are not vectorized. They are computed by the on demand :py:class:`pactsdk.pool.Pool` views instead.
+    """
+
+    algod: AlgodClient
+    """The Algorand client used by the pool views."""
+
+    assets: dict[int, Asset]
+    """Assets of all the pools in the table, keyed by the asset index."""
+
+    app_id: "np.ndarray"
+    pool_type: "np.ndarray"
+    """Pool type codes, see :py:data:`POOL_TYPE_CODES`."""
+    primary_asset_id: "np.ndarray"
+    secondary_asset_id: "np.ndarray"
+    liquidity_asset_id: "np.ndarray"
+    primary_decimals: "np.ndarray"
+    secondary_decimals: "np.ndarray"
+    total_primary: "np.ndarray"
+    total_secondary: "np.ndarray"
+    total_liquidity: "np.ndarray"
+    fee_bps: "np.ndarray"
+    pact_fee_bps: "np.ndarray"
+    version: "np.ndarray"
+    initial_a: "np.ndarray"
+    initial_a_time: "np.ndarray"
+    future_a: "np.ndarray"
+    future_a_time: "np.ndarray"
+    precision: "np.ndarray"
+
+    def __init__(self, algod: AlgodClient, size: int = 0):
+        """Creates a table of `size` zeroed rows. Use :py:meth:`from_pools` to create a filled table.
+
+        Args:
+            algod: The Algorand client used by the pool views.
+            size: The number of rows.
+        """
+        require_numpy()
+        self.algod = algod
+        self.assets = {}
+        for name in _UINT64_COLUMNS:
+            setattr(self, name, np.zeros(size, dtype=np.uint64))
+        self.pool_type = np.zeros(size, dtype=np.uint8)
+        self.primary_decimals = np.zeros(size, dtype=np.uint8)
+        self.secondary_decimals = np.zeros(size, dtype=np.uint8)
+        self.fee_bps = np.zeros(size, dtype=np.uint16)
+        self.pact_fee_bps = np.zeros(size, dtype=np.uint16)
+        self.version = np.zeros(size, dtype=np.uint32)
+        self._rows: dict[int, int] = {}
+
+    @classmethod
+    def from_pools(cls, pools: Iterable[Pool]) -> "PoolTable":
+        """Creates a table from the pool objects.
+
+        Args:
+            pools: The pools to put in the table. All of them must use the same algod client.
+
+        Raises:
+            PactSdkError: If there are no pools.
+
+        Returns:
+            The new table.
+        """
+        pools = list(pools)
+        if not pools:
+            raise PactSdkError("Cannot create a PoolTable without pools.")
+
+        table = cls(pools[0].algod, len(pools))
+        for row, pool in enumerate(pools):
+            table.set_pool(row, pool)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.app_id)
+
+    def __contains__(self, app_id: int) -> bool:
+        return app_id in self._rows
+
+    def get_row(self, app_id: int) -> int:
+        """Returns the row of the pool.
+
+        Args:
+            app_id: The application id of the pool.
+
+        Raises:
+            KeyError: If the pool is not in the table.
+
+        Returns:
+            The row index.
+        """
+        return self._rows[app_id]
+
+    def set_pool(self, row: int, pool: Pool):
+        """Writes the pool data into the row.
+
+        Args:
+            row: The row to write.
+            pool: The pool to store.
+        """
+        state = pool.internal_state
+        self._rows[pool.app_id] = row
+        for asset in [pool.primary_asset, pool.secondary_asset, pool.liquidity_asset]:
+            self.assets[asset.index] = asset
+
+        self.app_id[row] = pool.app_id
+        self.pool_type[row] = POOL_TYPE_CODES[pool.pool_type]
+        self.primary_asset_id[row] = pool.primary_asset.index
+        self.secondary_asset_id[row] = pool.secondary_asset.index
+        self.liquidity_asset_id[row] = pool.liquidity_asset.index
+        self.primary_decimals[row] = pool.primary_asset.decimals
+        self.secondary_decimals[row] = pool.secondary_asset.decimals
+        self.fee_bps[row] = state.FEE_BPS
+        self.pact_fee_bps[row] = state.PACT_FEE_BPS or 0
+        self.version[row] = state.VERSION or 0
+        self.initial_a[row] = state.INITIAL_A or 0
+        self.initial_a_time[row] = state.INITIAL_A_TIME or 0
+        self.future_a[row] = state.FUTURE_A or 0
+        self.future_a_time[row] = state.FUTURE_A_TIME or 0
+        self.precision[row] = state.PRECISION or 0
+        self.set_reserves(row, state.A, state.B, state.L)
+
+    def set_reserves(
+        self, row: int, total_primary: int, total_secondary: int, total_liquidity: int
+    ):
+        """Updates the liquidity of a single pool e.g. after a watcher noticed a state change.
+
+        Args:
+            row: The row to update.
+            total_primary: The amount of primary asset in the pool.
+            total_secondary: The amount of secondary asset in the pool.
+            total_liquidity: The amount of minted liquidity tokens.
+        """
+        self.total_primary[row] = total_primary
+        self.total_secondary[row] = total_secondary
+        self.total_liquidity[row] = total_liquidity
+
+    @property
+    def is_constant_product(self) -> "np.ndarray":
+        """A mask of rows holding constant product pools."""
+        return self.pool_type != POOL_TYPE_CODES["STABLESWAP"]
+
+    def get_internal_state(self, row: int) -> AppInternalState:
+        """Recreates the pool global state from the row.
+
+        Only the fields used by the SDK calculations are restored.
+
+        Args:
+            row: The row to read.
+
+        Returns:
+            The pool global state.
+        """
+        is_stableswap = self.pool_type[row] == POOL_TYPE_CODES["STABLESWAP"]
+        optional = lambda column: int(column[row]) if is_stableswap else None
+        return AppInternalState(
+            A=int(self.total_primary[row]),
+            B=int(self.total_secondary[row]),
+            ASSET_A=int(self.primary_asset_id[row]),
+            ASSET_B=int(self.secondary_asset_id[row]),
+            LTID=int(self.liquidity_asset_id[row]),
+            L=int(self.total_liquidity[row]),
+            FEE_BPS=int(self.fee_bps[row]),
+            CONTRACT_NAME=CONTRACT_NAMES[int(self.pool_type[row])],  # type: ignore
+            VERSION=int(self.version[row]),
+            PACT_FEE_BPS=int(self.pact_fee_bps[row]),
+            INITIAL_A=optional(self.initial_a),
+            INITIAL_A_TIME=optional(self.initial_a_time),
+            FUTURE_A=optional(self.future_a),
+            FUTURE_A_TIME=optional(self.future_a_time),
+            PRECISION=optional(self.precision),
+        )
+
+    def get_pool(self, app_id: int) -> Pool:
+        """Creates a :py:class:`pactsdk.pool.Pool` view of the pool stored in the table. Doesn't make any network calls.
+
+        The view is a snapshot. Changes made to the view are not reflected in the table and vice versa.
+
+        Args:
+            app_id: The application id of the pool.
+
+        Returns:
+            The pool object.
+        """
+        row = self.get_row(app_id)
+        return Pool(
+            algod=self.algod,
+            app_id=app_id,
+            primary_asset=self.assets[int(self.primary_asset_id[row])],
+            secondary_asset=self.assets[int(self.secondary_asset_id[row])],
+            liquidity_asset=self.assets[int(self.liquidity_asset_id[row])],
+            internal_state=self.get_internal_state(row),
+        )
+
+    def spot_prices(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Calculates the current prices in all the pools. Matches :py:attr:`pactsdk.pool_state.PoolState.primary_asset_price` and :py:attr:`pactsdk.pool_state.PoolState.secondary_asset_price`.
+
+        Stableswap prices are computed by the pool views.
+
+        Returns:
+            A tuple of primary asset prices (amount of secondary asset for a single primary asset) and secondary asset prices.
+        """
+        primary = self.total_primary / np.power(10.0, self.primary_decimals)
+        secondary = self.total_secondary / np.power(10.0, self.secondary_decimals)
+
+        empty = (primary == 0) | (secondary == 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            primary_price = np.where(empty, 0.0, secondary / primary)
+            secondary_price = np.where(empty, 0.0, primary / secondary)
+
+        for row in np.flatnonzero(~self.is_constant_product):
+            state = self.get_pool(int(self.app_id[row])).state
+            primary_price[row] = state.primary_asset_price
+            secondary_price[row] = state.secondary_asset_price
+
+        return primary_price, secondary_price
+
+    def tvl(self, asset_prices: Mapping[int, float]) -> "np.ndarray":
+        """Calculates the total value locked in all the pools.
+
+        Args:
+            asset_prices: Prices of whole asset units in a common currency, keyed by the asset index.
+
+        Returns:
+            TVL of each pool. NaN for pools with an asset missing in `asset_prices`.
+        """
+        primary_prices = self._lookup_prices(self.primary_asset_id, asset_prices)
+        secondary_prices = self._lookup_prices(self.secondary_asset_id, asset_prices)
+        primary = self.total_primary / np.power(10.0, self.primary_decimals)
+        secondary = self.total_secondary / np.power(10.0, self.secondary_decimals)
+        return primary * primary_prices + secondary * secondary_prices
+
+    def asset_prices(self, anchor_prices: Mapping[int, float]) -> dict[int, float]:
+        """Derives the prices of all the reachable assets from the prices of a few anchor assets, using the spot prices of the pools.
+
+        The prices spread through the pools hop by hop, so each asset is priced by the shortest path from an anchor. If several pools can price an asset in the same hop, the deepest one is used, i.e. the one with the highest value of the already priced reserve.
+
+        Args:
+            anchor_prices: Prices of whole asset units in a common currency, keyed by the asset index. E.g. `{0: algo_usd_price, usdc.index: 1.0}`.
+
+        Returns:
+            Prices of whole units of the anchor assets and all the assets connected to them, keyed by the asset index.
+        """
+        prices = dict(anchor_prices)
+        primary_price, secondary_price = self.spot_prices()
+        primary = self.total_primary / np.power(10.0, self.primary_decimals)
+        secondary = self.total_secondary / np.power(10.0, self.secondary_decimals)
+
+        for _ in range(len(self)):
+            known_primary = self._lookup_prices(self.primary_asset_id, prices)
+            known_secondary = self._lookup_prices(self.secondary_asset_id, prices)
+            to_secondary = (
+                ~np.isnan(known_primary)
+                & np.isnan(known_secondary)
+                & (secondary_price > 0)
+            )
+            to_primary = (
+                ~np.isnan(known_secondary)
+                & np.isnan(known_primary)
+                & (primary_price > 0)
+            )
+
+            asset_ids = np.concatenate(
+                [
+                    self.secondary_asset_id[to_secondary],
+                    self.primary_asset_id[to_primary],
+                ]
+            )
+            if len(asset_ids) == 0:
+                break
+            new_prices = np.concatenate(
+                [
+                    known_primary[to_secondary] * secondary_price[to_secondary],
+                    known_secondary[to_primary] * primary_price[to_primary],
+                ]
+            )
+            depths = np.concatenate(
+                [
+                    known_primary[to_secondary] * primary[to_secondary],
+                    known_secondary[to_primary] * secondary[to_primary],
+                ]
+            )
+
+            # Sorted by the asset, then from the deepest pool. The first price of each asset is used.
+            order = np.lexsort((-depths, asset_ids))
+            asset_ids = asset_ids[order]
+            first = np.ones(len(asset_ids), dtype=bool)
+            first[1:] = asset_ids[1:] != asset_ids[:-1]
+            for asset_id, price in zip(asset_ids[first], new_prices[order][first]):
+                prices[int(asset_id)] = float(price)
+
+        return prices
+
+    def liquidity_token_prices(self, asset_prices: Mapping[int, float]) -> "np.ndarray":
+        """Calculates the prices of the liquidity tokens of all the pools, from the value of the pool reserves.
+
+        Args:
+            asset_prices: Prices of whole asset units in a common currency, keyed by the asset index.
+
+        Returns:
+            The price of a whole liquidity token unit of each pool. NaN for pools without liquidity or with an asset missing in `asset_prices`.
+        """
+        liquidity_decimals = np.array(
+            [
+                self.assets[int(asset_id)].decimals
+                for asset_id in self.liquidity_asset_id
+            ],
+            dtype=np.uint8,
+        )
+        liquidity = self.total_liquidity / np.power(10.0, liquidity_decimals)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(liquidity > 0, self.tvl(asset_prices) / liquidity, np.nan)
+
+    def quote_swaps(
+        self,
+        amounts: Union[int, "np.ndarray"],
+        primary_deposited: Union[bool, "np.ndarray"] = True,
+    ) -> "np.ndarray":
+        """Calculates the net amount received when swapping in each of the pools. Matches `swap.effect.amount_received` of :py:meth:`pactsdk.pool.Pool.prepare_swap` for a swap (not a swap for exact).
+
+        The calculation is exact, see :py:mod:`pactsdk.constant_product_batch`. Stableswap quotes are computed by the pool views.
+
+        Args:
+            amounts: The amount deposited in each pool or a single amount for all the pools.
+            primary_deposited: If True, the primary asset is deposited, otherwise the secondary one. A single value or one for each pool.
+
+        Returns:
+            The amounts received, as an int64 array or an object array of Python integers if any of them doesn't fit in int64.
+        """
+        amounts = np.broadcast_to(np.asarray(amounts), len(self))
+        primary_deposited = np.broadcast_to(np.asarray(primary_deposited), len(self))
+
+        liq_a = np.where(primary_deposited, self.total_primary, self.total_secondary)
+        liq_b = np.where(primary_deposited, self.total_secondary, self.total_primary)
+
+        # Swapping nothing in an empty pool gives nothing instead of dividing by zero.
+        empty = (liq_a == 0) & (amounts == 0)
+        gross = get_swap_gross_amounts_received(
+            np.where(empty, 1, liq_a), liq_b, amounts
+        )
+        received = get_net_amounts_received(gross, self.fee_bps)
+
+        for row in np.flatnonzero(~self.is_constant_product):
+            pool = self.get_pool(int(self.app_id[row]))
+            asset = (
+                pool.primary_asset if primary_deposited[row] else pool.secondary_asset
+            )
+            value = pool.calculator.amount_deposited_to_net_amount_received(
+                asset, int(amounts[row])
+            )
+            if value >= 2**63 and received.dtype != object:
+                received = received.astype(object)
+            received[row] = value
+
+        return received
+
+    def _lookup_prices(
+        self, asset_ids: "np.ndarray", asset_prices: Mapping[int, float]
+    ) -> "np.ndarray":
+        unique_ids, inverse = np.unique(asset_ids, return_inverse=True)
+        unique_prices = np.array(
+            [asset_prices.get(int(asset_id), np.nan) for asset_id in unique_ids],
+            dtype=np.float64,
+        )
+        return unique_prices[inverse]
@@ -0,0 +1,180 @@
+"""Utilities for caching swap quotes between pool state changes.
+
+Computing a swap effect is relatively expensive, especially for stableswaps. Services answering many identical quote requests can put a :py:class:`QuoteCache` in front of the pools::
+
+    cache = pactsdk.QuoteCache(maxsize=10_000)
+    pool.quote_cache = cache
+
+    # Computed once, then reused until the pool state changes.
+    swap = pool.prepare_swap(asset=algo, amount=1_000_000_000, slippage_pct=1)
+
+Each entry is stamped with the :py:attr:`pactsdk.pool.Pool.state_version` of every pool it was computed from. Replacing the pool state (e.g. by :py:meth:`pactsdk.pool.Pool.update_state`) changes the version, so stale entries are never returned.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Optional,
+    Sequence,
+    TypeVar,
+    cast,
+)
+
+from .asset import Asset
+from .stableswap_calculator import StableswapParams
+from .swap import Swap
+
+if TYPE_CHECKING:
+    from .pool import Pool
+
+T = TypeVar("T")
+
+
+def is_quote_cacheable(pool: "Pool") -> bool:
+    """Checks if the quotes for the pool depend only on the pool state.
+
+    Stableswap quotes depend also on the current time while the amplifier is changing.
+
+    Args:
+        pool: The pool to check.
+
+    Returns:
+        True if the quotes can be cached, False otherwise.
+    """
+    if pool.pool_type != "STABLESWAP":
+        return True
+
+    params = cast(StableswapParams, pool.params)
+    if params.initial_a == params.future_a:
+        return True
+    return time.time() >= params.future_a_time
+
+
+class QuoteCache:
+    """A thread safe LRU cache of quotes computed from the pools state.
+
+    The entries are keyed by the ids of the pools involved and the quote parameters. Every entry remembers the state versions of its pools and is considered a miss if any of them has changed.
+    """
+
+    maxsize: int
+    """The maximum number of entries. The least recently used entries are evicted first."""
+
+    hits: int
+    """The number of lookups answered from the cache."""
+
+    misses: int
+    """The number of lookups that required computing the quote."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: The maximum number of entries kept in the cache.
+        """
+        assert maxsize > 0, "maxsize must be positive"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            Hashable, tuple[tuple[int, ...], Any]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self, pools: Sequence["Pool"], key: Hashable, compute: Callable[[], T]
+    ) -> T:
+        """Returns the cached value for the pools and the key or computes and stores a new one.
+
+        This is a generic entry point that allows caching quotes spanning several pools e.g. a multi hop route.
+
+        Args:
+            pools: The pools the value is computed from.
+            key: Parameters of the quote.
+            compute: A callback computing the value on a cache miss.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        full_key = (tuple(pool.app_id for pool in pools), key)
+        versions = tuple(pool.state_version for pool in pools)
+
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[0] == versions:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[full_key] = (versions, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def get_swap(
+        self,
+        pool: "Pool",
+        asset: Asset,
+        amount: int,
+        slippage_pct: float,
+        swap_for_exact=False,
+    ) -> Swap:
+        """Returns a swap for the pool, reusing the effect computed for the same parameters and pool state.
+
+        Args:
+            pool: The pool to swap on.
+            asset: The asset to swap.
+            amount: Amount to swap or to receive.
+            slippage_pct: The maximum allowed slippage in percents.
+            swap_for_exact: See :py:meth:`pactsdk.pool.Pool.prepare_swap`.
+
+        Returns:
+            A swap object. The swap and its effect are copies, so it's safe to modify their attributes.
+        """
+        make_swap = lambda: Swap(
+            pool,
+            asset_deposited=asset,
+            amount=amount,
+            slippage_pct=slippage_pct,
+            swap_for_exact=swap_for_exact,
+        )
+        if not is_quote_cacheable(pool):
+            return make_swap()
+
+        key = ("SWAP", asset.index, amount, swap_for_exact, slippage_pct)
+        cached_swap = self.get_or_compute([pool], key, make_swap)
+        swap = copy.copy(cached_swap)
+        swap.effect = copy.copy(cached_swap.effect)
+        swap.pool = pool
+        return swap
+
+    def invalidate(self, pool: Optional["Pool"] = None):
+        """Removes the entries computed from the pool or all the entries if no pool is given.
+
+        This is not needed for correctness as stale entries are never returned, but allows freeing the memory early.
+
+        Args:
+            pool: The pool whose entries should be removed.
+        """
+        with self._lock:
+            if pool is None:
+                self._entries.clear()
+                return
+
+            for full_key in list(self._entries):
+                pool_ids = cast(tuple, full_key)[0]
+                if pool.app_id in pool_ids:
+                    del self._entries[full_key]
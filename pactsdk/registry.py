@@ -0,0 +1,171 @@
+"""Utilities for saving loaded pools in a compact binary file and restoring them without any network calls.
+
+The file starts with a magic string, a format version and the round the pools state comes from. The rest is a msgpack encoded payload with the assets table and the pools global states.
+"""
+
+import dataclasses
+import struct
+from typing import Optional
+
+import msgpack
+from algosdk.v2client.algod import AlgodClient
+
+from .asset import ASSETS_CACHE, Asset, FrozenAsset
+from .exceptions import PactSdkError
+from .pool import Pool
+from .pool_state import AppInternalState
+
+REGISTRY_MAGIC = b"PACTREG"
+REGISTRY_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct(f">{len(REGISTRY_MAGIC)}sBQ")
+_STATE_FIELDS = [field.name for field in dataclasses.fields(AppInternalState)]
+
+
+@dataclasses.dataclass
+class Registry:
+    """Pools restored from a registry file."""
+
+    round: int
+    """The round the pools state comes from. Changes after this round are not reflected in the pools."""
+
+    pools: list[Pool]
+    """The restored pools."""
+
+
+def encode_registry(pools: list[Pool], round: int) -> bytes:
+    """Serializes the pools into the registry binary format.
+
+    Args:
+        pools: The pools to serialize.
+        round: The round the pools state comes from.
+
+    Returns:
+        The encoded registry.
+    """
+    assets: dict[int, Asset] = {}
+    for pool in pools:
+        for asset in [pool.primary_asset, pool.secondary_asset, pool.liquidity_asset]:
+            assets[asset.index] = asset
+
+    payload = {
+        "assets": [
+            [asset.index, asset.decimals, asset.name, asset.unit_name]
+            for asset in assets.values()
+        ],
+        "state_fields": _STATE_FIELDS,
+        "pools": [
+            [
+                pool.app_id,
+                pool.primary_asset.index,
+                pool.secondary_asset.index,
+                pool.liquidity_asset.index,
+                [getattr(pool.internal_state, name) for name in _STATE_FIELDS],
+            ]
+            for pool in pools
+        ],
+    }
+    header = _HEADER.pack(REGISTRY_MAGIC, REGISTRY_FORMAT_VERSION, round)
+    return header + msgpack.packb(payload, use_bin_type=True)
+
+
+def decode_registry(algod: AlgodClient, data: bytes) -> Registry:
+    """Restores the pools from the registry binary format. Doesn't make any network calls.
+
+    The restored assets are put in the assets cache, so subsequent :py:func:`pactsdk.asset.fetch_asset_by_index` calls for them don't need the network either.
+
+    Args:
+        algod: The algod client the restored objects are going to use.
+        data: The encoded registry.
+
+    Raises:
+        PactSdkError: If the data is not a valid registry.
+
+    Returns:
+        The restored registry.
+    """
+    if len(data) < _HEADER.size:
+        raise PactSdkError("Invalid registry: data too short.")
+
+    magic, format_version, round = _HEADER.unpack_from(data)
+    if magic != REGISTRY_MAGIC:
+        raise PactSdkError("Invalid registry: bad magic.")
+    if format_version != REGISTRY_FORMAT_VERSION:
+        raise PactSdkError(f"Unsupported registry format version {format_version}.")
+
+    payload = msgpack.unpackb(data[_HEADER.size :], raw=False)
+
+    assets: dict[int, Asset] = {}
+    for index, decimals, name, unit_name in payload["assets"]:
+        asset = FrozenAsset(
+            algod=algod, index=index, decimals=decimals, name=name, unit_name=unit_name
+        )
+        ASSETS_CACHE[(algod, index)] = asset
+        assets[index] = asset
+
+    state_fields = payload["state_fields"]
+    pools = []
+    for app_id, primary_id, secondary_id, liquidity_id, values in payload["pools"]:
+        internal_state = AppInternalState(**dict(zip(state_fields, values)))
+        pools.append(
+            Pool(
+                algod=algod,
+                app_id=app_id,
+                primary_asset=assets[primary_id],
+                secondary_asset=assets[secondary_id],
+                liquidity_asset=assets[liquidity_id],
+                internal_state=internal_state,
+            )
+        )
+
+    for pool in pools:
+        pool.round = round
+
+    return Registry(round=round, pools=pools)
+
+
+def export_registry(path: str, pools: list[Pool], round: int):
+    """Writes the pools to a registry file.
+
+    Args:
+        path: The file to write.
+        pools: The pools to save.
+        round: The round the pools state comes from.
+    """
+    data = encode_registry(pools, round)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def load_registry(algod: AlgodClient, path: str) -> Registry:
+    """Reads the pools from a registry file. Doesn't make any network calls.
+
+    Args:
+        algod: The algod client the restored objects are going to use.
+        path: The file to read.
+
+    Returns:
+        The restored registry.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return decode_registry(algod, data)
+
+
+def get_registry_round(path: str) -> Optional[int]:
+    """Reads only the round from the registry file header.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        The round or None if the file is not a valid registry.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    magic, format_version, round = _HEADER.unpack(header)
+    if magic != REGISTRY_MAGIC or format_version != REGISTRY_FORMAT_VERSION:
+        return None
+    return round
@@ -0,0 +1,113 @@
+"""A base class for components reacting to new blocks on the chain."""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional, cast
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from .utils import get_last_round
+
+logger = logging.getLogger(__name__)
+
+
+class RoundFollower(ABC):
+    """Follows the chain round by round with a single `status_after_block` loop and calls :py:meth:`on_round` for every new round.
+
+    The loop can be run in a background thread with :py:meth:`start` or driven manually with :py:meth:`step`. The background loop survives the errors, they are logged and the following rounds are handled as usual.
+    """
+
+    algod: AlgodClient
+    """The Algorand client to use."""
+
+    last_round: Optional[int]
+    """The last round handled by :py:meth:`on_round`. None before the first step."""
+
+    retry_interval: float
+    """Seconds to wait before retrying after a network error in the background loop."""
+
+    def __init__(self, algod: AlgodClient, retry_interval=1.0):
+        """
+        Args:
+            algod: The Algorand client to use.
+            retry_interval: Seconds to wait before retrying after a network error in the background loop.
+        """
+        self.algod = algod
+        self.retry_interval = retry_interval
+        self.last_round = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    def on_round(self, round: int):
+        """Called for every new round. Must be implemented by subclasses.
+
+        Args:
+            round: The last committed round.
+        """
+
+    def step(self) -> int:
+        """Waits for the next round and handles it. The first step handles the current round without waiting.
+
+        Returns:
+            The handled round.
+        """
+        if self.last_round is None:
+            round = get_last_round(self.algod)
+        else:
+            status = cast(dict, self.algod.status_after_block(self.last_round))
+            round = status["last-round"]
+        self.last_round = round
+        self.on_round(round)
+        return round
+
+    @property
+    def is_running(self) -> bool:
+        """True if the background loop is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Starts following the rounds in a daemon thread."""
+        if self.is_running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stops the background loop.
+
+        The loop may be blocked in `status_after_block` until the next round, so stopping can take up to a round unless a timeout is given.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the thread to finish.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.step()
+            except (AlgodHTTPError, OSError) as e:
+                logger.warning(f"Following rounds failed: {e}. Retrying.")
+                self._stopped.wait(self.retry_interval)
+            except Exception:
+                # The loop must keep running, the pending work would never be resolved otherwise.
+                logger.exception(
+                    "Handling a round failed. Continuing with the next round."
+                )
+                self._stopped.wait(self.retry_interval)
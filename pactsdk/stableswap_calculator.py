@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, cast
 
 from .constant_product_calculator import get_constant_product_minted_liquidity_tokens
 from .exceptions import PactSdkError
+from .opcode_budget import get_budget_increase_count, get_stableswap_invariant_cost
 
 if TYPE_CHECKING:
     from .pool import Pool
@@ -44,7 +45,9 @@ def get_tx_fee(invariant_iterations: int, extra_margin: int) -> int:
         The required fee.
 
     """
-    inner_tx_count = math.ceil((invariant_iterations * 369) / 700)
+    inner_tx_count = get_budget_increase_count(
+        get_stableswap_invariant_cost(invariant_iterations)
+    )
     # +1 - first obligatory inner tx
     # +1 - app call
     # +2 in total
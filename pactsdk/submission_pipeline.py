@@ -0,0 +1,227 @@
+"""Utilities for sending many transaction groups with high throughput.
+
+Typical usage example::
+
+    with pactsdk.SubmissionPipeline(algod, private_key, max_in_flight=32) as pipeline:
+        futures = [pipeline.submit(group) for group in groups]
+
+    for future in futures:
+        try:
+            tx_info = future.result()
+        except pactsdk.PactSdkError as e:
+            ...
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from .confirmation_tracker import ConfirmationTracker
+from .exceptions import PactSdkError
+from .transaction_group import SigningKey, TransactionGroup, sign_group
+
+TRANSIENT_HTTP_CODES = {429, 500, 502, 503, 504}
+"""Algod response codes for which the sending is retried."""
+
+ALREADY_SENT_MESSAGES = ("transaction already in pool", "already in ledger")
+"""Algod errors meaning the transaction was already accepted, e.g. by a retried attempt whose response was lost."""
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Checks if sending may succeed when retried.
+
+    Args:
+        error: The error raised while sending.
+
+    Returns:
+        True for network errors and algod overload responses.
+    """
+    if isinstance(error, AlgodHTTPError):
+        return error.code is None or error.code in TRANSIENT_HTTP_CODES
+    return isinstance(error, OSError)
+
+
+def is_already_sent_error(error: Exception) -> bool:
+    """Checks if algod rejected the transaction because it already has it, in the transaction pool or in the ledger.
+
+    Args:
+        error: The error raised while sending.
+
+    Returns:
+        True if the transaction was already accepted.
+    """
+    if not isinstance(error, AlgodHTTPError):
+        return False
+    message = str(error)
+    return any(text in message for text in ALREADY_SENT_MESSAGES)
+
+
+class SubmissionPipeline:
+    """Signs and sends transaction groups concurrently, keeping at most `max_in_flight` groups sent but not yet confirmed.
+
+    :py:meth:`submit` blocks when the window is full, so a producer can't overload algod. Confirmations are tracked by a single :py:class:`pactsdk.confirmation_tracker.ConfirmationTracker`.
+    """
+
+    algod: AlgodClient
+    """The Algorand client to use."""
+
+    signer: Optional[SigningKey]
+    """A private key or a signer callback used to sign the groups without their own signer."""
+
+    tracker: ConfirmationTracker
+    """The tracker waiting for the confirmations."""
+
+    max_retries: int
+    """The maximum number of retries of a send failed with a transient error."""
+
+    retry_backoff: float
+    """Seconds to wait before the first retry. Doubled with each subsequent retry."""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        signer: Optional[SigningKey] = None,
+        max_in_flight=16,
+        workers=4,
+        max_retries=3,
+        retry_backoff=0.5,
+        tracker: Optional[ConfirmationTracker] = None,
+    ):
+        """
+        Args:
+            algod: The Algorand client to use.
+            signer: A private key or a :py:data:`pactsdk.factories.base_factory.Signer` callback used to sign the groups. Can be omitted if each group is submitted with its own signer.
+            max_in_flight: The maximum number of groups sent but not yet confirmed.
+            workers: The number of threads signing and sending the groups.
+            max_retries: The maximum number of retries of a send failed with a transient error.
+            retry_backoff: Seconds to wait before the first retry. Doubled with each subsequent retry.
+            tracker: A tracker to report the confirmations. If not provided, the pipeline creates and runs its own.
+        """
+        assert max_in_flight > 0, "max_in_flight must be positive"
+        self.algod = algod
+        self.signer = signer
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._owns_tracker = tracker is None
+        self.tracker = tracker or ConfirmationTracker(algod)
+        self.tracker.start()
+
+        self._window = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="pact-submit")
+        self._pending: set["Future[dict]"] = set()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        group: TransactionGroup,
+        signer: Optional[SigningKey] = None,
+        track_index=0,
+    ) -> "Future[dict]":
+        """Queues the group for signing and sending. Blocks while the in-flight window is full.
+
+        Args:
+            group: The group to send.
+            signer: The key to sign this group with, e.g. when the groups have different senders. Defaults to the pipeline's signer.
+            track_index: The index of the transaction whose pending info the future is resolved with.
+
+        Raises:
+            PactSdkError: If there is neither the group's nor the pipeline's signer.
+
+        Returns:
+            A future resolved with the pending transaction info of the tracked transaction once confirmed. It fails with the algod error if sending failed, or with the tracker errors if the group is rejected or expires.
+        """
+        signer = signer or self.signer
+        if signer is None:
+            raise PactSdkError("No signer for the group.")
+
+        self._window.acquire()
+        result: "Future[dict]" = Future()
+        result.set_running_or_notify_cancel()
+        with self._lock:
+            self._pending.add(result)
+        result.add_done_callback(self._on_done)
+        self._executor.submit(self._send, group, signer, track_index, result)
+        return result
+
+    def submit_many(self, groups: Iterable[TransactionGroup]) -> list["Future[dict]"]:
+        """Submits all the groups. See :py:meth:`submit`.
+
+        Args:
+            groups: The groups to send.
+
+        Returns:
+            A future for each of the groups.
+        """
+        return [self.submit(group) for group in groups]
+
+    def close(self, wait=True):
+        """Stops accepting new groups and releases the resources.
+
+        Args:
+            wait: If True, waits until all the submitted groups are resolved.
+        """
+        if wait:
+            with self._lock:
+                futures = list(self._pending)
+            for future in futures:
+                future.exception()
+        self._executor.shutdown(wait=wait)
+        if self._owns_tracker:
+            self.tracker.stop(timeout=0 if not wait else None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _on_done(self, result: "Future[dict]"):
+        with self._lock:
+            self._pending.discard(result)
+        self._window.release()
+
+    def _send(
+        self,
+        group: TransactionGroup,
+        signer: SigningKey,
+        track_index: int,
+        result: "Future[dict]",
+    ):
+        try:
+            data = sign_group(group, signer)
+            self._send_with_retries(data)
+        except Exception as e:
+            result.set_exception(e)
+            return
+
+        self.tracker.track_group(
+            group, callback=lambda future: _chain(future, result), index=track_index
+        )
+
+    def _send_with_retries(self, data: bytes):
+        attempt = 0
+        while True:
+            try:
+                self.algod.send_raw_transaction(data)
+                return
+            except Exception as e:
+                if is_already_sent_error(e):
+                    # A previous attempt got through after all.
+                    return
+                if attempt >= self.max_retries or not is_transient_error(e):
+                    raise
+            time.sleep(self.retry_backoff * 2**attempt)
+            attempt += 1
+
+
+def _chain(source: "Future[dict]", target: "Future[dict]"):
+    error = source.exception()
+    if error is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
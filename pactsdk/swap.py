@@ -7,11 +7,13 @@ from pactsdk.stableswap_calculator import StableswapCalculator, get_tx_fee
 
 from .asset import Asset
 from .transaction_group import TransactionGroup
+from .utils import add_slots
 
 if TYPE_CHECKING:
     from .pool import Pool
 
 
+@add_slots
 @dataclass
 class SwapEffect:
     """Swap Effect are the basic details of the effect on the pool of performing the swap."""
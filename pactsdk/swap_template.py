@@ -0,0 +1,250 @@
+"""Reusable transaction templates for performing many swaps on the same pool.
+
+:py:meth:`pactsdk.pool.Pool.build_swap_txs` creates the transactions from scratch on every call. A :py:class:`SwapTemplate` builds them once for a given pool, sender and deposited asset and then only patches the values that change between swaps.
+
+Typical usage example::
+
+    template = pool.prepare_swap_template(algo, address)
+
+    for amount in amounts:
+        swap = pool.prepare_swap(asset=algo, amount=amount, slippage_pct=1)
+        group = template.build_tx_group_from_swap(swap, suggested_params)
+"""
+
+import base64
+import copy
+from typing import TYPE_CHECKING, Optional, cast
+
+from algosdk import constants, encoding, transaction
+
+from .asset import Asset
+from .exceptions import PactSdkError
+from .swap import Swap
+from .transaction_group import TransactionGroup
+
+if TYPE_CHECKING:
+    from .pool import Pool
+
+SWAP_DEPOSIT_NOTE = b"Pact swap deposit"
+
+_PLACEHOLDER_PARAMS = transaction.SuggestedParams(
+    fee=0, first=1, last=1, gh="", flat_fee=True
+)
+
+
+class SwapTemplate:
+    """Transactions of a swap, built once and patched for each subsequent swap.
+
+    The produced transactions are identical to the ones created by :py:meth:`pactsdk.pool.Pool.build_swap_txs`.
+    """
+
+    pool: "Pool"
+    """The pool to swap on."""
+
+    address: str
+    """The address that is performing the swaps."""
+
+    asset_deposited: Asset
+    """The asset that is swapped (deposited in the contract)."""
+
+    def __init__(self, pool: "Pool", asset_deposited: Asset, address: str):
+        """
+        Args:
+            pool: The pool to swap on.
+            asset_deposited: The asset to swap.
+            address: The address that is performing the swaps.
+
+        Raises:
+            PactSdkError: If the asset is not in the pool.
+        """
+        if not pool.is_asset_in_the_pool(asset_deposited):
+            raise PactSdkError(
+                f"Asset {asset_deposited.index} not in the pool {pool.app_id}."
+            )
+
+        self.pool = pool
+        self.asset_deposited = asset_deposited
+        self.address = address
+
+        self._deposit_tx = asset_deposited.build_transfer_tx(
+            sender=address,
+            receiver=pool.get_escrow_address(),
+            amount=0,
+            note=SWAP_DEPOSIT_NOTE,
+            suggested_params=_PLACEHOLDER_PARAMS,
+        )
+        self._app_call_tx = transaction.ApplicationNoOpTxn(
+            sender=address,
+            index=pool.app_id,
+            foreign_assets=[pool.primary_asset.index, pool.secondary_asset.index],
+            app_args=["SWAP", 0],
+            sp=_PLACEHOLDER_PARAMS,
+            note=b"",
+        )
+
+    def build_txs(
+        self,
+        amount_deposited: int,
+        minimum_amount_received: int,
+        tx_fee: int,
+        suggested_params: transaction.SuggestedParams,
+        address: Optional[str] = None,
+    ) -> list[transaction.Transaction]:
+        """Creates the swap transactions by patching the template.
+
+        Args:
+            amount_deposited: The amount of the asset to deposit.
+            minimum_amount_received: The swap fails if less than this is received.
+            tx_fee: The fee of the application call, covers the inner transactions. See :py:attr:`pactsdk.swap.SwapEffect.tx_fee`.
+            suggested_params: Algorand suggested parameters for transactions.
+            address: The address that is performing the swap. Defaults to the template address.
+
+        Returns:
+            List of two transactions, the deposit and the application call. The group id is not assigned.
+        """
+        deposit_tx = patch_tx(
+            self._deposit_tx, suggested_params, sender=address, amount=amount_deposited
+        )
+        app_call_tx = patch_tx(
+            self._app_call_tx,
+            suggested_params,
+            sender=address,
+            app_args=[b"SWAP", minimum_amount_received.to_bytes(8, "big")],
+            flat_fee=tx_fee,
+        )
+        return [deposit_tx, app_call_tx]
+
+    def build_tx_group(
+        self,
+        amount_deposited: int,
+        minimum_amount_received: int,
+        tx_fee: int,
+        suggested_params: transaction.SuggestedParams,
+    ) -> TransactionGroup:
+        """Same as :py:meth:`build_txs` but puts the transactions in a group.
+
+        Returns:
+            The swap transaction group.
+        """
+        return TransactionGroup(
+            self.build_txs(
+                amount_deposited, minimum_amount_received, tx_fee, suggested_params
+            )
+        )
+
+    def build_msgpack(
+        self,
+        amount_deposited: int,
+        minimum_amount_received: int,
+        tx_fee: int,
+        suggested_params: transaction.SuggestedParams,
+    ) -> list[bytes]:
+        """Same as :py:meth:`build_tx_group` but returns the grouped transactions encoded with msgpack, ready to be signed by an external signer.
+
+        Returns:
+            Msgpack encoded unsigned transactions.
+        """
+        group = self.build_tx_group(
+            amount_deposited, minimum_amount_received, tx_fee, suggested_params
+        )
+        return [
+            base64.b64decode(encoding.msgpack_encode(tx)) for tx in group.transactions
+        ]
+
+    def build_txs_from_swap(
+        self,
+        swap: Swap,
+        suggested_params: transaction.SuggestedParams,
+        address: Optional[str] = None,
+    ) -> list[transaction.Transaction]:
+        """Creates the transactions for the swap prepared by :py:meth:`pactsdk.pool.Pool.prepare_swap`.
+
+        Args:
+            swap: The swap to perform. It must be on the template pool and deposit the template asset.
+            suggested_params: Algorand suggested parameters for transactions.
+            address: The address that is performing the swap. Defaults to the template address.
+
+        Raises:
+            PactSdkError: If the swap doesn't match the template.
+
+        Returns:
+            List of transactions to perform the swap.
+        """
+        if (
+            swap.pool.app_id != self.pool.app_id
+            or swap.asset_deposited != self.asset_deposited
+        ):
+            raise PactSdkError("The swap doesn't match the template.")
+
+        return self.build_txs(
+            swap.effect.amount_deposited,
+            swap.effect.minimum_amount_received,
+            swap.effect.tx_fee,
+            suggested_params,
+            address=address,
+        )
+
+    def build_tx_group_from_swap(
+        self, swap: Swap, suggested_params: transaction.SuggestedParams
+    ) -> TransactionGroup:
+        """Same as :py:meth:`build_txs_from_swap` but puts the transactions in a group.
+
+        Returns:
+            The swap transaction group.
+        """
+        return TransactionGroup(self.build_txs_from_swap(swap, suggested_params))
+
+
+def patch_tx(
+    tx: transaction.Transaction,
+    suggested_params: transaction.SuggestedParams,
+    sender: Optional[str] = None,
+    amount: Optional[int] = None,
+    app_args: Optional[list[bytes]] = None,
+    flat_fee: Optional[int] = None,
+) -> transaction.Transaction:
+    """Copies a template transaction and patches the values that differ between the transactions built from it.
+
+    Args:
+        tx: The template transaction. It's not modified.
+        suggested_params: Algorand suggested parameters for transactions.
+        sender: The new sender. Keeps the template sender if not provided.
+        amount: The new amount of a payment or an asset transfer.
+        app_args: The new encoded arguments of an application call.
+        flat_fee: The fee to set. If not provided, the fee is computed from the suggested parameters the same way the algosdk transaction constructors do.
+
+    Returns:
+        The patched copy of the transaction.
+    """
+    tx = copy.copy(tx)
+    if sender is not None:
+        tx.sender = sender
+    if amount is not None:
+        if isinstance(tx, transaction.PaymentTxn):
+            tx.amt = amount
+        else:
+            cast(transaction.AssetTransferTxn, tx).amount = amount
+    if app_args is not None:
+        cast(transaction.ApplicationCallTxn, tx).app_args = app_args
+
+    tx.first_valid_round = suggested_params.first
+    tx.last_valid_round = suggested_params.last
+    tx.genesis_id = suggested_params.gen
+    tx.genesis_hash = suggested_params.gh
+
+    if flat_fee is not None:
+        tx.fee = flat_fee
+    elif suggested_params.flat_fee:
+        tx.fee = suggested_params.fee
+    else:
+        min_fee = suggested_params.min_fee
+        if min_fee is None:
+            min_fee = constants.min_txn_fee
+        if suggested_params.fee == 0:
+            # Skips the costly size estimation, the result is the minimum anyway.
+            tx.fee = min_fee
+        else:
+            # Same as in the algosdk transaction constructors.
+            tx.fee = suggested_params.fee
+            tx.fee = max(tx.estimate_size() * suggested_params.fee, min_fee)
+    return tx
@@ -1,16 +1,38 @@
 import base64
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
-from algosdk import transaction
+import msgpack
+from algosdk import account, constants, encoding, error, transaction
+from nacl.signing import SigningKey as Ed25519SigningKey
 
 from pactsdk.exceptions import PactSdkError
 
+if TYPE_CHECKING:
+    from .factories.base_factory import Signer
+
+_SIGNED_TX_HEADER = b"\x82"  # fixmap with 2 entries
+_REKEYED_SIGNED_TX_HEADER = b"\x83"  # fixmap with 3 entries
+_SIGNER_KEY = msgpack.packb("sgnr")
+_SIGNATURE_KEY = msgpack.packb("sig")
+_TX_KEY = msgpack.packb("txn")
+
+SigningKey = Union[str, "Signer"]
+"""Either a private key or a :py:data:`pactsdk.factories.base_factory.Signer` callback."""
+
 
 class TransactionGroup:
-    """A convenience class to make managing Algorand transactions groups easier."""
+    """A convenience class to make managing Algorand transactions groups easier.
+
+    Each transaction is encoded with msgpack only once, when the group is created. The encoded bytes are reused for computing the group id, signing and sending, so the transactions must not be modified after they are put in a group.
+    """
 
     transactions: list[transaction.Transaction]
     """A list of transactions in a group."""
 
+    encoded_transactions: list[bytes]
+    """The canonical msgpack encoding of each transaction, with the group id."""
+
     def __init__(self, transactions: list[transaction.Transaction]):
         """Creates the TransactionGroup from an array of transactions by assigning a group id to each transaction.
 
@@ -18,18 +40,30 @@ class TransactionGroup:
             transactions: A list of transactions to put in a group.
 
         Raises:
-            PactSdkError: If the list is empty (length 0) or if the group id was not assigned to the transactions due to e.g. a failure in the Algorand SDK.
+            PactSdkError: If the list is empty (length 0).
+            TransactionGroupSizeError: If there are too many transactions for a group.
         """
         if len(transactions) == 0:
             raise PactSdkError(
                 "Cannot create TransactionGroup: empty transactions list."
             )
-        self.transactions = transaction.assign_group_id(transactions)
+        if len(transactions) > constants.tx_group_limit:
+            raise error.TransactionGroupSizeError
 
-        first_tx = self.transactions[0]
-        if not first_tx.group:
-            raise PactSdkError("Cannot retrieve group id from transaction.")
-        self.group_id_buffer = first_tx.group
+        # The same as `transaction.assign_group_id` but each transaction is dictified only once.
+        tx_dicts = [tx.dictify() for tx in transactions]
+        txids = [
+            encoding.checksum(constants.txid_prefix + _encode(tx_dict))
+            for tx_dict in tx_dicts
+        ]
+        group_id = encoding.checksum(constants.tgid_prefix + _encode({"txlist": txids}))
+        for tx, tx_dict in zip(transactions, tx_dicts):
+            tx.group = group_id
+            tx_dict["grp"] = group_id
+
+        self.transactions = transactions
+        self.encoded_transactions = [_encode(tx_dict) for tx_dict in tx_dicts]
+        self.group_id_buffer = group_id
 
     def sign(self, private_key: str) -> list[transaction.SignedTransaction]:
         """Signs all the transactions in the group with the private key.
@@ -44,6 +78,41 @@ class TransactionGroup:
         """
         return [tx.sign(private_key) for tx in self.transactions]
 
+    def sign_to_bytes(self, private_key: str) -> bytes:
+        """Signs all the transactions in the group with the private key and encodes them for sending.
+
+        The result is the same as encoding the output of :py:meth:`sign`, but the signed transactions are assembled from the cached :py:attr:`encoded_transactions` instead of being encoded again.
+
+        Args:
+            private_key: Sign the transactions with this private key.
+
+        Returns:
+            Concatenated msgpack encoded signed transactions, ready to be sent with `algod.send_raw_transaction`.
+        """
+        signing_key = Ed25519SigningKey(
+            base64.b64decode(private_key)[: constants.key_len_bytes]
+        )
+        address = account.address_from_private_key(private_key)
+        signer_entry = _SIGNER_KEY + msgpack.packb(
+            encoding.decode_address(address), use_bin_type=True
+        )
+
+        parts: list[bytes] = []
+        for tx, encoded_tx in zip(self.transactions, self.encoded_transactions):
+            signature = signing_key.sign(constants.txid_prefix + encoded_tx).signature
+            # Canonical encoding of a map with the keys in the order: sgnr, sig, txn.
+            if tx.sender == address:
+                parts.append(_SIGNED_TX_HEADER)
+            else:
+                parts += [_REKEYED_SIGNED_TX_HEADER, signer_entry]
+            parts += [
+                _SIGNATURE_KEY,
+                msgpack.packb(signature, use_bin_type=True),
+                _TX_KEY,
+                encoded_tx,
+            ]
+        return b"".join(parts)
+
     @property
     def group_id(self):
         """
@@ -51,3 +120,71 @@ class TransactionGroup:
             The group id as a base64 encoded string.
         """
         return base64.b64encode(self.group_id_buffer)
+
+
+def sign_group(group: TransactionGroup, key: SigningKey) -> bytes:
+    """Signs the group and encodes it for sending.
+
+    Args:
+        group: The group to sign.
+        key: A private key or a signer callback.
+
+    Returns:
+        Concatenated msgpack encoded signed transactions, ready to be sent with `algod.send_raw_transaction`.
+    """
+    if isinstance(key, str):
+        return group.sign_to_bytes(key)
+    signed_txs = key(group)
+    return b"".join(base64.b64decode(encoding.msgpack_encode(tx)) for tx in signed_txs)
+
+
+def sign_groups(
+    groups: Sequence[TransactionGroup],
+    keys: Union[SigningKey, Sequence[SigningKey]],
+    executor: Optional[Executor] = None,
+    chunksize: int = 1,
+) -> list[bytes]:
+    """Signs many transaction groups, optionally spreading the work over a thread or process pool.
+
+    Signing is done by libsodium which releases the GIL, so a `ThreadPoolExecutor` already gives a speedup. A `ProcessPoolExecutor` parallelizes also the msgpack encoding, but then the signer callbacks must be picklable (e.g. module level functions).
+
+    Args:
+        groups: The groups to sign.
+        keys: A private key or a signer callback used for all the groups, or a sequence with a key for each group.
+        executor: The executor to run the signing in. If not provided, the groups are signed in the calling thread.
+        chunksize: The number of groups sent to a worker process at once. Ignored by thread pools.
+
+    Raises:
+        PactSdkError: If the number of keys doesn't match the number of groups.
+
+    Returns:
+        Signed and encoded groups in the order of `groups`. See :py:func:`sign_group`.
+    """
+    if isinstance(keys, str) or callable(keys):
+        keys_list = [keys] * len(groups)
+    else:
+        keys_list = list(keys)
+        if len(keys_list) != len(groups):
+            raise PactSdkError(
+                f"Got {len(keys_list)} keys for {len(groups)} transaction groups."
+            )
+
+    if executor is None:
+        return [sign_group(group, key) for group, key in zip(groups, keys_list)]
+
+    return list(executor.map(sign_group, groups, keys_list, chunksize=chunksize))
+
+
+def _encode(obj: dict) -> bytes:
+    """Canonical msgpack encoding, the same as `algosdk.encoding.msgpack_encode` but without base64."""
+    return msgpack.packb(_canonical(obj), use_bin_type=True)
+
+
+def _canonical(obj: dict) -> dict:
+    result = {}
+    for key, value in sorted(obj.items()):
+        if isinstance(value, dict):
+            result[key] = _canonical(value)
+        elif value:
+            result[key] = value
+    return result
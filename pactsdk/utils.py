@@ -1,9 +1,23 @@
 import base64
+import dataclasses
 from copy import copy
-from typing import Any
+from typing import Any, TypeVar
 
 import algosdk
-from Cryptodome.Hash import SHA512
+
+from .exceptions import PactSdkError
+
+T = TypeVar("T")
+
+
+def require_numpy():
+    """Raises a helpful error if NumPy is not installed."""
+    try:
+        import numpy  # noqa
+    except ImportError:
+        raise PactSdkError(
+            "NumPy is required for this feature. Install it with `pip install pactsdk[numpy]`."
+        )
 
 
 def sp_fee(
@@ -41,6 +55,9 @@ def parse_app_state(kv: list) -> dict[str, Any]:
 
 
 def get_selector(method_signature: str) -> bytes:
+    # Imported here to not pay for Cryptodome on import, the SDK uses precomputed selectors.
+    from Cryptodome.Hash import SHA512
+
     hash_ = SHA512.new(truncate="256")
     hash_.update(method_signature.encode("utf-8"))
     return hash_.digest()[:4]
@@ -69,3 +86,95 @@ def wait_for_confirmation(algod: algosdk.v2client.algod.AlgodClient, txid: str)
         algod.status_after_block(last_round)
         txinfo = algod.pending_transaction_info(txid)
     return txinfo
+
+
+def add_slots(cls: type[T]) -> type[T]:
+    """Recreates a dataclass with `__slots__`, dropping the per-instance `__dict__`. A backport of `dataclass(slots=True)` from Python 3.10.
+
+    Must be applied on top of the `dataclass` decorator. Frozen dataclasses get `__getstate__` and `__setstate__` so they can still be copied and pickled.
+
+    Args:
+        cls: The dataclass to convert.
+
+    Returns:
+        The new slotted class.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))  # type: ignore
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Remove the defaults, they would conflict with the slot descriptors.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    if cls.__dataclass_params__.frozen:  # type: ignore
+        cls_dict["__getstate__"] = _frozen_getstate
+        cls_dict["__setstate__"] = _frozen_setstate
+
+    new_cls = type(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def frozen_variant(cls: type[T]) -> type[T]:
+    """Creates an immutable subclass of a slotted dataclass, see :py:func:`add_slots`.
+
+    The instances are created with the same arguments as the instances of the base class and are instances of the base class too. Assigning or deleting their attributes raises `dataclasses.FrozenInstanceError`. If the base class isn't hashable, the variant is hashed by the fields.
+
+    Args:
+        cls: The slotted dataclass.
+
+    Returns:
+        The frozen subclass.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # The fields are set by the mutable base class, then the instance is switched to the frozen class. The slot layout is the same.
+        object.__setattr__(self, "__class__", cls)
+        cls.__init__(self, *args, **kwargs)  # type: ignore
+        object.__setattr__(self, "__class__", frozen_cls)
+
+    def __setattr__(self, name: str, value: Any):
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str):
+        raise dataclasses.FrozenInstanceError(f"cannot delete field '{name}'")
+
+    cls_dict = {
+        "__slots__": (),
+        "__doc__": f"An immutable :py:class:`{cls.__module__}.{cls.__qualname__}`.",
+        "__module__": cls.__module__,
+        "__init__": __init__,
+        "__setattr__": __setattr__,
+        "__delattr__": __delattr__,
+        "__getstate__": _frozen_getstate,
+        "__setstate__": _frozen_setstate,
+    }
+    if getattr(cls, "__hash__", None) is None:
+        # The dataclass generated comparison, which requires the same class. The frozen and the mutable instances with the same fields are equal.
+        cls_dict["__eq__"] = _fields_eq
+        cls_dict["__hash__"] = _fields_hash
+
+    frozen_cls = type(f"Frozen{cls.__name__}", (cls,), cls_dict)
+    return frozen_cls
+
+
+def _fields_eq(self, other: object) -> bool:
+    if not isinstance(other, type(self).__mro__[1]):
+        return NotImplemented
+    return _frozen_getstate(self) == _frozen_getstate(other)
+
+
+def _fields_hash(self) -> int:
+    return hash(tuple(_frozen_getstate(self)))
+
+
+def _frozen_getstate(self) -> list:
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _frozen_setstate(self, state: list):
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
@@ -1,6 +1,7 @@
 """Set of utility classes for managing and performing zaps.
 """
 import copy
+import dataclasses
 import math
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -154,13 +155,19 @@ class Zap:
         return params
 
     def prepare_add_liq(self):
-        updated_state = self.pool.state
+        state = self.pool.state
         if self._is_asset_primary():
-            updated_state.total_primary += self.params.swap_deposited
-            updated_state.total_secondary -= self.params.secondary_add_liq
+            updated_state = dataclasses.replace(
+                state,
+                total_primary=state.total_primary + self.params.swap_deposited,
+                total_secondary=state.total_secondary - self.params.secondary_add_liq,
+            )
         else:
-            updated_state.total_primary -= self.params.primary_add_liq
-            updated_state.total_secondary += self.params.swap_deposited
+            updated_state = dataclasses.replace(
+                state,
+                total_primary=state.total_primary - self.params.primary_add_liq,
+                total_secondary=state.total_secondary + self.params.swap_deposited,
+            )
 
         pool = copy.copy(self.pool)
         pool.state = updated_state
@@ -0,0 +1,122 @@
+import base64
+import threading
+import time
+
+import msgpack
+from algosdk import encoding, transaction
+from algosdk.error import AlgodHTTPError
+
+from .utils import make_suggested_params
+
+
+class FakeAlgod:
+    """An in-memory stand-in for the algod client. Sent transactions are confirmed in the next round."""
+
+    def __init__(self, round=1, block_time=0.001):
+        self.round = round
+        self.block_time = block_time
+        self.txs: dict[str, dict] = {}
+        self.sent_groups: list[list[str]] = []
+        self.send_errors: list[AlgodHTTPError] = []
+        """Errors raised by the subsequent send calls."""
+        self.lost_responses: list[AlgodHTTPError] = []
+        """Errors raised by the subsequent send calls after the transactions are accepted."""
+        self.dropped: set[str] = set()
+        """Transactions that are accepted, but never confirmed."""
+        self.rejected: dict[str, str] = {}
+        """Transactions that are removed from the pool with the given error."""
+        self.next_app_id = 1000
+        """The id of the next created application."""
+        self.blocks: dict[int, list[str]] = {}
+        """The ids of the transactions confirmed in each round."""
+        self.pending_info_calls = 0
+        self.max_unconfirmed = 0
+        """The maximum number of sent, but not yet resolved transactions."""
+        self._lock = threading.RLock()
+
+    def status(self) -> dict:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round: int) -> dict:
+        time.sleep(self.block_time)
+        with self._lock:
+            if self.round <= round:
+                self.round = round + 1
+                self._process_round()
+            return {"last-round": self.round}
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        return make_suggested_params(first=self.round, last=self.round + 1000)
+
+    def send_raw_transaction(self, txn: bytes, **kwargs) -> str:
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+
+        txids = []
+        with self._lock:
+            for signed_tx_dict in _unpack(txn):
+                signed_tx = transaction.SignedTransaction.undictify(signed_tx_dict)
+                if signed_tx.transaction.last_valid_round < self.round:
+                    raise AlgodHTTPError("txn dead", 400)
+                txid = signed_tx.get_txid()
+                if txid in self.txs:
+                    where = "ledger" if "confirmed-round" in self.txs[txid] else "pool"
+                    raise AlgodHTTPError(
+                        f"TransactionPool.Remember: transaction already in {where}: {txid}",
+                        400,
+                    )
+                txids.append(txid)
+                self.txs[txid] = {"pool-error": "", "submitted-round": self.round}
+                tx = signed_tx.transaction
+                if isinstance(tx, transaction.ApplicationCallTxn) and not tx.index:
+                    self.txs[txid]["application-index"] = self.next_app_id
+                    self.next_app_id += 1
+
+            self.sent_groups.append(txids)
+            unconfirmed = [
+                info
+                for info in self.txs.values()
+                if not info.get("confirmed-round") and not info["pool-error"]
+            ]
+            self.max_unconfirmed = max(self.max_unconfirmed, len(unconfirmed))
+
+        if self.lost_responses:
+            raise self.lost_responses.pop(0)
+        return txids[0]
+
+    def send_transactions(self, txns: list, **kwargs) -> str:
+        return self.send_raw_transaction(
+            b"".join(base64.b64decode(encoding.msgpack_encode(tx)) for tx in txns)
+        )
+
+    def pending_transaction_info(self, txid: str, **kwargs) -> dict:
+        self.pending_info_calls += 1
+        with self._lock:
+            if txid not in self.txs:
+                raise AlgodHTTPError("txn does not exist", 404)
+            return dict(self.txs[txid])
+
+    def get_block_txids(self, round: int, **kwargs) -> dict:
+        with self._lock:
+            if round > self.round:
+                raise AlgodHTTPError(
+                    "failed to retrieve information from the ledger", 404
+                )
+            return {"blockTxids": list(self.blocks.get(round, []))}
+
+    def _process_round(self):
+        block = self.blocks.setdefault(self.round, [])
+        for txid, info in self.txs.items():
+            if info.get("confirmed-round") or info["pool-error"]:
+                continue
+            if txid in self.rejected:
+                info["pool-error"] = self.rejected[txid]
+            elif txid not in self.dropped and info["submitted-round"] < self.round:
+                info["confirmed-round"] = self.round
+                block.append(txid)
+
+
+def _unpack(data: bytes) -> list[dict]:
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    unpacker.feed(data)
+    return list(unpacker)
@@ -1,10 +1,18 @@
+import base64
+import datetime
+import threading
+from collections import Counter
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional
 
+import algosdk
+import msgpack
 from algosdk import transaction
 
 import pactsdk
+from pactsdk.encoding import serialize_uint64
+from pactsdk.utils import parse_app_state
 
 from .utils import (
     Account,
@@ -215,3 +223,157 @@ def fetch_user_assets_balance(
         asset: asset.get_holding_from_account_info(account_info) or 0
         for asset in farm.state.reward_assets + [farm.staked_asset]
     }
+
+
+def _encode_address(address: str) -> str:
+    return base64.b64encode(algosdk.encoding.decode_address(address)).decode()
+
+
+def make_farm_from_state(
+    app_id=100,
+    staked_asset_id=10,
+    reward_asset_ids: Optional[list[int]] = None,
+    pending_rewards: Optional[list[int]] = None,
+    next_rewards: Optional[list[int]] = None,
+    rpt: Optional[list[int]] = None,
+    rpt_frac: Optional[list[int]] = None,
+    duration=0,
+    next_duration=0,
+    total_staked=0,
+    num_stakers=0,
+    updated_at: Optional[datetime.datetime] = None,
+) -> pactsdk.Farm:
+    """Builds a farm without touching the network. Useful for testing pure calculations."""
+    reward_asset_ids = reward_asset_ids or [0]
+    zeros = [0] * len(reward_asset_ids)
+    address = algosdk.logic.get_application_address(app_id)
+    updated_at = updated_at or datetime.datetime(2023, 1, 1)
+    raw_state = {
+        "StakedAssetID": staked_asset_id,
+        "RewardAssetIDs": serialize_uint64(reward_asset_ids),
+        "ClaimedRewards": serialize_uint64(zeros),
+        "TotalRewards": serialize_uint64(zeros),
+        "PendingRewards": serialize_uint64(pending_rewards or zeros),
+        "NextRewards": serialize_uint64(next_rewards or zeros),
+        "RPT": serialize_uint64(rpt or zeros),
+        "RPT_frac": serialize_uint64(rpt_frac or zeros),
+        "Duration": duration,
+        "NextDuration": next_duration,
+        "NumStakers": num_stakers,
+        "TotalStaked": total_staked,
+        "UpdatedAt": int(updated_at.timestamp()),
+        "Admin": _encode_address(address),
+        "Updater": _encode_address(address),
+        "VERSION": 100,
+    }
+    return pactsdk.make_farm_from_raw_state(algod, app_id, raw_state)
+
+
+def make_farm_local_state(
+    farm: pactsdk.Farm,
+    escrow_id: int,
+    staked: int,
+    accrued_rewards: Optional[list[int]] = None,
+    rpt: Optional[list[int]] = None,
+    rpt_frac: Optional[list[int]] = None,
+) -> dict:
+    """Builds the farm's entry of `apps-local-state` in the account info."""
+    zeros = [0] * len(farm.state.reward_assets)
+
+    def uint(key: str, value: int) -> dict:
+        return {
+            "key": base64.b64encode(key.encode()).decode(),
+            "value": {"type": 2, "uint": value, "bytes": ""},
+        }
+
+    def uints(key: str, values: list[int]) -> dict:
+        return {
+            "key": base64.b64encode(key.encode()).decode(),
+            "value": {"type": 1, "uint": 0, "bytes": serialize_uint64(values)},
+        }
+
+    return {
+        "id": farm.app_id,
+        "key-value": [
+            uint("EscrowID", escrow_id),
+            uint("Staked", staked),
+            uints("AccruedRewards", accrued_rewards or zeros),
+            uints("ClaimedRewards", zeros),
+            uints("RPT", rpt or zeros),
+            uints("RPT_frac", rpt_frac or zeros),
+        ],
+    }
+
+
+def encode_app_state(raw_state: dict) -> list[dict]:
+    """The inverse of `pactsdk.utils.parse_app_state`."""
+    return [
+        {
+            "key": base64.b64encode(key.encode()).decode(),
+            "value": (
+                {"type": 2, "uint": value, "bytes": ""}
+                if isinstance(value, int)
+                else {"type": 1, "uint": 0, "bytes": value}
+            ),
+        }
+        for key, value in raw_state.items()
+    ]
+
+
+class FarmsAlgod:
+    """Serves the farm global states, the blocks, the account and the asset infos, counting the requests."""
+
+    def __init__(
+        self, farms: list[pactsdk.Farm], accounts: Optional[dict[str, dict]] = None
+    ):
+        self.global_states = {
+            farm.app_id: encode_app_state(farm.raw_state) for farm in farms
+        }
+        self.accounts = accounts or {}
+        self.round = 1
+        self.blocks: dict[int, list[dict]] = {}
+        """The transactions of the blocks, by round."""
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def set_farm_state(self, farm: pactsdk.Farm, **raw_state):
+        """Updates the farm's global state and records a call of the farm in the next block."""
+        state = {**parse_app_state(self.global_states[farm.app_id]), **raw_state}
+        self.global_states[farm.app_id] = encode_app_state(state)
+        self.blocks.setdefault(self.round + 1, []).append(
+            {"txn": {"type": "appl", "apid": farm.app_id}}
+        )
+
+    def status(self) -> dict:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round: int) -> dict:
+        self.round = max(self.round, round + 1)
+        return {"last-round": self.round}
+
+    def block_info(self, round: int, response_format="json") -> bytes:
+        assert response_format == "msgpack"
+        with self._lock:
+            self.calls["block_info"] += 1
+        return msgpack.packb(
+            {"block": {"rnd": round, "txns": self.blocks.get(round, [])}}
+        )
+
+    def application_info(self, app_id: int) -> dict:
+        with self._lock:
+            self.calls["application_info"] += 1
+        return {"id": app_id, "params": {"global-state": self.global_states[app_id]}}
+
+    def account_info(self, address: str) -> dict:
+        with self._lock:
+            self.calls["account_info"] += 1
+        return {"address": address, "amount": 0, **self.accounts.get(address, {})}
+
+    def asset_info(self, index: int) -> dict:
+        with self._lock:
+            self.calls["asset_info"] += 1
+            self.calls[index] += 1
+        return {
+            "index": index,
+            "params": {"decimals": index % 7, "name": f"A{index}", "unit-name": "A"},
+        }
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Union
 
 import pactsdk
+from pactsdk.pool_state import AppInternalState
 
 from .utils import (
     Account,
@@ -78,6 +79,45 @@ def deploy_exchange(
     return deploy_contract(account, command)
 
 
+def make_pool_from_state(
+    total_primary=100_000,
+    total_secondary=100_000,
+    total_liquidity=100_000,
+    fee_bps=30,
+    app_id=1,
+    primary_asset_index=0,
+    secondary_asset_index=2,
+    primary_decimals=6,
+    secondary_decimals=6,
+    contract_name="PACT AMM",
+    **extra_state,
+) -> pactsdk.Pool:
+    """Builds a pool without touching the network. Useful for testing pure calculations."""
+    return pactsdk.Pool(
+        algod=algod,
+        app_id=app_id,
+        primary_asset=pactsdk.Asset(
+            algod=algod, index=primary_asset_index, decimals=primary_decimals
+        ),
+        secondary_asset=pactsdk.Asset(
+            algod=algod, index=secondary_asset_index, decimals=secondary_decimals
+        ),
+        liquidity_asset=pactsdk.Asset(algod=algod, index=app_id + 1, decimals=6),
+        internal_state=AppInternalState(
+            A=total_primary,
+            B=total_secondary,
+            ASSET_A=primary_asset_index,
+            ASSET_B=secondary_asset_index,
+            LTID=app_id + 1,
+            L=total_liquidity,
+            FEE_BPS=fee_bps,
+            CONTRACT_NAME=contract_name,
+            PACT_FEE_BPS=0,
+            **extra_state,
+        ),
+    )
+
+
 def add_liquidity(
     account: Account,
     pool: pactsdk.Pool,
@@ -195,3 +235,34 @@ def assert_pool_state(
     assert swap.effect.secondary_asset_price_change_pct == (
         (new_state.secondary_asset_price / old_state.secondary_asset_price) * 100 - 100
     )
+
+
+def make_price_graph_pools() -> list[pactsdk.Pool]:
+    """Pools connecting ALGO, USDC (asset 5) and token 7 (2 decimals), and a pool not connected to them."""
+    return [
+        # 1 ALGO = 0.3 USDC (asset 5).
+        make_pool_from_state(
+            app_id=10,
+            secondary_asset_index=5,
+            total_primary=10**12,
+            total_secondary=3 * 10**11,
+            total_liquidity=10**9,
+        ),
+        # 1 token 7 = 20 ALGO. The deepest of the ALGO pools with token 7.
+        make_pool_from_state(
+            app_id=20,
+            secondary_asset_index=7,
+            secondary_decimals=2,
+            total_primary=2 * 10**9,
+            total_secondary=10_000,
+        ),
+        make_pool_from_state(
+            app_id=30,
+            secondary_asset_index=7,
+            secondary_decimals=2,
+            total_primary=10**6,
+            total_secondary=100,
+        ),
+        # Not connected to the anchors.
+        make_pool_from_state(app_id=40, primary_asset_index=8, secondary_asset_index=9),
+    ]
@@ -0,0 +1,70 @@
+import base64
+
+import pytest
+from algosdk import abi
+
+from pactsdk.abi_codec import (
+    UINT8,
+    decode_uint64_static_array,
+    encode_uint8,
+    encode_uint16,
+    encode_uint64,
+    encode_uint64_array,
+    encode_uint64_static_array,
+)
+from pactsdk.factories import PoolParams
+from pactsdk.folks_lending_pool import ABI_BYTE
+
+
+def test_abi_codec_matches_algosdk():
+    for value in [0, 1, 127, 255]:
+        assert encode_uint8(value) == abi.UintType(8).encode(value)
+        assert UINT8[value] == abi.UintType(8).encode(value)
+
+    for value in [0, 1, 256, 2**16 - 1]:
+        assert encode_uint16(value) == abi.UintType(16).encode(value)
+
+    for value in [0, 1, 2**32, 2**64 - 1]:
+        assert encode_uint64(value) == abi.UintType(64).encode(value)
+
+    arrays: list[list[int]] = [[], [0], [1, 2**64 - 1, 5]]
+    for values in arrays:
+        assert encode_uint64_array(values) == abi.ArrayDynamicType(
+            abi.UintType(64)
+        ).encode(values)
+
+    values = [123, 456, 30, 2**64 - 1]
+    static_type = abi.ArrayStaticType(abi.UintType(64), 4)
+    assert encode_uint64_static_array(values) == static_type.encode(values)
+    assert decode_uint64_static_array(static_type.encode(values)) == values
+
+
+def test_abi_codec_out_of_range():
+    with pytest.raises(ValueError):
+        encode_uint8(256)
+    with pytest.raises(ValueError):
+        decode_uint64_static_array(b"\x00" * 9)
+
+
+def test_pool_params_box_name():
+    params = PoolParams(
+        primary_asset_id=0, secondary_asset_id=123, fee_bps=30, version=201
+    )
+    box_name = params.to_box_name()
+    assert box_name == abi.ArrayStaticType(abi.UintType(64), 4).encode(
+        [0, 123, 30, 201]
+    )
+
+    assert PoolParams.from_box_name(base64.b64encode(box_name).decode()) == params
+
+
+def test_deprecated_abi_aliases():
+    assert ABI_BYTE.encode(3) == abi.UintType(8).encode(3)
+    assert ABI_BYTE.decode(b"\x03") == 3
+
+    values = [0, 123, 30, 201]
+    static_type = abi.ArrayStaticType(abi.UintType(64), 4)
+    assert PoolParams.abi.encode(values) == static_type.encode(values)
+    assert PoolParams.abi.decode(static_type.encode(values)) == values
+    with pytest.raises(ValueError):
+        PoolParams.abi.encode(values[:3])
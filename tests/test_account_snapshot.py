@@ -0,0 +1,59 @@
+import algosdk
+
+import pactsdk
+
+from .farming_utils import make_farm_from_state, make_farm_local_state
+
+ADDRESS = algosdk.account.generate_account()[1]
+
+
+def test_account_snapshot():
+    farm = make_farm_from_state(app_id=100, reward_asset_ids=[0, 20])
+    other_farm = make_farm_from_state(app_id=200)
+    account_info = {
+        "address": ADDRESS,
+        "amount": 5_000_000,
+        "round": 1234,
+        "assets": [
+            {"asset-id": 10, "amount": 0, "is-frozen": False},
+            {"asset-id": 20, "amount": 300, "is-frozen": False},
+        ],
+        "apps-local-state": [
+            make_farm_local_state(
+                farm, escrow_id=150, staked=1000, accrued_rewards=[5, 6], rpt=[1, 2]
+            ),
+            {"id": 300},
+        ],
+    }
+
+    snapshot = pactsdk.AccountSnapshot(account_info)
+    assert snapshot.address == ADDRESS
+    assert snapshot.round == 1234
+
+    algo = farm.state.reward_assets[0]
+    reward_asset = farm.state.reward_assets[1]
+    assert snapshot.get_holding(algo) == 5_000_000
+    assert snapshot.get_holding(reward_asset) == 300
+    assert snapshot.get_holding(10) == 0
+    assert snapshot.get_holding(30) is None
+    assert snapshot.is_opted_in(farm.staked_asset)
+    assert not snapshot.is_opted_in(30)
+    for asset in [algo, reward_asset, farm.staked_asset]:
+        assert snapshot.get_holding(asset) == asset.get_holding_from_account_info(
+            account_info
+        )
+
+    assert snapshot.is_opted_in_to_app(100)
+    assert snapshot.is_opted_in_to_app(300)
+    assert not snapshot.is_opted_in_to_app(200)
+
+    user_state = snapshot.get_farm_user_state(farm)
+    assert user_state == farm.get_user_state_from_account_info(account_info)
+    assert user_state is not None
+    assert user_state.escrow_id == 150
+    assert user_state.staked == 1000
+    assert user_state.accrued_rewards == {algo: 5, reward_asset: 6}
+    assert user_state.rpt == {algo: 1, reward_asset: 2}
+    assert snapshot.get_farm_user_state(other_farm) is None
+
+    assert snapshot.get_farm_user_states([farm, other_farm]) == {100: user_state}
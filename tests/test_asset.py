@@ -1,3 +1,7 @@
+import copy
+import dataclasses
+import pickle
+
 import algosdk
 import pytest
 
@@ -17,6 +21,59 @@ def test_fetch_algo():
     assert asset.ratio == 10**6
 
 
+def test_asset_is_slotted_and_optionally_frozen():
+    asset = pactsdk.fetch_asset_by_index(algod, 0)
+
+    # Cached assets are shared instead of copied.
+    assert pactsdk.fetch_asset_by_index(algod, 0) is asset
+    assert not hasattr(asset, "__dict__")
+
+    # The shared assets can't be modified. Changing a mutable copy doesn't affect the cache.
+    assert isinstance(asset, pactsdk.FrozenAsset)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        asset.decimals = 2  # type: ignore
+    asset_copy = pactsdk.Asset(
+        algod=algod, index=0, decimals=asset.decimals, name=asset.name
+    )
+    assert asset_copy == asset
+    assert asset_copy.ratio == 10**6
+    asset_copy.decimals = 2
+    asset_copy.name = "Changed"
+    assert asset_copy.ratio == 100
+    cached_asset = pactsdk.fetch_asset_by_index(algod, 0)
+    assert cached_asset.decimals == 6
+    assert cached_asset.ratio == 10**6
+    assert cached_asset.name == "Algo"
+
+    frozen_asset = pactsdk.FrozenAsset(algod=algod, index=5, decimals=3)
+    assert isinstance(frozen_asset, pactsdk.Asset)
+    assert frozen_asset.ratio == 1000
+    assert not hasattr(frozen_asset, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen_asset.decimals = 2  # type: ignore
+    assert copy.copy(frozen_asset).ratio == 1000
+    assert pickle.loads(pickle.dumps(frozen_asset)).decimals == 3
+
+    pool_state = pactsdk.PoolState(
+        total_liquidity=1,
+        total_primary=2,
+        total_secondary=3,
+        primary_asset_price=1.5,
+        secondary_asset_price=0.5,
+    )
+    assert pickle.loads(pickle.dumps(pool_state)) == pool_state
+    assert dataclasses.replace(pool_state, total_primary=5).total_primary == 5
+    pool_state.total_primary = 4
+    assert pool_state.total_primary == 4
+
+    frozen_state = pactsdk.FrozenPoolState(**dataclasses.asdict(pool_state))
+    assert frozen_state == pool_state
+    assert {frozen_state: 1}[frozen_state] == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen_state.total_primary = 5  # type: ignore
+    assert pickle.loads(pickle.dumps(frozen_state)) == frozen_state
+
+
 def test_fetch_asa():
     pact = pactsdk.PactClient(algod)
     account = new_account()
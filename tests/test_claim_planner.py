@@ -0,0 +1,115 @@
+from typing import Any
+
+import algosdk
+import pytest
+from algosdk import transaction
+
+from pactsdk import gas_station
+from pactsdk.exceptions import PactSdkError
+from pactsdk.farming import ClaimPlanner
+from pactsdk.gas_station import GasStation
+
+from .farming_utils import make_farm_from_state
+from .utils import make_suggested_params
+
+
+@pytest.fixture
+def fake_gas_station(monkeypatch):
+    station = GasStation(app_id=1)
+    monkeypatch.setattr(gas_station, "_gas_station", station)
+    return station
+
+
+def make_address() -> str:
+    private_key = algosdk.account.generate_account()[0]
+    return algosdk.account.address_from_private_key(private_key)
+
+
+def app_ids(group) -> list[int]:
+    return [
+        tx.index if isinstance(tx, transaction.ApplicationCallTxn) else 0
+        for tx in group.transactions
+    ]
+
+
+def test_claim_planner_packs_many_farms(fake_gas_station):
+    sp = make_suggested_params()
+    address = make_address()
+    farms = [
+        make_farm_from_state(app_id=100 + i, reward_asset_ids=[1, 2, 3])
+        for i in range(20)
+    ]
+    escrows = [farm.make_escrow(1000 + i, address) for i, farm in enumerate(farms)]
+
+    planner = ClaimPlanner(sp)
+    for escrow in escrows:
+        planner.add_claim(escrow)
+    groups = planner.build()
+
+    assert [len(group.transactions) for group in groups] == [15, 15, 13]
+    claimed_farms = [
+        app_id for group in groups for app_id in app_ids(group) if app_id >= 100
+    ]
+    # An update and a claim for each farm, in the order of adding.
+    assert claimed_farms == [farm.app_id for farm in farms for _ in range(2)]
+
+    update_cost = farms[0].get_update_opcode_cost()
+    for group in groups:
+        increase_tx: Any = group.transactions[0]
+        assert increase_tx.index == fake_gas_station.app_id
+        farms_count = (len(group.transactions) - 1) // 2
+        # The gas station call adds its own budget too.
+        missing = farms_count * update_cost - (farms_count + 1) * 700
+        expected_count = max(0, -(-missing // 700))
+        assert int.from_bytes(increase_tx.app_args[1], "big") == expected_count
+
+    assert planner.total_fee == sum(
+        tx.fee for group in groups for tx in group.transactions
+    )
+
+    # Each farm claimed in its own group needs its own gas station call.
+    separate_fee = 0
+    for escrow in escrows:
+        escrow.farm.set_suggested_params(sp)
+        separate_fee += sum(
+            tx.fee for tx in escrow.farm.build_update_with_opcode_increase_txs(escrow)
+        )
+        separate_fee += escrow.build_claim_rewards_tx().fee
+    assert planner.total_fee < separate_fee
+
+    # Claims added after building are not dropped.
+    planner.add_claim(escrows[0])
+    private_key = algosdk.account.generate_account()[0]
+    assert [len(group) for group in planner.sign(private_key)] == [15, 15, 15]
+
+
+def test_claim_planner_restake(fake_gas_station):
+    sp = make_suggested_params()
+    address = make_address()
+    farm_a = make_farm_from_state(app_id=100, staked_asset_id=10, reward_asset_ids=[7])
+    farm_b = make_farm_from_state(app_id=200, staked_asset_id=7, reward_asset_ids=[8])
+    farm_c = make_farm_from_state(app_id=300, staked_asset_id=9, reward_asset_ids=[8])
+    escrow_a = farm_a.make_escrow(1000, address)
+    escrow_b = farm_b.make_escrow(2000, address)
+    escrow_c = farm_c.make_escrow(3000, address)
+
+    planner = ClaimPlanner(sp)
+    planner.add_claim(escrow_a).add_claim(escrow_b)
+    planner.add_restake(escrow_b, 500).add_restake(escrow_c, 100)
+    [group] = planner.build()
+
+    txs: list[Any] = group.transactions
+    # The claimed asset 7 is staked right after the claim in farm A.
+    assert app_ids(group) == [100, 100, 0, 200, 200, 200, 0, 300]
+    assert txs[2].receiver == escrow_b.address
+    assert txs[2].index == 7
+    assert txs[2].amount == 500
+    assert txs[6].index == 9
+    assert txs[6].receiver == escrow_c.address
+
+    with pytest.raises(PactSdkError):
+        ClaimPlanner(sp).build()
+
+    other_escrow = farm_c.make_escrow(4000, make_address())
+    with pytest.raises(PactSdkError):
+        ClaimPlanner(sp).add_claim(escrow_a).add_claim(other_escrow).build()
@@ -0,0 +1,117 @@
+import algosdk
+import pytest
+
+import pactsdk
+
+from .fake_algod import FakeAlgod
+
+PRIVATE_KEY, ADDRESS = algosdk.account.generate_account()
+
+
+def send_group(
+    algod: FakeAlgod, amount: int, lifetime=1000
+) -> pactsdk.TransactionGroup:
+    sp = algod.suggested_params()
+    sp.last = sp.first + lifetime
+    group = pactsdk.TransactionGroup(
+        [algosdk.transaction.PaymentTxn(ADDRESS, sp, ADDRESS, amount)]
+    )
+    algod.send_transactions(group.sign(PRIVATE_KEY))
+    return group
+
+
+def test_confirmation_tracker_resolves_many_transactions():
+    algod = FakeAlgod(round=10)
+    tracker = pactsdk.ConfirmationTracker(algod)  # type: ignore
+
+    groups = [send_group(algod, amount) for amount in range(500)]
+    resolved: list = []
+    futures = [tracker.track_group(group, callback=resolved.append) for group in groups]
+    assert len(tracker) == 500
+
+    # Current round, nothing confirmed yet.
+    assert tracker.step() == 10
+    assert not any(future.done() for future in futures)
+
+    assert tracker.step() == 11
+    assert len(tracker) == 0
+    assert len(resolved) == 500
+    assert all(future.result()["confirmed-round"] == 11 for future in futures)
+
+
+def test_confirmation_tracker_rejected_and_expired():
+    algod = FakeAlgod(round=10)
+    tracker = pactsdk.ConfirmationTracker(algod)  # type: ignore
+
+    rejected = send_group(algod, 1, lifetime=5)
+    dropped = send_group(algod, 2, lifetime=2)
+    algod.rejected[rejected.transactions[0].get_txid()] = "overspend"
+    algod.dropped.add(dropped.transactions[0].get_txid())
+    rejected_future = tracker.track_group(rejected)
+    dropped_future = tracker.track_group(dropped)
+    unknown_future = tracker.track("UNKNOWN", last_valid_round=13)
+
+    tracker.step()
+    tracker.step()
+    with pytest.raises(pactsdk.TransactionRejectedError, match="overspend"):
+        rejected_future.result()
+    assert not dropped_future.done()
+
+    tracker.step()
+    with pytest.raises(pactsdk.TransactionExpiredError):
+        dropped_future.result()
+    assert not unknown_future.done()
+
+    tracker.step()
+    with pytest.raises(pactsdk.TransactionExpiredError):
+        unknown_future.result()
+
+
+def test_confirmation_tracker_reads_blocks():
+    algod = FakeAlgod(round=10)
+    tracker = pactsdk.ConfirmationTracker(algod, poll_rounds=5)  # type: ignore
+
+    groups = [send_group(algod, amount, lifetime=20) for amount in range(500)]
+    for group in groups[100:]:
+        algod.dropped.add(group.transactions[0].get_txid())
+    futures = [tracker.track_group(group) for group in groups]
+
+    # The first round polls all the transactions.
+    assert tracker.step() == 10
+    assert algod.pending_info_calls == 500
+
+    # Only the transactions confirmed in the block are fetched.
+    assert tracker.step() == 11
+    assert algod.pending_info_calls == 600
+    assert all(future.result()["confirmed-round"] == 11 for future in futures[:100])
+    assert len(tracker) == 400
+
+    for _ in range(12, 20):
+        tracker.step()
+    assert algod.pending_info_calls == 600
+
+    # A transaction tracked later is polled once, in case it's already confirmed.
+    late = send_group(algod, 1000)
+    tracker.step()
+    late_future = tracker.track_group(late)
+    tracker.step()
+    assert late_future.result()["confirmed-round"] == 20
+    assert algod.pending_info_calls == 601
+
+    # Near the last valid round the transactions are polled until they expire.
+    while len(tracker):
+        tracker.step()
+    assert algod.round == 30
+    assert algod.pending_info_calls == 601 + 400 * 6
+    assert all(future.exception() for future in futures[100:])
+
+
+def test_confirmation_tracker_background_thread():
+    algod = FakeAlgod(round=10)
+
+    with pactsdk.ConfirmationTracker(algod) as tracker:  # type: ignore
+        futures = [tracker.track_group(send_group(algod, i)) for i in range(20)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert not tracker.is_running
+    assert all(result["confirmed-round"] > 10 for result in results)
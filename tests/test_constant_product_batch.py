@@ -0,0 +1,103 @@
+import random
+from typing import Iterable
+
+import pytest
+
+from pactsdk.constant_product_batch import (
+    get_net_amounts_received,
+    get_swap_amounts_deposited,
+    get_swap_gross_amounts_received,
+)
+from pactsdk.constant_product_calculator import (
+    get_swap_amount_deposited,
+    get_swap_gross_amount_received,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def random_values(rng: random.Random, count: int) -> list[int]:
+    # Log-uniform magnitudes, including values beyond the int64 fast path.
+    return [rng.randrange(2 ** rng.randrange(1, 70)) for _ in range(count)]
+
+
+def as_list(array: Iterable[int]) -> list[int]:
+    return [int(value) for value in array]
+
+
+def test_gross_amounts_received_match_scalar():
+    rng = random.Random(1)
+    liq_a = random_values(rng, 5000)
+    liq_b = random_values(rng, 5000)
+    amounts = random_values(rng, 5000)
+    liq_a = [a or 1 for a in liq_a]
+
+    expected = [
+        get_swap_gross_amount_received(a, b, amount)
+        for a, b, amount in zip(liq_a, liq_b, amounts)
+    ]
+    result = get_swap_gross_amounts_received(
+        np.array(liq_a, dtype=object), np.array(liq_b, dtype=object), amounts
+    )
+    assert as_list(result) == expected
+
+    # Typical reserves go through the int64 path with uint64 inputs.
+    liq_a = [rng.randrange(1, 10**16) for _ in range(5000)]
+    liq_b = [rng.randrange(1, 10**16) for _ in range(5000)]
+    amounts = [rng.randrange(10**13) for _ in range(5000)]
+    result = get_swap_gross_amounts_received(
+        np.array(liq_a, dtype=np.uint64), np.array(liq_b, dtype=np.uint64), amounts
+    )
+    assert result.dtype == np.int64
+    assert as_list(result) == [
+        get_swap_gross_amount_received(a, b, amount)
+        for a, b, amount in zip(liq_a, liq_b, amounts)
+    ]
+
+
+def test_amounts_deposited_match_scalar():
+    rng = random.Random(2)
+    liq_a, liq_b, gross = [], [], []
+    for _ in range(10000):
+        a = rng.randrange(1, 2 ** rng.randrange(1, 66))
+        b = rng.randrange(2, 2 ** rng.randrange(2, 66))
+        liq_a.append(a)
+        liq_b.append(b)
+        gross.append(rng.randrange(b))
+
+    result = get_swap_amounts_deposited(
+        np.array(liq_a, dtype=object), np.array(liq_b, dtype=object), gross
+    )
+    assert as_list(result) == [
+        get_swap_amount_deposited(a, b, g) for a, b, g in zip(liq_a, liq_b, gross)
+    ]
+
+    # The exact quotient is 2**50 + 1/16, but it's rounded to a float before the ceiling.
+    assert get_swap_amount_deposited(2**54 + 1, 17, 1) == 2**50
+    assert as_list(get_swap_amounts_deposited([2**54 + 1], [17], [1])) == [2**50]
+
+
+def test_batch_edge_cases():
+    assert as_list(get_swap_gross_amounts_received([0, 5], 100, [10, 0])) == [100, 0]
+    assert as_list(get_swap_amounts_deposited(100, 100, [0, 50, 99])) == [0, 100, 9900]
+
+    with pytest.raises(ZeroDivisionError):
+        get_swap_gross_amounts_received([0], [100], [0])
+    with pytest.raises(ZeroDivisionError):
+        get_swap_amounts_deposited([100], [100], [100])
+
+    huge = get_swap_gross_amounts_received(2**70, 2**80, 2**70)
+    assert huge.dtype == object
+    assert huge[()] == 2**79
+
+
+def test_net_amounts_received():
+    gross = [0, 1, 9_999, 10_000, 123_456_789, 2**62 - 1]
+    fee_bps = [30, 100, 0, 30, 25, 30]
+    expected = [g * (10_000 - f) // 10_000 for g, f in zip(gross, fee_bps)]
+
+    assert as_list(get_net_amounts_received(np.array(gross), fee_bps)) == expected
+    assert (
+        as_list(get_net_amounts_received(np.array(gross, dtype=object), fee_bps))
+        == expected
+    )
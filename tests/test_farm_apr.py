@@ -0,0 +1,71 @@
+import math
+
+import pytest
+
+import pactsdk
+from pactsdk.farming.apr import SECONDS_PER_YEAR, FarmAprEngine
+
+from .farming_utils import make_farm_from_state
+from .pool_utils import make_price_graph_pools
+
+np = pytest.importorskip("numpy")
+
+
+def test_farm_apr_engine():
+    table = pactsdk.PoolTable.from_pools(make_price_graph_pools())
+    engine = FarmAprEngine(table, {5: 1.0})
+
+    farms = [
+        # 100 tokens 7 and 1000 ALGO a year for 10 liquidity tokens of the ALGO/USDC pool.
+        make_farm_from_state(
+            staked_asset_id=11,
+            reward_asset_ids=[7, 0],
+            pending_rewards=[100 * 10**2, 1000 * 10**6],
+            duration=SECONDS_PER_YEAR,
+            total_staked=10 * 10**6,
+        ),
+        make_farm_from_state(
+            staked_asset_id=11,
+            reward_asset_ids=[7],
+            pending_rewards=[100],
+            duration=SECONDS_PER_YEAR // 2,
+            total_staked=0,
+        ),
+        make_farm_from_state(
+            staked_asset_id=999,
+            reward_asset_ids=[7],
+            pending_rewards=[100],
+            duration=100,
+            total_staked=1000,
+        ),
+        make_farm_from_state(
+            staked_asset_id=0, reward_asset_ids=[7], duration=0, total_staked=10**6
+        ),
+        # Half a year left, so the yearly rate is doubled.
+        make_farm_from_state(
+            staked_asset_id=5,
+            reward_asset_ids=[0],
+            pending_rewards=[500 * 10**6],
+            duration=SECONDS_PER_YEAR // 2,
+            total_staked=1000 * 10**6,
+        ),
+    ]
+
+    aprs = engine.get_aprs(farms, round=5)
+    assert aprs[0] == pytest.approx((100 * 6 + 1000 * 0.3) / (10 * 600))
+    assert math.isnan(aprs[1])
+    assert math.isnan(aprs[2])
+    assert aprs[3] == 0
+    assert aprs[4] == pytest.approx(1000 * 0.3 / 1000)
+
+    # The prices are cached for the round.
+    prices = engine.get_prices(round=5)
+    assert prices[11] == pytest.approx(600.0)
+    table.set_reserves(0, 10**12, 6 * 10**11, 10**9)
+    assert engine.get_prices(round=5) is prices
+    assert engine.get_prices(round=6)[0] == pytest.approx(0.6)
+    engine.invalidate()
+    assert engine.get_prices(round=6) is not prices
+
+    assert len(engine.get_aprs([])) == 0
+    assert isinstance(aprs, np.ndarray)
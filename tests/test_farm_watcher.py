@@ -0,0 +1,70 @@
+from pactsdk.farming import Farm, FarmWatcher
+
+from .farming_utils import FarmsAlgod, make_farm_from_state
+
+
+def test_farm_update_state_if_changed():
+    farm = make_farm_from_state(total_staked=100)
+    algod = FarmsAlgod([farm])
+    farm.algod = algod  # type: ignore
+    state = farm.state
+
+    assert not farm.update_state_if_changed(round=5)
+    assert farm.state is state
+    assert farm.round == 5
+
+    algod.set_farm_state(farm, TotalStaked=200)
+    assert farm.update_state_if_changed(round=6)
+    assert farm.state.total_staked == 200
+    assert farm.round == 6
+
+    # The previous round is kept if the new one is unknown.
+    farm.update_state()
+    assert farm.round == 6
+    assert not farm.update_state_if_changed()
+    assert farm.round == 6
+
+
+def test_farm_watcher():
+    farms = [make_farm_from_state(app_id=app_id) for app_id in range(100, 110)]
+    algod = FarmsAlgod(farms)
+    for farm in farms:
+        farm.algod = algod  # type: ignore
+    changed: list[Farm] = []
+    watcher = FarmWatcher(algod, farms, on_change=changed.append)  # type: ignore
+    assert len(watcher) == 10
+
+    # The first round refetches all the farms.
+    assert watcher.step() == 1
+    assert algod.calls["application_info"] == 10
+    assert changed == []
+    assert all(farm.round == 1 for farm in farms)
+
+    # Only the called farms are refetched.
+    algod.set_farm_state(farms[3], TotalStaked=300)
+    algod.set_farm_state(farms[7], NumStakers=7)
+    assert watcher.step() == 2
+    assert algod.calls["block_info"] == 1
+    assert algod.calls["application_info"] == 12
+    assert changed == [farms[3], farms[7]]
+    assert farms[3].state.total_staked == 300
+    assert farms[7].state.num_stakers == 7
+    assert all(farm.round == 2 for farm in farms)
+
+    assert watcher.step() == 3
+    assert algod.calls["application_info"] == 12
+
+    # The skipped rounds are scanned too.
+    algod.set_farm_state(farms[0], TotalStaked=1)
+    algod.round = 6
+    assert watcher.step() == 6
+    assert algod.calls["block_info"] == 2 + 3
+    assert algod.calls["application_info"] == 13
+
+    # Too many skipped rounds refetch everything.
+    watcher.remove(farms[9])
+    algod.round = 50
+    watcher.step()
+    assert algod.calls["application_info"] == 13 + 9
+    assert changed == [farms[3], farms[7], farms[0]]
+    assert farms[9].round == 6
@@ -7,6 +7,7 @@ from algosdk import transaction
 
 import pactsdk
 from pactsdk.asset import ASSETS_CACHE
+from pactsdk.farming.farm_state import RPT_SCALE
 
 from .farming_utils import (
     deploy_farm,
@@ -103,7 +104,7 @@ def test_farming_farm_state():
         claimed_rewards={},
         pending_rewards={},
         next_rewards={},
-        rpt={},
+        rpt_fixed={},
         duration=0,
         next_duration=0,
         num_stakers=0,
@@ -124,7 +125,7 @@ def test_farming_farm_state():
         claimed_rewards={testbed.reward_asset: 0},
         pending_rewards={testbed.reward_asset: 2000},
         next_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0},
+        rpt_fixed={testbed.reward_asset: 0},
         duration=100,
         next_duration=0,
         num_stakers=0,
@@ -146,7 +147,7 @@ def test_farming_farm_state():
         claimed_rewards={testbed.reward_asset: 0},
         pending_rewards={testbed.reward_asset: 2000},
         next_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0},
+        rpt_fixed={testbed.reward_asset: 0},
         duration=100,
         next_duration=0,
         num_stakers=1,
@@ -163,7 +164,7 @@ def test_farming_farm_state():
         staked=1000,
         accrued_rewards={testbed.reward_asset: 0},
         claimed_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0},
+        rpt_fixed={testbed.reward_asset: 0},
     )
 
 
@@ -185,7 +186,7 @@ def test_farming_happy_path():
         staked=1000,
         accrued_rewards={testbed.reward_asset: 0},
         claimed_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0},
+        rpt_fixed={testbed.reward_asset: 0},
     )
     assert testbed.farm.state == pactsdk.FarmState(
         staked_asset=testbed.staked_asset,
@@ -194,7 +195,7 @@ def test_farming_happy_path():
         claimed_rewards={testbed.reward_asset: 0},
         pending_rewards={testbed.reward_asset: 2000},
         next_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0},
+        rpt_fixed={testbed.reward_asset: 0},
         duration=100,
         next_duration=0,
         num_stakers=1,
@@ -218,7 +219,7 @@ def test_farming_happy_path():
         staked=0,
         accrued_rewards={testbed.reward_asset: 219},
         claimed_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0.22},
+        rpt_fixed={testbed.reward_asset: 220 * RPT_SCALE // 1000},
     )
     assert testbed.farm.state == pactsdk.FarmState(
         staked_asset=testbed.staked_asset,
@@ -227,7 +228,7 @@ def test_farming_happy_path():
         claimed_rewards={testbed.reward_asset: 0},
         pending_rewards={testbed.reward_asset: 1780},
         next_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0.22},
+        rpt_fixed={testbed.reward_asset: 220 * RPT_SCALE // 1000},
         duration=89,
         next_duration=0,
         num_stakers=0,
@@ -250,7 +251,7 @@ def test_farming_happy_path():
         staked=0,
         accrued_rewards={testbed.reward_asset: 0},
         claimed_rewards={testbed.reward_asset: 219},
-        rpt={testbed.reward_asset: 0.22},
+        rpt_fixed={testbed.reward_asset: 220 * RPT_SCALE // 1000},
     )
     assert testbed.farm.state == pactsdk.FarmState(
         staked_asset=testbed.staked_asset,
@@ -259,7 +260,7 @@ def test_farming_happy_path():
         claimed_rewards={testbed.reward_asset: 219},
         pending_rewards={testbed.reward_asset: 1780},
         next_rewards={testbed.reward_asset: 0},
-        rpt={testbed.reward_asset: 0.22},
+        rpt_fixed={testbed.reward_asset: 220 * RPT_SCALE // 1000},
         duration=89,
         next_duration=0,
         num_stakers=0,
@@ -645,7 +646,11 @@ def test_farming_multiple_reward_assets():
         staked=100,
         accrued_rewards={reward_1: 100, reward_2: 200, reward_3: 300},
         claimed_rewards={reward_1: 0, reward_2: 0, reward_3: 0},
-        rpt={reward_1: 1.0, reward_2: 2.0, reward_3: 3.0},
+        rpt_fixed={
+            reward_1: RPT_SCALE,
+            reward_2: 2 * RPT_SCALE,
+            reward_3: 3 * RPT_SCALE,
+        },
     )
     state = testbed.farm.state
     assert state.reward_assets == [reward_1, reward_2, reward_3]
@@ -666,7 +671,11 @@ def test_farming_multiple_reward_assets():
         staked=100,
         accrued_rewards={reward_1: 0, reward_2: 0, reward_3: 0},
         claimed_rewards={reward_1: 100, reward_2: 200, reward_3: 300},
-        rpt={reward_1: 1.0, reward_2: 2.0, reward_3: 3.0},
+        rpt_fixed={
+            reward_1: RPT_SCALE,
+            reward_2: 2 * RPT_SCALE,
+            reward_3: 3 * RPT_SCALE,
+        },
     )
     update_farm(testbed.escrow, testbed.user_account)
     state = testbed.farm.state
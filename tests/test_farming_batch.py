@@ -0,0 +1,202 @@
+import dataclasses
+import datetime
+import random
+
+import pytest
+
+from pactsdk.farming.farm_state import FarmUserState, rpt_to_fixed
+from pactsdk.farming.rewards_batch import (
+    estimate_accrued_rewards_batch,
+    project_rewards,
+    simulate_accrued_rewards_batch,
+    stack_user_states,
+)
+from pactsdk.utils import parse_app_state
+
+from .farming_utils import make_farm_from_state, make_farm_local_state
+
+np = pytest.importorskip("numpy")
+
+UPDATED_AT = datetime.datetime(2023, 1, 1)
+
+
+def make_random_farm(rng: random.Random):
+    return make_farm_from_state(
+        reward_asset_ids=[0, 20, 30],
+        pending_rewards=[rng.randrange(10**12) for _ in range(3)],
+        next_rewards=[rng.randrange(10**12) for _ in range(3)],
+        rpt=[rng.randrange(10**6) for _ in range(3)],
+        rpt_frac=[rng.randrange(2**64) for _ in range(3)],
+        duration=rng.choice([0, 100, 3600, 86400]),
+        next_duration=rng.choice([0, 50, 7200]),
+        total_staked=rng.randrange(1, 10**12),
+        updated_at=UPDATED_AT,
+    )
+
+
+def test_simulate_accrued_rewards_batch():
+    rng = random.Random(1)
+    for _ in range(20):
+        farm = make_random_farm(rng)
+        staked = [rng.randrange(10**12) for _ in range(200)] + [2**60 + 1, 0]
+        totals = [amount + rng.randrange(10**12) for amount in staked]
+        totals[-1] = 0
+        at_time = UPDATED_AT + datetime.timedelta(seconds=rng.randrange(-10, 10**5))
+
+        for extrapolate in [False, True]:
+            rewards = simulate_accrued_rewards_batch(
+                farm, at_time, np.array(staked), np.array(totals), extrapolate
+            )
+            for row, (amount, total) in enumerate(zip(staked, totals)):
+                expected = farm.simulate_accrued_rewards(
+                    at_time, amount, total, extrapolate_future_rewards=extrapolate
+                )
+                assert {asset: rewards[asset][row] for asset in rewards} == expected
+
+
+def test_estimate_accrued_rewards_batch():
+    rng = random.Random(2)
+    for _ in range(20):
+        farm = make_random_farm(rng)
+        reward_assets = farm.state.reward_assets
+        user_states = [
+            FarmUserState(
+                escrow_id=0,
+                staked=rng.randrange(farm.state.total_staked),
+                accrued_rewards={
+                    asset: rng.randrange(10**9) for asset in reward_assets
+                },
+                claimed_rewards={},
+                rpt_fixed={
+                    asset: rpt_to_fixed(
+                        rng.choice([0, rng.random() * farm.state.rpt[asset], 10**7])
+                    )
+                    for asset in reward_assets
+                },
+            )
+            for _ in range(200)
+        ]
+        at_time = UPDATED_AT + datetime.timedelta(seconds=rng.randrange(10**5))
+
+        rewards = estimate_accrued_rewards_batch(
+            farm, at_time, *stack_user_states(farm, user_states)
+        )
+        for row, user_state in enumerate(user_states):
+            expected = farm.estimate_accrued_rewards(at_time, user_state)
+            assert {asset: rewards[asset][row] for asset in rewards} == expected
+
+
+def test_project_rewards():
+    rng = random.Random(3)
+    for _ in range(30):
+        farm = make_random_farm(rng)
+        staked = rng.randrange(1, 10**12)
+        times = [
+            UPDATED_AT + datetime.timedelta(seconds=rng.randrange(-10, 2 * 10**4))
+            for _ in range(100)
+        ]
+        timestamps = np.array([time.timestamp() for time in times])
+
+        for extrapolate in [False, True]:
+            for total in [None, staked]:
+                timeline = farm.project_rewards(staked, timestamps, total, extrapolate)
+                assert timeline.shape == (100, 3)
+                for row, at_time in enumerate(times):
+                    expected = farm.simulate_accrued_rewards(
+                        at_time,
+                        staked,
+                        total or farm.state.total_staked + staked,
+                        extrapolate_future_rewards=extrapolate,
+                    )
+                    assert list(timeline[row]) == list(expected.values())
+
+        # Datetimes give the same results as timestamps.
+        assert (
+            project_rewards(farm, staked, times)
+            == farm.project_rewards(staked, timestamps)
+        ).all()
+
+    farm = make_farm_from_state(
+        reward_asset_ids=[0],
+        pending_rewards=[2**62],
+        duration=100,
+        updated_at=UPDATED_AT,
+    )
+    timeline = farm.project_rewards(10, [UPDATED_AT + datetime.timedelta(seconds=50)])
+    assert timeline.tolist() == [[2**61]]
+    assert farm.project_rewards(0, []).shape == (0, 1)
+
+
+def test_estimate_accrued_rewards_exact_rpt():
+    farm = make_farm_from_state(
+        reward_asset_ids=[0],
+        rpt=[10**6 + 1],
+        rpt_frac=[2**63 + 1],
+        updated_at=UPDATED_AT,
+    )
+    local_state = make_farm_local_state(
+        farm, escrow_id=150, staked=10**15 + 1, rpt=[1], rpt_frac=[2**63]
+    )
+    user_state = farm.get_user_state_from_local_state(
+        parse_app_state(local_state["key-value"])
+    )
+    (algo,) = farm.state.reward_assets
+    assert farm.state.rpt_fixed == {algo: (10**6 + 1) * 2**64 + 2**63 + 1}
+    assert user_state.rpt_fixed == {algo: 2**64 + 2**63}
+    assert user_state.rpt == {algo: 1.5}
+
+    # (10^6 + 2^-64) * (10^15 + 1), rounded down. A float loses the last digits.
+    expected = 10**21 + 10**6
+    assert farm.estimate_accrued_rewards(UPDATED_AT, user_state) == {algo: expected}
+    rewards = estimate_accrued_rewards_batch(
+        farm, UPDATED_AT, *stack_user_states(farm, [user_state])
+    )
+    assert rewards[algo].tolist() == [expected]
+
+
+def test_rpt_is_computed_from_rpt_fixed():
+    farm = make_farm_from_state(reward_asset_ids=[0])
+    (algo,) = farm.state.reward_assets
+
+    user_state = FarmUserState(
+        escrow_id=0,
+        staked=0,
+        accrued_rewards={},
+        claimed_rewards={},
+        rpt_fixed={algo: 3 * 2**64 + 2**62},
+    )
+    assert user_state.rpt == {algo: 3.25}
+
+    user_state.rpt_fixed = {algo: 2**63}
+    assert user_state.rpt == {algo: 0.5}
+
+    replaced = dataclasses.replace(user_state, rpt_fixed={algo: 2**64 + 2**63})
+    assert replaced.rpt == {algo: 1.5}
+    assert user_state.rpt == {algo: 0.5}
+
+    with pytest.raises(AttributeError):
+        user_state.rpt = {algo: 1.5}  # type: ignore
+
+    state = dataclasses.replace(farm.state, rpt_fixed={algo: 2**64})
+    assert state.rpt == {algo: 1.0}
+
+
+def test_states_compare_by_exact_rpt():
+    farm = make_farm_from_state(reward_asset_ids=[0], rpt=[1], rpt_frac=[0])
+    (algo,) = farm.state.reward_assets
+
+    # Both rates round to the same float.
+    other = dataclasses.replace(farm.state, rpt_fixed={algo: 2**64 + 1})
+    assert other.rpt == farm.state.rpt
+    assert other != farm.state
+    assert dataclasses.replace(farm.state) == farm.state
+
+    user_state = FarmUserState(
+        escrow_id=0,
+        staked=0,
+        accrued_rewards={},
+        claimed_rewards={},
+        rpt_fixed={algo: 2**64},
+    )
+    assert user_state != dataclasses.replace(user_state, rpt_fixed={algo: 2**64 + 1})
+    assert user_state == dataclasses.replace(user_state)
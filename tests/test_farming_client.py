@@ -0,0 +1,91 @@
+import json
+
+import algosdk
+
+import pactsdk
+from pactsdk.config import get_config
+
+from .farming_utils import FarmsAlgod, make_farm_from_state, make_farm_local_state
+
+
+def test_fetch_farms():
+    farms = [
+        make_farm_from_state(app_id=100, staked_asset_id=10, reward_asset_ids=[0, 20]),
+        make_farm_from_state(app_id=101, staked_asset_id=11, reward_asset_ids=[20]),
+        make_farm_from_state(app_id=102, staked_asset_id=10, reward_asset_ids=[21, 0]),
+    ]
+    algod = FarmsAlgod(farms)
+    client = pactsdk.PactClient(algod).farming  # type: ignore
+
+    fetched = client.fetch_farms([102, 100, 101])
+
+    assert [farm.app_id for farm in fetched] == [102, 100, 101]
+    assert algod.calls["application_info"] == 3
+    # Algo isn't fetched and the shared assets are fetched once.
+    assert algod.calls["asset_info"] == 4
+    assert all(algod.calls[index] == 1 for index in [10, 11, 20, 21])
+
+    farm = fetched[1]
+    assert farm.internal_state == farms[0].internal_state
+    assert farm.staked_asset.decimals == 3
+    assert farm.staked_asset.name == "A10"
+    assert [asset.decimals for asset in farm.state.reward_assets] == [6, 6]
+    assert farm.state.reward_assets[1].name == "A20"
+    assert fetched[0].staked_asset is farm.staked_asset
+
+    # Everything is cached now.
+    client.fetch_farms([101])
+    assert algod.calls["asset_info"] == 4
+    assert client.fetch_farms([]) == []
+
+
+def test_fetch_escrows(tmp_path):
+    farm = make_farm_from_state(app_id=100)
+    other_farm = make_farm_from_state(app_id=200)
+    addresses = [
+        algosdk.account.address_from_private_key(algosdk.account.generate_account()[0])
+        for _ in range(4)
+    ]
+    # The last user participates only in the other farm.
+    accounts = {
+        address: {"apps-local-state": [make_farm_local_state(farm, 1000 + i, 0)]}
+        for i, address in enumerate(addresses[:3])
+    }
+    accounts[addresses[3]] = {
+        "apps-local-state": [make_farm_local_state(other_farm, 2000, 0)]
+    }
+    algod = FarmsAlgod([farm], accounts)
+    farm.algod = algod  # type: ignore
+
+    path = str(tmp_path / "escrows.json")
+    client = pactsdk.PactFarmingClient(
+        algod, get_config("testnet"), pactsdk.EscrowDirectory(path)  # type: ignore
+    )
+
+    escrows = client.fetch_escrows(farm, addresses)
+    assert list(escrows) == addresses
+    assert algod.calls["account_info"] == 4
+    assert algod.calls["application_info"] == 0
+    assert escrows[addresses[3]] is None
+    for i, address in enumerate(addresses[:3]):
+        escrow = escrows[address]
+        assert escrow is not None
+        assert escrow.app_id == 1000 + i
+        assert escrow.user_address == address
+        assert escrow.farm is farm
+        assert escrow.state.master_app == farm.app_id
+
+    # The known escrows are served from the directory, also after a restart.
+    with open(path) as f:
+        assert json.load(f) == {
+            "100": {address: 1000 + i for i, address in enumerate(addresses[:3])}
+        }
+    client.escrow_directory = pactsdk.EscrowDirectory(path)
+    assert len(client.escrow_directory) == 3
+    escrow = client.fetch_escrow_by_address(farm, addresses[1])
+    assert escrow is not None and escrow.app_id == 1001
+    assert algod.calls["account_info"] == 4
+
+    client.escrow_directory.forget(farm.app_id, addresses[1])
+    assert client.fetch_escrows(farm, addresses[1:3])[addresses[1]] == escrow
+    assert algod.calls["account_info"] == 5
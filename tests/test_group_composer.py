@@ -0,0 +1,98 @@
+from typing import cast
+
+import algosdk
+import pytest
+from algosdk import transaction
+
+import pactsdk
+from pactsdk.group_composer import pack_units
+
+from .pool_utils import make_pool_from_state
+from .utils import make_suggested_params
+
+
+def test_pack_units():
+    assert pack_units([2, 2, 2]) == [[0, 1, 2]]
+    assert pack_units([10, 10, 6, 6]) == [[0, 2], [1, 3]]
+    assert pack_units([5, 12, 4, 5]) == [[0, 3], [1, 2]]
+
+    with pytest.raises(pactsdk.PactSdkError, match="more than 16"):
+        pack_units([17])
+
+
+def test_group_composer_chains_swaps():
+    _, address = algosdk.account.generate_account()
+    pool_a = make_pool_from_state(
+        app_id=10, primary_asset_index=0, secondary_asset_index=100
+    )
+    pool_b = make_pool_from_state(
+        app_id=20, primary_asset_index=100, secondary_asset_index=200
+    )
+    pool_c = make_pool_from_state(
+        app_id=30, primary_asset_index=200, secondary_asset_index=300
+    )
+
+    composer = pactsdk.GroupComposer(address, make_suggested_params())
+    first_swap = pool_a.prepare_swap(pool_a.primary_asset, 1000, slippage_pct=1)
+    composer.add(first_swap)
+    second_swap = composer.chain_swap(pool_b, slippage_pct=1)
+    composer.chain_zap(pool_c, slippage_pct=1)
+
+    assert second_swap.asset_deposited.index == 100
+    assert (
+        cast(pactsdk.Swap, second_swap).amount
+        == first_swap.effect.minimum_amount_received
+    )
+
+    groups = composer.build()
+    assert len(groups) == 1
+    txs = groups[0].transactions
+    # swap + swap + zap (swap + add liquidity)
+    assert len(txs) == 2 + 2 + 5
+    assert txs[0].type == "pay"  # ALGO deposit.
+    second_deposit = cast(transaction.AssetTransferTxn, txs[2])
+    assert second_deposit.index == 100
+    assert second_deposit.amount == first_swap.effect.minimum_amount_received
+    assert len({tx.group for tx in txs}) == 1
+
+    assert composer.total_fee == sum(tx.fee for tx in txs)
+    assert composer.total_fee == 2 * (1000 + 2000) + 1000 + 2000 + 2 * 1000 + 3000
+
+
+def test_group_composer_splits_groups():
+    private_key, address = algosdk.account.generate_account()
+    pools = [
+        make_pool_from_state(app_id=10 * i, secondary_asset_index=10 * i + 5)
+        for i in range(1, 10)
+    ]
+
+    operations: list[pactsdk.group_composer.Operation] = [
+        pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1) for pool in pools
+    ]
+    groups = pactsdk.compose_groups(operations, address, make_suggested_params())
+
+    # 18 transactions need two groups.
+    assert [len(group.transactions) for group in groups] == [16, 2]
+    assert groups[0].group_id != groups[1].group_id
+
+    composer = pactsdk.GroupComposer(address, make_suggested_params())
+    for operation in operations:
+        composer.add(operation)
+    signed = composer.sign(private_key)
+    assert [len(group) for group in signed] == [16, 2]
+
+    # Operations added after building are not dropped.
+    composer.add(pools[0].prepare_swap(pools[0].primary_asset, 2000, slippage_pct=1))
+    signed = composer.sign(private_key)
+    assert [len(group) for group in signed] == [16, 4]
+
+
+def test_group_composer_errors():
+    _, address = algosdk.account.generate_account()
+    composer = pactsdk.GroupComposer(address, make_suggested_params())
+
+    with pytest.raises(pactsdk.PactSdkError, match="empty"):
+        composer.build()
+
+    with pytest.raises(pactsdk.PactSdkError, match="no operation"):
+        composer.chain_swap(make_pool_from_state(), slippage_pct=1)
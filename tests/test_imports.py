@@ -0,0 +1,117 @@
+import subprocess
+import sys
+
+import pytest
+
+from pactsdk import gas_station, pool
+from pactsdk.factories import constant_product
+from pactsdk.farming import escrow, farm
+from pactsdk.folks_lending_pool import (
+    ADD_LIQUIDITY_SIG,
+    OPT_IN_SIG,
+    POST_REMOVE_LIQUIDITY_SIG,
+    PRE_ADD_LIQUIDITY_SIG,
+    REMOVE_LIQUIDITY_SIG,
+    SWAP_SIG,
+)
+from pactsdk.utils import get_selector
+
+
+def get_loaded_modules(code: str) -> set[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {code}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    modules = get_loaded_modules("import pactsdk")
+    assert {m for m in modules if m.startswith("pactsdk")} == {"pactsdk"}
+    assert "algosdk" not in modules
+
+    modules = get_loaded_modules("import pactsdk; pactsdk.PactClient")
+    assert "pactsdk.client" in modules
+    for name in [
+        "pactsdk.farming",
+        "pactsdk.factories",
+        "pactsdk.folks_lending_pool",
+        "pactsdk.pool_table",
+        "numpy",
+    ]:
+        assert name not in modules
+
+
+def test_lazy_attributes():
+    import pactsdk
+
+    assert pactsdk.Farm is farm.Farm
+    assert pactsdk.pool.Pool is pactsdk.Pool
+    assert "PactClient" in dir(pactsdk)
+    with pytest.raises(AttributeError):
+        pactsdk.DoesNotExist
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from pactsdk import *", namespace)
+
+    for name in ["PactClient", "Pool", "Asset", "Farm", "PactSdkError", "pool"]:
+        assert name in namespace
+    assert namespace["Pool"] is pool.Pool
+    assert "importlib" not in namespace
+    assert "TYPE_CHECKING" not in namespace
+
+    import pactsdk
+
+    assert dir(pactsdk) == pactsdk.__all__
+
+
+@pytest.mark.parametrize(
+    "selector,signature",
+    [
+        (
+            gas_station.INCREASE_OPCODE_QUOTA_SIG,
+            "increase_opcode_quota(uint64,uint64)void",
+        ),
+        (farm.UPDATE_GLOBAL_STATE_SIG, "update_global_state()void"),
+        (
+            farm.UPDATE_STATE_SIG,
+            "update_state(application,account,account,asset)void",
+        ),
+        (farm.CLAIM_REWARDS_SIG, "claim_rewards(account,uint64[])void"),
+        (farm.ADD_REWARD_ASSET_SIG, "add_reward_asset(asset)void"),
+        (farm.DEPOSIT_REWARDS_SIG, "deposit_rewards(uint64[],uint64)void"),
+        (escrow.CREATE_SIG, "create(application,application,asset)void"),
+        (escrow.UNSTAKE_SIG, "unstake(asset,uint64,application)void"),
+        (escrow.SEND_MESSAGE_SIG, "send_message(account,string)void"),
+        (escrow.WITHDRAW_ALGOS_SIG, "withdraw_algos()void"),
+        (
+            PRE_ADD_LIQUIDITY_SIG,
+            "pre_add_liquidity(txn,txn,asset,asset,asset,asset,application,application,application,application)void",
+        ),
+        (ADD_LIQUIDITY_SIG, "add_liquidity(asset,asset,asset,application,uint64)void"),
+        (
+            REMOVE_LIQUIDITY_SIG,
+            "remove_liquidity(axfer,asset,asset,asset,application)void",
+        ),
+        (
+            POST_REMOVE_LIQUIDITY_SIG,
+            "post_remove_liquidity(asset,asset,asset,asset,application,application,application,uint64,uint64)void",
+        ),
+        (
+            SWAP_SIG,
+            "swap(txn,asset,asset,asset,asset,application,application,application,application,uint64)void",
+        ),
+        (OPT_IN_SIG, "opt_in(uint64[])void"),
+        (constant_product.BUILD_SIG, "build(asset,asset,uint64)uint64"),
+    ],
+)
+def test_precomputed_selectors(selector: bytes, signature: str):
+    assert selector == get_selector(signature)
@@ -0,0 +1,116 @@
+import algosdk
+import pytest
+from algosdk.error import AlgodHTTPError
+
+from pactsdk import gas_station
+from pactsdk.exceptions import PactSdkError
+from pactsdk.farming import EscrowDirectory, OnboardingPipeline
+from pactsdk.gas_station import GasStation
+
+from .fake_algod import FakeAlgod
+from .farming_utils import make_farm_from_state
+
+
+@pytest.fixture
+def fake_gas_station(monkeypatch):
+    station = GasStation(app_id=1)
+    monkeypatch.setattr(gas_station, "_gas_station", station)
+    return station
+
+
+def make_users(count: int, stake_amount: int) -> list[tuple[str, str, int]]:
+    users = []
+    for _ in range(count):
+        private_key, address = algosdk.account.generate_account()
+        users.append((address, private_key, stake_amount))
+    return users
+
+
+def test_onboarding_deploys_and_stakes(fake_gas_station):
+    algod = FakeAlgod(round=10)
+    farm = make_farm_from_state()
+    users = make_users(5, 1_000)
+    directory = EscrowDirectory()
+
+    with OnboardingPipeline(
+        algod, farm, algod.suggested_params(), escrow_directory=directory  # type: ignore
+    ) as onboarding:
+        results = onboarding.onboard(users)
+
+    assert [result.address for result in results] == [user[0] for user in users]
+    assert [result.status for result in results] == ["staked"] * 5
+    escrow_ids = sorted(result.escrow.app_id for result in results)  # type: ignore
+    assert escrow_ids == [1000, 1001, 1002, 1003, 1004]
+    for result in results:
+        assert result.escrow.user_address == result.address  # type: ignore
+        assert directory.get(farm.app_id, result.address) == result.escrow.app_id  # type: ignore
+    # One deploy and one stake group per user.
+    assert len(algod.sent_groups) == 10
+
+
+def test_onboarding_skips_known_escrows(fake_gas_station):
+    algod = FakeAlgod(round=10)
+    farm = make_farm_from_state()
+    known_user, new_user = make_users(2, 1_000)
+    directory = EscrowDirectory()
+    directory.set(farm.app_id, known_user[0], 500)
+
+    with OnboardingPipeline(
+        algod, farm, algod.suggested_params(), escrow_directory=directory  # type: ignore
+    ) as onboarding:
+        known, new = onboarding.onboard([known_user, new_user])
+
+    assert known.status == "staked"
+    assert known.escrow.app_id == 500  # type: ignore
+    assert new.status == "staked"
+    assert new.escrow.app_id == 1000  # type: ignore
+    assert len(algod.sent_groups) == 3
+
+
+def test_onboarding_reports_failures(fake_gas_station):
+    algod = FakeAlgod(round=10)
+    algod.send_errors = [AlgodHTTPError("overspend", 400)]
+    farm = make_farm_from_state()
+    failing_user, deploy_only_user = make_users(2, 0)
+
+    with OnboardingPipeline(
+        algod, farm, algod.suggested_params(), workers=1  # type: ignore
+    ) as onboarding:
+        failed, deployed = onboarding.onboard([failing_user, deploy_only_user])
+
+    assert failed.status == "failed"
+    assert failed.escrow is None
+    assert isinstance(failed.error, AlgodHTTPError)
+    assert deployed.status == "deployed"
+    assert deployed.escrow.app_id == 1000  # type: ignore
+
+
+def test_onboarding_failures_dont_stop_other_users(fake_gas_station):
+    algod = FakeAlgod(round=10)
+    farm = make_farm_from_state()
+    unsigned_user, malformed_user, valid_user = make_users(3, 1_000)
+    unsigned_user = (unsigned_user[0], None, unsigned_user[2])  # type: ignore
+
+    send_raw_transaction = algod.send_raw_transaction
+
+    def send_without_app_index(txn: bytes, **kwargs) -> str:
+        txid = send_raw_transaction(txn, **kwargs)
+        if len(algod.sent_groups) == 1:
+            for info in algod.txs.values():
+                info.pop("application-index", None)
+        return txid
+
+    algod.send_raw_transaction = send_without_app_index  # type: ignore
+
+    with OnboardingPipeline(
+        algod, farm, algod.suggested_params(), workers=1  # type: ignore
+    ) as onboarding:
+        unsigned, malformed, valid = onboarding.onboard(
+            [unsigned_user, malformed_user, valid_user]  # type: ignore
+        )
+
+    assert unsigned.status == "failed"
+    assert isinstance(unsigned.error, PactSdkError)
+    assert malformed.status == "failed"
+    assert isinstance(malformed.error, KeyError)
+    assert valid.status == "staked"
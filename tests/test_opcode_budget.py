@@ -0,0 +1,162 @@
+import datetime
+from typing import Optional, cast
+
+import algosdk
+import algosdk.v2client.algod
+import pytest
+
+from pactsdk.asset import Asset
+from pactsdk.farming.farm_state import FarmState
+from pactsdk.gas_station import GasStation
+from pactsdk.opcode_budget import (
+    OpcodeBudget,
+    get_budget_increase_count,
+    get_farm_update_cost,
+)
+from pactsdk.stableswap_calculator import get_tx_fee
+
+from .utils import make_suggested_params
+
+algod = algosdk.v2client.algod.AlgodClient("", "")
+
+
+def make_farm_state(reward_assets: list[Asset], updated_at: datetime.datetime):
+    return FarmState(
+        staked_asset=Asset(algod=algod, index=1, decimals=6),
+        reward_assets=reward_assets,
+        distributed_rewards={},
+        claimed_rewards={},
+        pending_rewards={},
+        rpt_fixed={},
+        duration=3600,
+        next_duration=0,
+        next_rewards={},
+        num_stakers=0,
+        total_staked=0,
+        updated_at=updated_at,
+        admin="",
+        updater="",
+        version=1,
+    )
+
+
+def test_budget_increase_count():
+    assert get_budget_increase_count(0) == 0
+    assert get_budget_increase_count(1) == 1
+    assert get_budget_increase_count(700) == 1
+    assert get_budget_increase_count(701) == 2
+    assert get_budget_increase_count(1400, available=700) == 1
+    assert get_budget_increase_count(500, available=700) == 0
+
+
+def test_stableswap_tx_fee_unchanged():
+    for iterations in range(0, 100):
+        for margin in (1, 4):
+            inner_tx_count = -(-(iterations * 369) // 700)
+            expected = (2 + margin + inner_tx_count) * 1000
+            assert get_tx_fee(iterations, margin) == expected
+
+
+def test_farm_update_cost():
+    now = datetime.datetime(2023, 1, 10)
+    reward_assets = [Asset(algod=algod, index=i, decimals=6) for i in range(2, 5)]
+
+    state = make_farm_state(reward_assets, now - datetime.timedelta(minutes=10))
+    assert get_farm_update_cost(state, now) == 513 * 3
+
+    state = make_farm_state(reward_assets, now - datetime.timedelta(hours=2))
+    assert get_farm_update_cost(state, now) == 671 * 3
+
+    # More than a day passed, but less than the duration within the day.
+    state = make_farm_state(reward_assets, now - datetime.timedelta(days=2))
+    assert get_farm_update_cost(state, now) == 671 * 3
+
+
+def test_shared_budget_increase():
+    gas_station = GasStation(app_id=123)
+    sp = make_suggested_params()
+    sender = algosdk.account.generate_account()[1]
+
+    # Without the application calls of the operations themselves.
+    budget = OpcodeBudget()
+    for _ in range(3):
+        budget.add(513 * 3, app_calls=0)
+    assert budget.increase_count == 6
+
+    budget = OpcodeBudget()
+    for _ in range(3):
+        budget.add(513 * 3)
+    assert budget.increase_count == 3
+
+    tx = cast(
+        algosdk.transaction.ApplicationCallTxn,
+        gas_station.build_increase_opcode_budget_tx(sender, budget, sp),
+    )
+    assert tx.app_args[1] == (3).to_bytes(8, "big")
+    assert tx.fee == 4000
+
+    assert (
+        gas_station.build_increase_opcode_budget_tx(sender, OpcodeBudget().add(600), sp)
+        is None
+    )
+
+
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_budget_increase_boundaries(n: int):
+    gas_station = GasStation(app_id=123)
+    sp = make_suggested_params()
+    sender = algosdk.account.generate_account()[1]
+
+    # The gas station call covers the first 700 opcodes.
+    budget = OpcodeBudget(opcodes=700 * n)
+    assert budget.needs_increase
+    assert budget.increase_count == n - 1
+    assert OpcodeBudget(opcodes=700 * n + 1).increase_count == n
+
+    # With the operations' own application calls.
+    assert not OpcodeBudget(opcodes=700 * n, available=700 * n).needs_increase
+    assert (
+        gas_station.build_increase_opcode_budget_tx(
+            sender, OpcodeBudget(opcodes=700 * n, available=700 * n), sp
+        )
+        is None
+    )
+    tx = cast(
+        algosdk.transaction.ApplicationCallTxn,
+        gas_station.build_increase_opcode_budget_tx(
+            sender, OpcodeBudget(opcodes=700 * n + 1, available=700 * n), sp
+        ),
+    )
+    assert tx.app_args[1] == (0).to_bytes(8, "big")
+    assert tx.fee == 1000
+
+
+@pytest.mark.parametrize(
+    "reward_assets_count,expected_count",
+    [(1, None), (2, 0), (3, 1), (4, 1), (5, 2), (6, 3), (7, 4)],
+)
+def test_farm_update_budget_increase(
+    reward_assets_count: int, expected_count: Optional[int]
+):
+    gas_station = GasStation(app_id=123)
+    sp = make_suggested_params()
+    sender = algosdk.account.generate_account()[1]
+    now = datetime.datetime(2023, 1, 10)
+    reward_assets = [
+        Asset(algod=algod, index=i, decimals=6)
+        for i in range(2, 2 + reward_assets_count)
+    ]
+    state = make_farm_state(reward_assets, now - datetime.timedelta(minutes=10))
+
+    budget = OpcodeBudget().add(get_farm_update_cost(state, now))
+    tx = gas_station.build_increase_opcode_budget_tx(sender, budget, sp)
+    if expected_count is None:
+        assert tx is None
+        return
+
+    tx = cast(algosdk.transaction.ApplicationCallTxn, tx)
+    assert tx.app_args[1] == expected_count.to_bytes(8, "big")
+    assert tx.fee == (expected_count + 1) * 1000
+    # The budget of the group covers the cost, but not with an inner call to spare.
+    available = (2 + expected_count) * 700
+    assert available >= budget.opcodes > available - 700
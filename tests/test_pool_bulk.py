@@ -0,0 +1,86 @@
+import algosdk
+import pytest
+
+import pactsdk
+
+from .pool_utils import make_pool_from_state
+from .utils import make_suggested_params
+
+ADDRESSES = [algosdk.account.generate_account()[1] for _ in range(3)]
+
+
+def assert_groups_equal(
+    groups: list[pactsdk.TransactionGroup],
+    expected_txs: list[list[algosdk.transaction.Transaction]],
+):
+    assert len(groups) == len(expected_txs)
+    for group, txs in zip(groups, expected_txs):
+        expected_group = pactsdk.TransactionGroup(txs)
+        assert group.group_id == expected_group.group_id
+        assert [tx.dictify() for tx in group.transactions] == [
+            tx.dictify() for tx in expected_group.transactions
+        ]
+
+
+@pytest.mark.parametrize("fee", [0, 10])
+def test_build_swap_txs_bulk(fee: int):
+    pool = make_pool_from_state(total_primary=10**9, total_secondary=10**9)
+    sp = make_suggested_params()
+    sp.flat_fee = False
+    sp.fee = fee
+
+    swaps = [
+        (address, pool.prepare_swap(asset, amount, slippage_pct=1))
+        for address, asset, amount in zip(
+            ADDRESSES,
+            [pool.primary_asset, pool.secondary_asset, pool.primary_asset],
+            [1, 10**6, 10**8],
+        )
+    ]
+    groups = pool.build_swap_txs_bulk(swaps, sp)
+    assert_groups_equal(
+        groups, [pool.build_swap_txs(swap, address, sp) for address, swap in swaps]
+    )
+
+    other_pool = make_pool_from_state(app_id=5)
+    other_swap = other_pool.prepare_swap(other_pool.primary_asset, 10, slippage_pct=1)
+    with pytest.raises(pactsdk.PactSdkError, match="doesn't match"):
+        pool.build_swap_txs_bulk([(ADDRESSES[0], other_swap)], sp)
+
+
+def test_build_liquidity_txs_bulk():
+    pool = make_pool_from_state(total_primary=10**9, total_secondary=10**9)
+    sp = make_suggested_params()
+
+    additions = [
+        (address, pool.prepare_add_liquidity(amount, amount * 2, slippage_pct=1))
+        for address, amount in zip(ADDRESSES, [10**4, 10**6, 10**5])
+    ]
+    groups = pool.build_add_liquidity_txs_bulk(additions, sp)
+    assert_groups_equal(
+        groups,
+        [
+            pool.build_add_liquidity_txs(address, addition, sp)
+            for address, addition in additions
+        ],
+    )
+
+    removals = list(zip(ADDRESSES, [1, 10**3, 10**6]))
+    groups = pool.build_remove_liquidity_txs_bulk(removals, sp)
+    assert_groups_equal(
+        groups,
+        [
+            pool.build_remove_liquidity_txs(address, amount, sp)
+            for address, amount in removals
+        ],
+    )
+
+    assert pool.build_add_liquidity_txs_bulk([], sp) == []
+    assert pool.build_remove_liquidity_txs_bulk([], sp) == []
+
+    other_pool = make_pool_from_state(app_id=999)
+    other_addition = other_pool.prepare_add_liquidity(10**4, 10**4, slippage_pct=1)
+    with pytest.raises(pactsdk.PactSdkError, match="different pool"):
+        pool.build_add_liquidity_txs_bulk(
+            [*additions, (ADDRESSES[0], other_addition)], sp
+        )
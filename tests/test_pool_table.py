@@ -0,0 +1,113 @@
+import pytest
+
+import pactsdk
+
+from .pool_utils import make_pool_from_state, make_price_graph_pools
+
+np = pytest.importorskip("numpy")
+
+STABLESWAP_STATE = dict(
+    contract_name="[SI] PACT AMM",
+    INITIAL_A=80_000,
+    FUTURE_A=80_000,
+    PRECISION=1000,
+)
+
+
+def make_pools() -> list[pactsdk.Pool]:
+    return [
+        make_pool_from_state(
+            app_id=10, total_primary=10**12, total_secondary=3 * 10**9
+        ),
+        make_pool_from_state(
+            app_id=20,
+            secondary_asset_index=5,
+            secondary_decimals=2,
+            total_primary=123_456_789,
+            total_secondary=987_654,
+            fee_bps=100,
+        ),
+        make_pool_from_state(app_id=30, total_primary=0, total_secondary=0),
+        make_pool_from_state(
+            app_id=40,
+            primary_asset_index=2,
+            secondary_asset_index=5,
+            secondary_decimals=2,
+            total_primary=10**9,
+            total_secondary=10**9,
+            **STABLESWAP_STATE,
+        ),
+    ]
+
+
+def test_pool_table_spot_prices_and_quotes_match_pools():
+    pools = make_pools()
+    table = pactsdk.PoolTable.from_pools(pools)
+
+    assert len(table) == 4
+    assert 20 in table
+    assert table.get_row(30) == 2
+
+    primary_prices, secondary_prices = table.spot_prices()
+    for amount in [1, 1_000, 10**9]:
+        received = table.quote_swaps(amount)
+        received_reverse = table.quote_swaps(amount, primary_deposited=False)
+        for row, pool in enumerate(pools):
+            assert primary_prices[row] == pool.state.primary_asset_price
+            assert secondary_prices[row] == pool.state.secondary_asset_price
+            if pool.state.total_primary == 0:
+                assert received[row] == 0
+                continue
+            calculator = pool.calculator
+            assert received[row] == calculator.amount_deposited_to_net_amount_received(
+                pool.primary_asset, amount
+            )
+            assert received_reverse[
+                row
+            ] == calculator.amount_deposited_to_net_amount_received(
+                pool.secondary_asset, amount
+            )
+
+
+def test_pool_table_tvl():
+    table = pactsdk.PoolTable.from_pools(make_pools())
+
+    tvl = table.tvl({0: 0.25, 2: 1.0, 5: 2.0})
+    assert tvl[0] == pytest.approx(10**6 * 0.25 + 3_000)
+    assert tvl[1] == pytest.approx(123.456789 * 0.25 + 9876.54 * 2)
+    assert tvl[2] == 0
+    assert tvl[3] == pytest.approx(1000 + 10**7 * 2)
+
+    assert np.isnan(table.tvl({0: 1.0})).tolist() == [True, True, True, True]
+
+
+def test_pool_table_pool_view():
+    pools = make_pools()
+    table = pactsdk.PoolTable.from_pools(pools)
+
+    for pool in pools:
+        view = table.get_pool(pool.app_id)
+        assert view.pool_type == pool.pool_type
+        assert view.primary_asset == pool.primary_asset
+        assert view.state == pool.state
+
+    table.set_reserves(table.get_row(10), 5, 6, 7)
+    assert table.get_pool(10).state.total_primary == 5
+    assert pools[0].state.total_primary == 10**12
+
+    with pytest.raises(KeyError):
+        table.get_pool(999)
+
+
+def test_pool_table_asset_prices():
+    table = pactsdk.PoolTable.from_pools(make_price_graph_pools())
+
+    prices = table.asset_prices({5: 1.0})
+    assert prices.keys() == {0, 5, 7}
+    assert prices[0] == pytest.approx(0.3)
+    assert prices[7] == pytest.approx(6.0)
+
+    lp_prices = table.liquidity_token_prices(prices)
+    # 600k USD of reserves for 1000 liquidity tokens.
+    assert lp_prices[0] == pytest.approx(600.0)
+    assert np.isnan(lp_prices[3])
@@ -0,0 +1,79 @@
+import dataclasses
+
+import pactsdk
+
+from .pool_utils import make_pool_from_state
+
+
+def test_quote_cache_reuses_swaps_for_the_same_state():
+    pool = make_pool_from_state()
+    cache = pactsdk.QuoteCache()
+    pool.quote_cache = cache
+
+    swap_a = pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1)
+    swap_b = pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1)
+
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert swap_a is not swap_b
+    assert swap_a.effect == swap_b.effect
+    assert swap_b.pool is pool
+
+    # The returned effects are copies, modifying them doesn't affect the cache.
+    swap_b.effect.minimum_amount_received = 0
+    swap_c = pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1)
+    assert swap_c.effect == swap_a.effect
+    assert cache.hits == 2
+
+    # Different parameters are different entries.
+    pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=2)
+    pool.prepare_swap(pool.secondary_asset, 1000, slippage_pct=1)
+    pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1, swap_for_exact=True)
+    assert cache.misses == 4
+    assert len(cache) == 4
+
+
+def test_quote_cache_invalidated_by_state_change():
+    pool = make_pool_from_state()
+    cache = pactsdk.QuoteCache()
+    pool.quote_cache = cache
+
+    old_swap = pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1)
+    old_version = pool.state_version
+
+    pool.internal_state = dataclasses.replace(pool.internal_state, A=200_000)
+    pool.state = pool.parse_internal_state(pool.internal_state)
+    assert pool.state_version != old_version
+
+    new_swap = pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1)
+    assert cache.hits == 0
+    assert new_swap.effect.amount_received < old_swap.effect.amount_received
+
+    # Uncached result is the same as the cached one.
+    pool.quote_cache = None
+    assert pool.prepare_swap(pool.primary_asset, 1000, slippage_pct=1) == new_swap
+
+
+def test_quote_cache_lru_eviction():
+    pool = make_pool_from_state()
+    other_pool = make_pool_from_state(app_id=10)
+    cache = pactsdk.QuoteCache(maxsize=2)
+    pool.quote_cache = cache
+    other_pool.quote_cache = cache
+
+    pool.prepare_swap(pool.primary_asset, 1, slippage_pct=1)
+    pool.prepare_swap(pool.primary_asset, 2, slippage_pct=1)
+    pool.prepare_swap(pool.primary_asset, 1, slippage_pct=1)  # Refreshes first.
+    other_pool.prepare_swap(other_pool.primary_asset, 3, slippage_pct=1)
+    assert len(cache) == 2
+
+    pool.prepare_swap(pool.primary_asset, 1, slippage_pct=1)
+    assert cache.hits == 2
+    pool.prepare_swap(pool.primary_asset, 2, slippage_pct=1)
+    assert cache.misses == 4
+
+    other_pool.prepare_swap(other_pool.primary_asset, 3, slippage_pct=1)
+    cache.invalidate(pool)
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
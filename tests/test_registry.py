@@ -0,0 +1,102 @@
+import pytest
+
+import pactsdk
+from pactsdk.asset import ASSETS_CACHE
+from pactsdk.registry import decode_registry, encode_registry, get_registry_round
+
+from .pool_utils import make_pool_from_state
+from .utils import algod
+
+
+def test_registry_roundtrip(tmp_path):
+    pact = pactsdk.PactClient(algod, track_pools=True)
+
+    pool = make_pool_from_state(app_id=10, secondary_asset_index=5)
+    pool.secondary_asset = pactsdk.Asset(
+        algod=algod, index=5, decimals=6, name="Coin", unit_name="COIN"
+    )
+    stableswap = make_pool_from_state(
+        app_id=20,
+        primary_asset_index=5,
+        secondary_asset_index=7,
+        contract_name="[SI] PACT AMM",
+        INITIAL_A=80_000,
+        FUTURE_A=80_000,
+        PRECISION=1000,
+        ADMIN="admin",
+    )
+    stableswap.primary_asset = pool.secondary_asset
+    pact.pools = {pool.app_id: pool, stableswap.app_id: stableswap}
+
+    path = str(tmp_path / "pools.bin")
+    pact.export_registry(path, round=1234)
+    assert get_registry_round(path) == 1234
+
+    ASSETS_CACHE.clear()
+    new_pact = pactsdk.PactClient(algod, track_pools=True)
+    registry = new_pact.load_registry(path)
+
+    assert registry.round == 1234
+    assert [p.app_id for p in registry.pools] == [10, 20]
+    assert new_pact.pools.keys() == {10, 20}
+
+    restored_pool, restored_stableswap = registry.pools
+    assert restored_pool.internal_state == pool.internal_state
+    assert restored_pool.state == pool.state
+    assert restored_pool.secondary_asset.name == "Coin"
+    assert restored_pool.secondary_asset.unit_name == "COIN"
+    assert restored_pool.pool_type == "CONSTANT_PRODUCT"
+
+    assert restored_stableswap.internal_state == stableswap.internal_state
+    assert restored_stableswap.pool_type == "STABLESWAP"
+
+    # Assets are shared and cached.
+    assert restored_stableswap.primary_asset is restored_pool.secondary_asset
+    assert ASSETS_CACHE[(algod, 5)] is restored_pool.secondary_asset
+
+    # Restored pools are fully functional.
+    swap = restored_pool.prepare_swap(restored_pool.primary_asset, 1000, 1)
+    assert swap.effect == pool.prepare_swap(pool.primary_asset, 1000, 1).effect
+
+
+def test_registry_invalid_data():
+    with pytest.raises(pactsdk.PactSdkError, match="too short"):
+        decode_registry(algod, b"PACT")
+
+    with pytest.raises(pactsdk.PactSdkError, match="bad magic"):
+        decode_registry(algod, b"X" * 100)
+
+    data = bytearray(encode_registry([make_pool_from_state()], round=1))
+    data[7] = 99
+    with pytest.raises(pactsdk.PactSdkError, match="version 99"):
+        decode_registry(algod, bytes(data))
+
+
+def test_registry_export_without_tracking(tmp_path):
+    pact = pactsdk.PactClient(algod)
+    pools = [make_pool_from_state(app_id=10), make_pool_from_state(app_id=20)]
+    path = str(tmp_path / "pools.bin")
+
+    with pytest.raises(pactsdk.PactSdkError, match="doesn't track the pools"):
+        pact.export_registry(path, round=100)
+
+    pact.export_registry(path, round=100, pools=pools)
+    assert get_registry_round(path) == 100
+
+    registry = pact.load_registry(path)
+    assert [pool.round for pool in registry.pools] == [100, 100]
+    assert pact.pools == {}
+
+
+def test_client_tracks_pools_only_if_enabled(monkeypatch):
+    pool = make_pool_from_state(app_id=10)
+    monkeypatch.setattr(pactsdk.client, "fetch_pool_by_id", lambda algod, app_id: pool)
+
+    pact = pactsdk.PactClient(algod)
+    assert pact.fetch_pool_by_id(10) is pool
+    assert pact.pools == {}
+    assert pool.round is None
+
+    pact = pactsdk.PactClient(algod, track_pools=True)
+    pact.fetch_pool_by_id(10)
+    assert pact.pools == {10: pool}
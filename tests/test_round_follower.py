@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from pactsdk.round_follower import RoundFollower
+
+from .fake_algod import FakeAlgod
+
+
+class FailingFollower(RoundFollower):
+    def __init__(self, algod, failures: int):
+        super().__init__(algod, retry_interval=0)
+        self.failures = failures
+        self.rounds: list[int] = []
+        self.handled = threading.Event()
+
+    def on_round(self, round: int):
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("on_round failed")
+        self.rounds.append(round)
+        self.handled.set()
+
+
+def test_round_follower_must_implement_on_round():
+    class Incomplete(RoundFollower):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(FakeAlgod())  # type: ignore
+
+
+def test_round_follower_survives_errors():
+    algod = FakeAlgod(round=10)
+    follower = FailingFollower(algod, failures=2)
+
+    with follower:
+        assert follower.handled.wait(timeout=5)
+        assert follower.is_running
+
+    assert follower.rounds[0] == 12
@@ -0,0 +1,103 @@
+import algosdk
+import pytest
+from algosdk.error import AlgodHTTPError
+
+import pactsdk
+
+from .fake_algod import FakeAlgod
+
+PRIVATE_KEY, ADDRESS = algosdk.account.generate_account()
+
+
+def make_groups(algod: FakeAlgod, count: int) -> list[pactsdk.TransactionGroup]:
+    sp = algod.suggested_params()
+    return [
+        pactsdk.TransactionGroup(
+            [algosdk.transaction.PaymentTxn(ADDRESS, sp, ADDRESS, amount)]
+        )
+        for amount in range(count)
+    ]
+
+
+def test_submission_pipeline_bounded_window():
+    algod = FakeAlgod(round=10)
+    groups = make_groups(algod, 60)
+
+    with pactsdk.SubmissionPipeline(
+        algod, PRIVATE_KEY, max_in_flight=8  # type: ignore
+    ) as pipeline:
+        futures = pipeline.submit_many(groups)
+
+    results = [future.result() for future in futures]
+    assert all(result["confirmed-round"] > 10 for result in results)
+    assert len(algod.sent_groups) == 60
+    assert algod.max_unconfirmed <= 8
+
+
+def test_submission_pipeline_retries_transient_errors():
+    algod = FakeAlgod(round=10)
+    algod.send_errors = [AlgodHTTPError("busy", 503), AlgodHTTPError("busy", 503)]
+    signer = lambda group: group.sign(PRIVATE_KEY)
+    first, second = make_groups(algod, 2)
+
+    with pactsdk.SubmissionPipeline(
+        algod, signer, workers=1, retry_backoff=0  # type: ignore
+    ) as pipeline:
+        first_future = pipeline.submit(first)
+        first_future.result(timeout=5)
+        # Not transient, must not be retried.
+        algod.send_errors = [AlgodHTTPError("overspend", 400)]
+        second_future = pipeline.submit(second)
+
+    assert first_future.result()["confirmed-round"] > 10
+    with pytest.raises(AlgodHTTPError, match="overspend"):
+        second_future.result()
+    assert algod.sent_groups == [[first.transactions[0].get_txid()]]
+
+
+def test_submission_pipeline_gives_up_after_max_retries():
+    algod = FakeAlgod(round=10)
+    algod.send_errors = [AlgodHTTPError("busy", 503)] * 3
+
+    with pactsdk.SubmissionPipeline(
+        algod, PRIVATE_KEY, max_retries=2, retry_backoff=0  # type: ignore
+    ) as pipeline:
+        future = pipeline.submit(make_groups(algod, 1)[0])
+
+    with pytest.raises(AlgodHTTPError, match="busy"):
+        future.result()
+
+
+def test_submission_pipeline_retry_after_accepted_send():
+    algod = FakeAlgod(round=10)
+    # The first attempt reaches the node, but the response is lost.
+    algod.lost_responses = [AlgodHTTPError("gateway timeout", 504)]
+    first, second = make_groups(algod, 2)
+
+    with pactsdk.SubmissionPipeline(
+        algod, PRIVATE_KEY, retry_backoff=0  # type: ignore
+    ) as pipeline:
+        first_future = pipeline.submit(first)
+        first_future.result(timeout=5)
+        # The duplicate check applies to algod responses only.
+        algod.send_errors = [ValueError("already in ledger")]  # type: ignore
+        second_future = pipeline.submit(second)
+
+    assert first_future.result()["confirmed-round"] > 10
+    assert algod.sent_groups == [[first.transactions[0].get_txid()]]
+    with pytest.raises(ValueError):
+        second_future.result()
+
+
+@pytest.mark.parametrize("where", ["pool", "ledger"])
+def test_already_sent_errors(where: str):
+    error = AlgodHTTPError(
+        f"TransactionPool.Remember: transaction already in {where}: TXID", 400
+    )
+    assert pactsdk.submission_pipeline.is_already_sent_error(error)
+    assert not pactsdk.submission_pipeline.is_already_sent_error(
+        OSError(f"transaction already in {where}")
+    )
+    assert not pactsdk.submission_pipeline.is_already_sent_error(
+        AlgodHTTPError("overspend", 400)
+    )
@@ -0,0 +1,53 @@
+import algosdk
+import pytest
+
+import pactsdk
+
+from .pool_utils import make_pool_from_state
+from .utils import make_suggested_params
+
+ADDRESS = algosdk.account.generate_account()[1]
+
+
+@pytest.mark.parametrize("flat_fee", [True, False])
+def test_swap_template_matches_build_swap_txs(flat_fee: bool):
+    pool = make_pool_from_state(total_primary=10**9, total_secondary=10**9)
+    sp = make_suggested_params()
+    sp.flat_fee = flat_fee
+    sp.fee = 1000 if flat_fee else 10
+
+    for asset in [pool.primary_asset, pool.secondary_asset]:
+        template = pool.prepare_swap_template(asset, ADDRESS)
+
+        for amount in [1, 12_345, 10**8]:
+            swap = pool.prepare_swap(asset, amount, slippage_pct=1)
+            expected = pool.build_swap_txs(swap, ADDRESS, sp)
+            txs = template.build_txs_from_swap(swap, sp)
+            assert [tx.dictify() for tx in txs] == [tx.dictify() for tx in expected]
+
+            group = template.build_tx_group_from_swap(swap, sp)
+            expected_group = pactsdk.TransactionGroup(expected)
+            assert group.group_id == expected_group.group_id
+
+        msgpack = template.build_msgpack(
+            swap.effect.amount_deposited,
+            swap.effect.minimum_amount_received,
+            swap.effect.tx_fee,
+            sp,
+        )
+        assert [
+            algosdk.encoding.msgpack_encode(tx) for tx in expected_group.transactions
+        ] == [algosdk.encoding.base64.b64encode(data).decode() for data in msgpack]
+
+
+def test_swap_template_validation():
+    pool = make_pool_from_state()
+    other_pool = make_pool_from_state(app_id=5)
+
+    with pytest.raises(pactsdk.PactSdkError, match="not in the pool"):
+        pool.prepare_swap_template(pactsdk.Asset(pool.algod, 999, 6), ADDRESS)
+
+    template = pool.prepare_swap_template(pool.primary_asset, ADDRESS)
+    swap = other_pool.prepare_swap(other_pool.primary_asset, 1000, slippage_pct=1)
+    with pytest.raises(pactsdk.PactSdkError, match="doesn't match"):
+        template.build_txs_from_swap(swap, make_suggested_params())
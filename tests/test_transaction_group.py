@@ -0,0 +1,82 @@
+import base64
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import algosdk
+import pytest
+
+import pactsdk
+
+from .utils import make_suggested_params
+
+PRIVATE_KEY, ADDRESS = algosdk.account.generate_account()
+
+
+def make_groups(count: int) -> list[pactsdk.TransactionGroup]:
+    sp = make_suggested_params()
+    return [
+        pactsdk.TransactionGroup(
+            [
+                algosdk.transaction.PaymentTxn(ADDRESS, sp, ADDRESS, amount)
+                for amount in range(index, index + 3)
+            ]
+        )
+        for index in range(count)
+    ]
+
+
+def encode_signed(signed_txs: list) -> bytes:
+    return b"".join(
+        base64.b64decode(algosdk.encoding.msgpack_encode(tx)) for tx in signed_txs
+    )
+
+
+def signer(group: pactsdk.TransactionGroup) -> list:
+    return group.sign(PRIVATE_KEY)
+
+
+def test_sign_groups():
+    groups = make_groups(10)
+    expected = [encode_signed(group.sign(PRIVATE_KEY)) for group in groups]
+
+    assert pactsdk.sign_groups(groups, PRIVATE_KEY) == expected
+    assert pactsdk.sign_groups(groups, [signer] * 10) == expected
+
+    with ThreadPoolExecutor(4) as executor:
+        assert pactsdk.sign_groups(groups, PRIVATE_KEY, executor) == expected
+        assert pactsdk.sign_groups(groups, signer, executor) == expected
+
+    with ProcessPoolExecutor(2) as executor:
+        assert pactsdk.sign_groups(groups, signer, executor, chunksize=4) == expected
+
+
+def test_sign_groups_keys_mismatch():
+    with pytest.raises(pactsdk.PactSdkError, match="Got 1 keys for 2"):
+        pactsdk.sign_groups(make_groups(2), [PRIVATE_KEY])
+
+
+def test_group_matches_algosdk():
+    sp = make_suggested_params()
+    other_address = algosdk.account.generate_account()[1]
+    txs = [
+        algosdk.transaction.PaymentTxn(ADDRESS, sp, other_address, 1000),
+        algosdk.transaction.AssetTransferTxn(ADDRESS, sp, other_address, 5, 123),
+        algosdk.transaction.ApplicationNoOpTxn(
+            other_address, sp, 456, app_args=["SWAP", 1], foreign_assets=[0, 123]
+        ),
+    ]
+    expected_txs = algosdk.transaction.assign_group_id(
+        [algosdk.transaction.Transaction.undictify(tx.dictify()) for tx in txs]
+    )
+
+    group = pactsdk.TransactionGroup(txs)
+
+    assert group.group_id_buffer == expected_txs[0].group
+    assert [tx.group for tx in group.transactions] == [group.group_id_buffer] * 3
+    assert group.encoded_transactions == [
+        base64.b64decode(algosdk.encoding.msgpack_encode(tx)) for tx in expected_txs
+    ]
+
+    # The last transaction is signed by a rekeyed account.
+    assert group.sign_to_bytes(PRIVATE_KEY) == encode_signed(
+        [tx.sign(PRIVATE_KEY) for tx in expected_txs]
+    )
@@ -2,10 +2,22 @@ import pytest
 
 import pactsdk
 
-from .pool_utils import add_liquidity, make_fresh_testbed
+from .pool_utils import add_liquidity, make_fresh_testbed, make_pool_from_state
 from .utils import algod, create_asset, new_account, sign_and_send
 
 
+def test_zap_does_not_modify_pool_state():
+    pool = make_pool_from_state(total_primary=100_000, total_secondary=100_000)
+    state = pool.state
+
+    zap = pool.prepare_zap(pool.primary_asset, 10_000, 2)
+
+    assert pool.state is state
+    assert pool.state.total_primary == 100_000
+    assert zap.liquidity_addition.pool.state.total_primary == 104_888
+    assert zap.liquidity_addition.pool.state.total_secondary == 95_355
+
+
 def test_calculate_zap_params():
     testbed = make_fresh_testbed("CONSTANT_PRODUCT")
 
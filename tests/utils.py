@@ -142,6 +142,19 @@ def wait_rounds(rounds: int, account: Account):
         sign_and_send(tx, account)
 
 
+def make_suggested_params(first=1, last=1001) -> transaction.SuggestedParams:
+    """Suggested params for building transactions without touching the network."""
+    return transaction.SuggestedParams(
+        fee=1000,
+        first=first,
+        last=last,
+        gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+        gen="testnet-v1.0",
+        flat_fee=True,
+        min_fee=1000,
+    )
+
+
 def get_last_block():
     status_data = algod.status()
     return status_data["last-round"]